@@ -13,7 +13,13 @@ class Ball():
         update(self, surfaceIn, walls, deltatime)
             Updates the position of the ball and calls the draw function
             
-        draw(self, surfaceIn)
+        step(self, walls, timestep)
+            Updates the position of the ball by one fixed physics step
+            
+        interpolatedPos(self, alpha)
+            Returns a position between the ball's last two positions
+            
+        draw(self, surfaceIn, alpha, offset)
             Draws the ball as a circle on a surface
         
         move(self, walls, deltatime)
@@ -50,6 +56,8 @@ class Ball():
         None
         '''
         self.pos = posIn
+        # the position before the last physics step, used to draw between steps
+        self.previousPos = list(posIn)
         self.color = colorIn
         self.size = sizeIn
         
@@ -69,7 +77,7 @@ class Ball():
         surfaceIn: pygame.Surface()
             The surface the ball will be drawn on.
 
-        walls: List<Wall()> 
+        walls: List<Wall()>, WallIndex() or GridCollider()
             The list of wall the ball can collide with.
 
         deltatime: float  
@@ -85,7 +93,47 @@ class Ball():
         # draw the ball
         self.draw(surfaceIn)
     
-    def draw(self, surfaceIn):
+    def step(self, walls, timestep):
+        '''
+        Updates the ball's position by one fixed physics step
+
+        Remembers the position before the step so the ball can be drawn
+        between its last two positions.
+
+        Parameters
+        ----------
+        walls: List<Wall()>, WallIndex() or GridCollider()
+            The list of walls the ball can collide with.
+
+        timestep: float  
+            The length of a physics step in seconds.
+
+        Returns
+        -------
+        None
+        '''
+        self.previousPos = self.pos.copy()
+        self.move(walls, timestep)
+    
+    def interpolatedPos(self, alpha):
+        '''
+        Finds a position between the ball's last two positions
+
+        Parameters
+        ----------
+        alpha: float
+            How far between its previous and current position the position is.
+            0 gives the previous position and 1 the current position.
+            
+        Returns
+        -------
+        List<float>
+            The position between the last two physics steps
+        '''
+        return [self.previousPos[0] + (self.pos[0] - self.previousPos[0]) * alpha,
+                self.previousPos[1] + (self.pos[1] - self.previousPos[1]) * alpha]
+    
+    def draw(self, surfaceIn, alpha=1, offset=(0, 0)):
         '''
         Draws the Ball Object
 
@@ -96,12 +144,24 @@ class Ball():
         surfaceIn: pygame.Surface()
             The surface that the ball will be drawn onto
             
+        alpha: float
+            How far between its previous and current position the ball is drawn.
+            0 draws it at the previous position and 1 at the current position.
+            
+        offset: List<int>
+            How far the ball is moved to the top left when it is drawn,
+            like the offset of a Camera
+            
         Returns
         -------
-        None
+        pygame.Rect()
+            The area of the surface that was drawn on
         '''
+        # the position between the last two physics steps
+        drawPos = self.interpolatedPos(alpha)
+        
         # draw a circle on the surface
-        pygame.draw.circle(surfaceIn, self.color, self.pos, self.size)
+        return pygame.draw.circle(surfaceIn, self.color, [drawPos[0] - offset[0], drawPos[1] - offset[1]], self.size)
     
     def move(self, walls, deltatime):
         '''
@@ -113,7 +173,7 @@ class Ball():
 
         Parameters
         ----------
-        walls: List<Wall()> 
+        walls: List<Wall()>, WallIndex() or GridCollider()
             The list of walls the ball can collide with.
 
         deltatime: float  
@@ -195,8 +255,9 @@ class Ball():
 
         Parameters
         ----------
-        walls: List<Wall()> 
+        walls: List<Wall()>, WallIndex() or GridCollider()
             The list of walls the ball can collide with.
+            A WallIndex or GridCollider only checks the walls near the ball.
 
         Returns
         -------
@@ -213,6 +274,9 @@ class Ball():
         ValueError
             If no walls are in the walls list
         '''
+        # a WallIndex or GridCollider finds the walls near the ball itself
+        if(not isinstance(walls, list)): return walls.collide(self.pos, self.size)
+        
         result = []
         # raise an error if there are no walls to collide with
         if(len(walls) == 0): raise ValueError('No walls are initialized')
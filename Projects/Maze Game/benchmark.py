@@ -0,0 +1,227 @@
+#-----------------------------------------------------------------------------
+# Maze generation benchmark
+#
+# Measures MazeGenerator.generateMaze, main.makeWalls and
+# wall_mesher.makeMergedWalls for every algorithm
+# over a range of maze sizes. Wall-clock time, peak memory (tracemalloc) and
+# cells per second are printed and written to a JSON file so results from
+# different versions can be compared.
+#
+# Usage:
+#   python benchmark.py
+#   python benchmark.py --sizes 20x12 1000x1000 --algorithms eller kruskal
+#   python benchmark.py --output new.json --compare old.json
+#-----------------------------------------------------------------------------
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy
+from maze_generator import MazeGenerator
+from maze_algorithms import ALGORITHMS
+from wall_mesher import makeMergedWalls
+
+DEFAULTSIZES = ['20x12', '100x100', '316x316', '1000x1000']
+
+def parseSize(sizeText):
+    '''
+    Converts a size like '20x12' into a list
+
+    Parameters
+    ----------
+    sizeText: str
+        The x and y size separated by an x
+
+    Returns
+    -------
+    List<int>
+        [x, y]
+    '''
+    x, y = sizeText.lower().split('x')
+    return [int(x), int(y)]
+
+def measure(function, repeat):
+    '''
+    Times a function and measures its peak memory
+
+    The function is timed repeat times without tracemalloc and then run once
+    more with tracemalloc to find its peak memory.
+
+    Parameters
+    ----------
+    function: function()
+        The function to measure
+
+    repeat: int
+        The number of timed runs
+
+    Returns
+    -------
+    Dictionary<string, float>
+        {'best': seconds, 'mean': seconds, 'peakBytes': bytes}
+    '''
+    times = []
+    for i in range(repeat):
+        startTime = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - startTime)
+
+    tracemalloc.start()
+    function()
+    peakBytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {'best': min(times), 'mean': sum(times) / len(times), 'peakBytes': peakBytes}
+
+def runBenchmarks(sizes, algorithms, repeat, wallsLimit, packed):
+    '''
+    Runs every benchmark
+
+    Parameters
+    ----------
+    sizes: List<List<int>>
+        The maze sizes to measure
+
+    algorithms: List<str>
+        The algorithms to measure
+
+    repeat: int
+        The number of timed runs of each benchmark
+
+    wallsLimit: int
+        makeWalls and makeMergedWalls are only measured for mazes with at most this many cells
+
+    packed: bool
+        Whether the MazeGenerator is in packed mode
+
+    Returns
+    -------
+    List<Dictionary<string, dynamic>>
+        One result for every benchmark
+    '''
+    # importing main does not start the game but does set up pygame
+    import main
+
+    results = []
+    for size in sizes:
+        cellCount = size[0] * size[1]
+        for algorithm in algorithms:
+            generator = MazeGenerator(size, packed, algorithm)
+
+            # GENERATE MAZE
+            stats = measure(generator.generateMaze, repeat)
+            results.append({'benchmark': 'generateMaze', 'algorithm': algorithm, 'size': size,
+                            'cells': cellCount, 'packed': packed, **stats,
+                            'cellsPerSecond': cellCount / stats['best']})
+            printResult(results[-1])
+
+            # MAKE WALLS uses the last generated maze
+            if(cellCount <= wallsLimit):
+                stats = measure(lambda: main.makeWalls(main.mazeStartPoint, generator.maze, main.cellSize, main.WALLCOLOR), repeat)
+                results.append({'benchmark': 'makeWalls', 'algorithm': algorithm, 'size': size,
+                                'cells': cellCount, 'packed': packed, **stats,
+                                'cellsPerSecond': cellCount / stats['best']})
+                printResult(results[-1])
+
+                # MERGED WALLS need the wall masks of a packed maze
+                if(generator.grid is not None):
+                    stats = measure(lambda: makeMergedWalls(main.mazeStartPoint, generator.grid.asArray(), main.cellSize, main.WALLCOLOR), repeat)
+                    results.append({'benchmark': 'mergedWalls', 'algorithm': algorithm, 'size': size,
+                                    'cells': cellCount, 'packed': packed, **stats,
+                                    'cellsPerSecond': cellCount / stats['best']})
+                    printResult(results[-1])
+
+    return results
+
+def printResult(result):
+    '''
+    Prints one result as a line of a table
+
+    Parameters
+    ----------
+    result: Dictionary<string, dynamic>
+        A result made by runBenchmarks
+
+    Returns
+    -------
+    None
+    '''
+    print(f"{result['benchmark']:<13} {result['algorithm']:<21} {result['size'][0]:>6}x{result['size'][1]:<6} "
+          f"best {result['best'] * 1000:>10.2f} ms  mean {result['mean'] * 1000:>10.2f} ms  "
+          f"peak {result['peakBytes'] / 1024:>10.1f} KiB  {result['cellsPerSecond']:>14,.0f} cells/s")
+
+def compareResults(results, previousResults):
+    '''
+    Prints how each result changed from a previous run
+
+    Parameters
+    ----------
+    results: List<Dictionary<string, dynamic>>
+        The new results
+
+    previousResults: List<Dictionary<string, dynamic>>
+        The results of an earlier run
+
+    Returns
+    -------
+    None
+    '''
+    # {(benchmark, algorithm, x, y, packed): result}
+    previous = {(r['benchmark'], r['algorithm'], r['size'][0], r['size'][1], r['packed']): r for r in previousResults}
+
+    print('\nCompared to the previous run (new / old)')
+    for result in results:
+        key = (result['benchmark'], result['algorithm'], result['size'][0], result['size'][1], result['packed'])
+        if(key not in previous): continue
+
+        old = previous[key]
+        print(f"{result['benchmark']:<13} {result['algorithm']:<21} {result['size'][0]:>6}x{result['size'][1]:<6} "
+              f"time {result['best'] / old['best']:>6.2f}x  peak {result['peakBytes'] / max(old['peakBytes'], 1):>6.2f}x")
+
+def main():
+    '''
+    Runs the benchmarks from the command line
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    '''
+    parser = argparse.ArgumentParser(description='Benchmark maze generation and wall creation.')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULTSIZES, help='maze sizes like 20x12')
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs of each benchmark')
+    parser.add_argument('--walls-limit', type=int, default=250000, help='largest maze (in cells) to run makeWalls on')
+    parser.add_argument('--cells', action='store_true', help='use Cell Objects instead of packed mode')
+    parser.add_argument('--output', default='benchmark_results.json', help='the JSON file to write')
+    parser.add_argument('--compare', help='a JSON file from an earlier run to compare against')
+    args = parser.parse_args()
+
+    results = runBenchmarks([parseSize(size) for size in args.sizes], args.algorithms,
+                            max(1, args.repeat), args.walls_limit, not args.cells)
+
+    with open(args.output, 'w') as outputFile:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'numpy': numpy.__version__,
+            'platform': platform.platform(),
+            'results': results
+            }, outputFile, indent=2)
+    print(f'\nResults written to {args.output}')
+
+    if(args.compare):
+        with open(args.compare) as previousFile:
+            compareResults(results, json.load(previousFile)['results'])
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,7 @@ class Button():
     The buttons will allow the user to navagate the menus
     
     FUNCTIONS
-        __init__(self, nextGameStateIn, buttonRectangeIn, buttonColorIn, textIn, textColorIn, fontIn)
+        __init__(self, nextGameStateIn, buttonRectangeIn, buttonColorIn, textIn, textColorIn, fontIn, textCacheIn)
             Creates the button object with initial values.
         
         draw(self, surfaceIn)
@@ -18,7 +18,7 @@ class Button():
             Returns true if the mouse is on the button
         
     '''    
-    def __init__(self, nextGameStateIn, buttonRectangeIn, buttonColorIn, textIn, textColorIn, fontIn):
+    def __init__(self, nextGameStateIn, buttonRectangeIn, buttonColorIn, textIn, textColorIn, fontIn, textCacheIn=None):
         '''
         Initializes a Button Object
 
@@ -45,6 +45,10 @@ class Button():
         fontIn: pygame.Font() 
             The font used to render the text
 
+        textCacheIn: TextCache()
+            A cache of rendered text so the text is not rendered every frame.
+            If None the text is rendered every time the button is drawn.
+
         Returns
         -------
         None
@@ -55,6 +59,7 @@ class Button():
         self.textColor = textColorIn
         self.nextGameState = nextGameStateIn
         self.font = fontIn
+        self.textCache = textCacheIn
         
     def draw(self, surfaceIn):
         '''
@@ -69,17 +74,21 @@ class Button():
             
         Returns
         -------
-        None
+        pygame.Rect()
+            The area of the surface that was drawn on
         '''
         # draw a rounded rectangle for the button
-        pygame.draw.rect(surfaceIn, self.buttonColor, self.buttonRectangle, border_radius = 2)
+        drawnRectangle = pygame.draw.rect(surfaceIn, self.buttonColor, self.buttonRectangle, border_radius = 2)
         
         # render the text of the button
-        buttonText = self.font.render(self.text, 1, self.textColor)
+        if(self.textCache is not None): buttonText = self.textCache.render(self.font, self.text, self.textColor)
+        else: buttonText = self.font.render(self.text, 1, self.textColor)
         
         # blit the text onto surfacein. make it centered on the button rectangle. 
-        surfaceIn.blit(buttonText, (self.buttonRectangle[0] + self.buttonRectangle[2]/2 - buttonText.get_width()/2,
-                                    self.buttonRectangle[1] + self.buttonRectangle[3]/2 - buttonText.get_height()/2))
+        textRectangle = surfaceIn.blit(buttonText, (self.buttonRectangle[0] + self.buttonRectangle[2]/2 - buttonText.get_width()/2,
+                                                    self.buttonRectangle[1] + self.buttonRectangle[3]/2 - buttonText.get_height()/2))
+        
+        return drawnRectangle.union(textRectangle)
         
     def isClicked(self, mousePosition):
         '''
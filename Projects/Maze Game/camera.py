@@ -0,0 +1,256 @@
+from collections import OrderedDict
+import pygame
+from wall_mesher import makeMergedWalls
+
+class Camera():
+    '''
+    Camera
+
+    A view onto part of the maze that follows the player.
+    Positions in the maze are the same as if the whole maze was drawn from its starting point,
+    the camera only changes where they are drawn on the screen.
+
+    FUNCTIONS
+        __init__(self, viewRectIn, worldRectIn)
+            Creates a camera looking at the top left of the maze
+
+        follow(self, targetPos)
+            Centers the view on a position without leaving the maze
+
+        toScreen(self, pos)
+            Returns where a position in the maze is on the screen
+    '''
+    def __init__(self, viewRectIn, worldRectIn):
+        '''
+        Initializes a Camera Object
+
+        Object contains the area of the screen the maze is drawn in,
+        the area the whole maze covers and how far the view has moved.
+
+        Parameters
+        ----------
+        viewRectIn: pygame.Rect()
+            The area of the screen the maze is drawn in
+
+        worldRectIn: pygame.Rect()
+            The area the whole maze would cover if it was drawn from its starting point
+
+        Returns
+        -------
+        None
+        '''
+        self.viewRect = pygame.Rect(viewRectIn)
+        self.worldRect = pygame.Rect(worldRectIn)
+
+        # how far the maze is moved to the top left when it is drawn
+        self.offset = [self.worldRect.left - self.viewRect.left, self.worldRect.top - self.viewRect.top]
+
+    def follow(self, targetPos):
+        '''
+        Centers the view on a position
+
+        The view stops at the edges of the maze. A maze smaller than the view never moves.
+        The view moves in whole pixels so the maze is always drawn sharply.
+
+        Parameters
+        ----------
+        targetPos: List<int>
+            The position in the maze to center on
+
+        Returns
+        -------
+        bool
+            True if the view moved
+        '''
+        offset = []
+        for axis in range(2):
+            viewStart = self.viewRect.topleft[axis]
+            viewLength = self.viewRect.size[axis]
+            worldStart = self.worldRect.topleft[axis]
+            worldLength = self.worldRect.size[axis]
+
+            # the first visible position in the maze, kept inside the maze
+            start = int(round(targetPos[axis] - viewLength / 2))
+            start = max(worldStart, min(start, worldStart + worldLength - viewLength))
+            offset.append(start - viewStart)
+
+        moved = offset != self.offset
+        self.offset = offset
+        return moved
+
+    def toScreen(self, pos):
+        '''
+        Finds where a position in the maze is on the screen
+
+        Parameters
+        ----------
+        pos: List<int>
+            A position in the maze
+            [x, y]
+
+        Returns
+        -------
+        List<int>
+            The position on the screen
+            [x, y]
+        '''
+        return [pos[0] - self.offset[0], pos[1] - self.offset[1]]
+
+class ChunkRenderer():
+    '''
+    ChunkRenderer
+
+    Draws a maze from square chunks that are rendered when they are first seen.
+    The chunks that have not been seen for the longest time are removed when there
+    are too many, so drawing costs depend on the size of the view, not the maze.
+
+    FUNCTIONS
+        __init__(self, wallsIn, startingPosIn, cellSizeIn, backgroundColorIn, wallColorIn, chunkCellsIn, maxChunksIn)
+            Creates a renderer with no chunks
+
+        getChunk(self, chunkPos)
+            Returns the surface of a chunk, rendering it if it is not cached
+
+        draw(self, surfaceIn, camera, areaRect)
+            Draws the chunks that can be seen in part of the view
+    '''
+    def __init__(self, wallsIn, startingPosIn, cellSizeIn, backgroundColorIn, wallColorIn, chunkCellsIn=16, maxChunksIn=32):
+        '''
+        Initializes a ChunkRenderer Object
+
+        Object contains the maze, how it is drawn and the rendered chunks
+        in the order they were used.
+
+        Parameters
+        ----------
+        wallsIn: numpy.ndarray
+            The uint8 wall masks of the maze with the shape (y, x)
+
+        startingPosIn: List<int>
+            The top left corner of the maze
+
+        cellSizeIn: int
+            the pixel size of a cell
+
+        backgroundColorIn: pygame.Color() or (r, g, b)
+            the color behind the walls
+
+        wallColorIn: pygame.Color() or (r, g, b)
+            the color of the walls
+
+        chunkCellsIn: int
+            The number of cells along each side of a chunk
+
+        maxChunksIn: int
+            The most chunks that are kept
+
+        Returns
+        -------
+        None
+        '''
+        self.walls = wallsIn
+        self.startingPos = startingPosIn
+        self.cellSize = cellSizeIn
+        self.backgroundColor = backgroundColorIn
+        self.wallColor = wallColorIn
+        self.chunkCells = chunkCellsIn
+        self.maxChunks = maxChunksIn
+
+        # the pixel size of a whole chunk
+        self.chunkSize = chunkCellsIn * cellSizeIn
+        self.chunkCount = [-(-wallsIn.shape[1] // chunkCellsIn), -(-wallsIn.shape[0] // chunkCellsIn)]
+
+        # {(x, y): pygame.Surface()}, the last entry is the most recently used
+        self.chunks = OrderedDict()
+
+    def __len__(self):
+        return len(self.chunks)
+
+    def getChunk(self, chunkPos):
+        '''
+        Gets the surface of a chunk
+
+        The chunk is rendered and added to the cache if it is not already in it.
+
+        Parameters
+        ----------
+        chunkPos: tuple
+            The x and y position of the chunk
+            (x, y)
+
+        Returns
+        -------
+        pygame.Surface()
+            The background and the walls of the cells in the chunk
+        '''
+        chunk = self.chunks.get(chunkPos)
+        if(chunk is not None):
+            # move the chunk to the most recently used end
+            self.chunks.move_to_end(chunkPos)
+            return chunk
+
+        # the cells in the chunk, chunks on the edge of the maze can be smaller
+        x = chunkPos[0] * self.chunkCells
+        y = chunkPos[1] * self.chunkCells
+        cells = self.walls[y:y + self.chunkCells, x:x + self.chunkCells]
+
+        chunk = pygame.Surface((cells.shape[1] * self.cellSize, cells.shape[0] * self.cellSize))
+        # match the pixel format of the screen so drawing it each frame is fast
+        if(pygame.display.get_surface() is not None): chunk = chunk.convert()
+
+        # every wall lies inside its own cell so the chunk's walls can be made from its cells alone
+        chunk.fill(self.backgroundColor)
+        for wall in makeMergedWalls((0, 0), cells, self.cellSize, self.wallColor):
+            wall.draw(chunk)
+
+        self.chunks[chunkPos] = chunk
+        # remove the least recently used chunks until there are few enough
+        while(len(self.chunks) > self.maxChunks):
+            self.chunks.popitem(last=False)
+
+        return chunk
+
+    def draw(self, surfaceIn, camera, areaRect):
+        '''
+        Draws the chunks that can be seen in part of the view
+
+        Parameters
+        ----------
+        surfaceIn: pygame.Surface()
+            The surface that the maze will be drawn onto
+
+        camera: Camera()
+            The camera looking at the maze
+
+        areaRect: pygame.Rect()
+            The area of the screen to draw. Nothing outside of it is changed.
+
+        Returns
+        -------
+        pygame.Rect()
+            The area of the surface that was drawn on
+        '''
+        areaRect = pygame.Rect(areaRect).clip(camera.viewRect)
+        if(areaRect.width == 0 or areaRect.height == 0): return areaRect
+
+        # the area of the maze that is drawn, in pixels from the maze's top left
+        left = areaRect.left + camera.offset[0] - self.startingPos[0]
+        top = areaRect.top + camera.offset[1] - self.startingPos[1]
+
+        # the range of chunks that cover it
+        firstX = max(int(left // self.chunkSize), 0)
+        firstY = max(int(top // self.chunkSize), 0)
+        lastX = min(int((left + areaRect.width - 1) // self.chunkSize), self.chunkCount[0] - 1)
+        lastY = min(int((top + areaRect.height - 1) // self.chunkSize), self.chunkCount[1] - 1)
+
+        # only draw inside the area
+        previousClip = surfaceIn.get_clip()
+        surfaceIn.set_clip(areaRect)
+
+        for y in range(firstY, lastY + 1):
+            for x in range(firstX, lastX + 1):
+                surfaceIn.blit(self.getChunk((x, y)), camera.toScreen([self.startingPos[0] + x * self.chunkSize,
+                                                                        self.startingPos[1] + y * self.chunkSize]))
+
+        surfaceIn.set_clip(previousClip)
+        return areaRect
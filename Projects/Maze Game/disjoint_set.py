@@ -0,0 +1,95 @@
+from array import array
+
+class DisjointSet():
+    '''
+    DisjointSet
+
+    A union-find over the numbers 0 to size - 1 stored in flat arrays.
+    Uses path compression and union by rank so each operation is close to constant time,
+    and nothing is allocated after it is created.
+
+    FUNCTIONS
+        __init__(self, sizeIn)
+            Creates a disjoint set where every number is in its own set
+
+        find(self, item)
+            Returns the root of the set that contains the item
+
+        union(self, itemA, itemB)
+            Joins the sets of two items
+    '''
+    def __init__(self, sizeIn):
+        '''
+        Initializes a DisjointSet Object
+
+        Object contains the parent of every item and the rank of every root.
+
+        Parameters
+        ----------
+        sizeIn: int
+            The number of items
+
+        Returns
+        -------
+        None
+        '''
+        # every item starts as its own root
+        self.parent = array('l', range(sizeIn))
+
+        # ranks never go above log2(size) so one byte is enough
+        self.rank = bytearray(sizeIn)
+
+    def find(self, item):
+        '''
+        Finds the root of the set that contains an item
+
+        Every item on the way to the root is pointed at its grandparent
+        so later searches are shorter.
+
+        Parameters
+        ----------
+        item: int
+            The item to look for
+
+        Returns
+        -------
+        int
+            The root of the set
+        '''
+        parent = self.parent
+        while(parent[item] != item):
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, itemA, itemB):
+        '''
+        Joins the sets of two items
+
+        The root with the lower rank is attached under the root with the higher rank.
+
+        Parameters
+        ----------
+        itemA: int
+            An item of the first set
+
+        itemB: int
+            An item of the second set
+
+        Returns
+        -------
+        bool
+            True if the sets were joined, False if the items were already in the same set
+        '''
+        rootA = self.find(itemA)
+        rootB = self.find(itemB)
+        if(rootA == rootB): return False
+
+        if(self.rank[rootA] < self.rank[rootB]):
+            rootA, rootB = rootB, rootA
+
+        self.parent[rootB] = rootA
+        if(self.rank[rootA] == self.rank[rootB]):
+            self.rank[rootA] += 1
+
+        return True
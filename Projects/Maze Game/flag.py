@@ -10,7 +10,7 @@ class Flag():
         __init__(self, posIn, sizeIn, colorIn)
             Creates the flag object with position, size, and color values.
         
-        draw(self, surfaceIn)
+        draw(self, surfaceIn, offset)
             Draws the flag as a circle on a surface
             
         isColliding(self, playerPos, playerSize)
@@ -43,7 +43,7 @@ class Flag():
         self.size = sizeIn
         self.color = colorIn
         
-    def draw(self, surfaceIn):
+    def draw(self, surfaceIn, offset=(0, 0)):
         '''
         Draws the flag Object
 
@@ -54,11 +54,16 @@ class Flag():
         surfaceIn: pygame.Surface()
             The surface that the flag will be drawn onto
             
+        offset: List<int>
+            How far the flag is moved to the top left when it is drawn,
+            like the offset of a Camera
+            
         Returns
         -------
-        None
+        pygame.Rect()
+            The area of the surface that was drawn on
         '''
-        pygame.draw.circle(surfaceIn, self.color, self.pos, self.size)
+        return pygame.draw.circle(surfaceIn, self.color, [self.pos[0] - offset[0], self.pos[1] - offset[1]], self.size)
 
     def isColliding(self, playerPos, playerSize):
         '''
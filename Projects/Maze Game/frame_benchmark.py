@@ -0,0 +1,166 @@
+#-----------------------------------------------------------------------------
+# Frame time benchmark
+#
+# Plays the game headless with SDL's dummy video driver and a scripted player
+# for a fixed number of frames, then prints the 50th, 95th and 99th percentile
+# frame times of every game state. Results are written to a JSON file so runs
+# from different versions can be compared.
+#
+# Usage:
+#   python frame_benchmark.py
+#   python frame_benchmark.py --frames 5000 --output new.json --compare old.json
+#-----------------------------------------------------------------------------
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import sys
+import time
+import numpy
+import pygame
+
+# the center of the Start button on the start screen
+STARTBUTTON = (250, 275)
+
+# W, A, S and D
+MOVEKEYS = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d]
+
+def scriptedPlayer(frameNumber):
+    '''
+    Plays the game
+
+    Clicks Start and then presses a new movement key every 40 frames.
+
+    Parameters
+    ----------
+    frameNumber: int
+        The number of frames since the game started
+
+    Returns
+    -------
+    List<pygame.event.Event()>
+        The events of this frame
+    '''
+    events = []
+    if(frameNumber == 1):
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=STARTBUTTON, button=1))
+
+    elif(frameNumber > 1 and frameNumber % 40 == 0):
+        key = MOVEKEYS[(frameNumber // 40) % len(MOVEKEYS)]
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    return events
+
+def summarize(frameTimes):
+    '''
+    Finds the frame time percentiles of every game state
+
+    Parameters
+    ----------
+    frameTimes: Dictionary<string, List<float>>
+        The seconds each frame took for each game state
+
+    Returns
+    -------
+    List<Dictionary<string, dynamic>>
+        One result for every game state
+    '''
+    results = []
+    for state, times in frameTimes.items():
+        times = numpy.asarray(times)
+        p50, p95, p99 = numpy.percentile(times, [50, 95, 99]).tolist()
+        results.append({'state': state, 'frames': len(times), 'mean': float(times.mean()),
+                        'p50': p50, 'p95': p95, 'p99': p99, 'max': float(times.max())})
+    return results
+
+def printResult(result):
+    '''
+    Prints one result as a line of a table
+
+    Parameters
+    ----------
+    result: Dictionary<string, dynamic>
+        A result made by summarize
+
+    Returns
+    -------
+    None
+    '''
+    print(f"{result['state']:<20} {result['frames']:>7} frames  "
+          f"p50 {result['p50'] * 1000:>8.3f} ms  p95 {result['p95'] * 1000:>8.3f} ms  "
+          f"p99 {result['p99'] * 1000:>8.3f} ms  max {result['max'] * 1000:>8.3f} ms")
+
+def compareResults(results, previousResults):
+    '''
+    Prints how each result changed from a previous run
+
+    Parameters
+    ----------
+    results: List<Dictionary<string, dynamic>>
+        The new results
+
+    previousResults: List<Dictionary<string, dynamic>>
+        The results of an earlier run
+
+    Returns
+    -------
+    None
+    '''
+    previous = {r['state']: r for r in previousResults}
+
+    print('\nCompared to the previous run (new / old)')
+    for result in results:
+        if(result['state'] not in previous): continue
+
+        old = previous[result['state']]
+        print(f"{result['state']:<20} p50 {result['p50'] / old['p50']:>6.2f}x  "
+              f"p95 {result['p95'] / old['p95']:>6.2f}x  p99 {result['p99'] / old['p99']:>6.2f}x")
+
+def main():
+    '''
+    Runs the benchmark from the command line
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    '''
+    parser = argparse.ArgumentParser(description='Benchmark frame times of the game without a display.')
+    parser.add_argument('--frames', type=int, default=12000, help='the number of frames to run, 12000 plays a whole game')
+    parser.add_argument('--seed', type=int, default=1, help='the seed of the mazes and positions')
+    parser.add_argument('--output', default='frame_results.json', help='the JSON file to write')
+    parser.add_argument('--compare', help='a JSON file from an earlier run to compare against')
+    args = parser.parse_args()
+
+    # importing main sets up pygame
+    import main as game
+    frameTimes = game.main(headless=True, frameLimit=args.frames, inputScript=scriptedPlayer, seed=args.seed)
+
+    results = summarize(frameTimes)
+    for result in results:
+        printResult(result)
+
+    with open(args.output, 'w') as outputFile:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'frames': args.frames,
+            'seed': args.seed,
+            'results': results
+            }, outputFile, indent=2)
+    print(f'\nResults written to {args.output}')
+
+    if(args.compare):
+        with open(args.compare) as previousFile:
+            compareResults(results, json.load(previousFile)['results'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+from collections import deque
+import cProfile
+import pstats
+import time
+import pygame
+
+class FrameProfiler():
+    '''
+    FrameProfiler
+
+    Times each phase of every frame, like handling events, physics and drawing.
+    The times of the last frames are kept so they can be shown in an overlay,
+    and the next frames can be recorded with cProfile and saved to a file.
+
+    FUNCTIONS
+        __init__(self, historyIn)
+            Creates a profiler with no frames
+
+        startFrame(self)
+            Starts timing a frame
+
+        mark(self, phase)
+            Adds the time since the last mark to a phase
+
+        endFrame(self)
+            Finishes timing a frame and adds it to the history
+
+        averages(self)
+            Returns the average time of each phase
+
+        fps(self)
+            Returns the average frames per second
+
+        captureFrames(self, frameCount, pathIn)
+            Records the next frames with cProfile
+
+        drawOverlay(self, surfaceIn, font, textColor)
+            Draws the frames per second, a frame time graph and the phase times
+    '''
+    def __init__(self, historyIn=240):
+        '''
+        Initializes a FrameProfiler Object
+
+        Object contains the times of the last frames and of each phase in them,
+        and the state of a cProfile capture.
+
+        Parameters
+        ----------
+        historyIn: int
+            The number of frames that are kept
+
+        Returns
+        -------
+        None
+        '''
+        self.history = historyIn
+
+        # the seconds from the start of one frame to the start of the next
+        self.frameIntervals = deque(maxlen=historyIn)
+        # the seconds spent working in each frame, without waiting for the next frame
+        self.frameTimes = deque(maxlen=historyIn)
+        # {phase: deque<seconds>}
+        self.phaseTimes = {}
+
+        self.frameStart = None
+        self.lastMark = None
+        # {phase: seconds} of the current frame
+        self.currentPhases = {}
+
+        # the cProfile capture of the next frames
+        self.profile = None
+        self.captureFramesLeft = 0
+        self.capturePath = None
+
+    def startFrame(self):
+        '''
+        Starts timing a frame
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        now = time.perf_counter()
+        if(self.frameStart is not None): self.frameIntervals.append(now - self.frameStart)
+
+        self.frameStart = now
+        self.lastMark = now
+        self.currentPhases = {}
+
+    def mark(self, phase):
+        '''
+        Adds the time since the last mark to a phase
+
+        Parameters
+        ----------
+        phase: str
+            The name of the phase that just finished
+
+        Returns
+        -------
+        None
+        '''
+        now = time.perf_counter()
+        self.currentPhases[phase] = self.currentPhases.get(phase, 0) + now - self.lastMark
+        self.lastMark = now
+
+    def endFrame(self):
+        '''
+        Finishes timing a frame
+
+        The frame is added to the history and a cProfile capture is saved
+        when its last frame ends.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        self.frameTimes.append(self.lastMark - self.frameStart)
+
+        # phases are kept in the order they were first seen
+        for phase in self.currentPhases:
+            if(phase not in self.phaseTimes): self.phaseTimes[phase] = deque(maxlen=self.history)
+
+        # every known phase gets a time in every frame, 0 if it did not run
+        for phase, times in self.phaseTimes.items():
+            times.append(self.currentPhases.get(phase, 0))
+
+        if(self.profile is not None):
+            self.captureFramesLeft -= 1
+            if(self.captureFramesLeft <= 0):
+                self.profile.disable()
+                self.profile.dump_stats(self.capturePath)
+
+                # print the slowest functions
+                print(f'Profile of the last frames saved to {self.capturePath}')
+                pstats.Stats(self.profile).sort_stats('cumulative').print_stats(15)
+                self.profile = None
+
+    def averages(self):
+        '''
+        Finds the average time of each phase
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Dictionary<string, float>
+            The average seconds of each phase over the kept frames
+        '''
+        return {phase: sum(times) / len(times) for phase, times in self.phaseTimes.items() if len(times) > 0}
+
+    def fps(self):
+        '''
+        Finds the average frames per second
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        float
+            The frames per second over the kept frames, 0 if there are none
+        '''
+        if(len(self.frameIntervals) == 0): return 0
+        return len(self.frameIntervals) / max(sum(self.frameIntervals), 1e-9)
+
+    def captureFrames(self, frameCount=120, pathIn=None):
+        '''
+        Records the next frames with cProfile
+
+        When the frames are over the profile is saved to a file and
+        the slowest functions are printed. Nothing happens if a capture is already running.
+
+        Parameters
+        ----------
+        frameCount: int
+            The number of frames to record
+
+        pathIn: str
+            The file the profile is saved to. If None a name with the time is used.
+
+        Returns
+        -------
+        None
+        '''
+        if(self.profile is not None): return
+
+        self.capturePath = pathIn if pathIn is not None else time.strftime('frames_%Y%m%d_%H%M%S.prof')
+        self.captureFramesLeft = frameCount
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def drawOverlay(self, surfaceIn, font, textColor=(255, 255, 255)):
+        '''
+        Draws the profiler's overlay
+
+        Shows the frames per second, a graph of the last frame times and
+        the average time of each phase on a see-through panel in the top right corner.
+
+        Parameters
+        ----------
+        surfaceIn: pygame.Surface()
+            The surface that the overlay will be drawn onto
+
+        font: pygame.Font()
+            The font of the text. The numbers change every frame so the text is not cached.
+
+        textColor: pygame.Color() or (r, g, b)
+            The color of the text and the graph
+
+        Returns
+        -------
+        pygame.Rect()
+            The area of the surface that was drawn on
+        '''
+        lineHeight = font.get_linesize()
+        averages = self.averages()
+        width = 190
+        graphHeight = 40
+        height = graphHeight + lineHeight * (len(averages) + 1) + 15
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        # the frames shown in the graph and the longest of them
+        frameTimes = list(self.frameTimes)[-(width - 10):]
+        longestFrame = max(frameTimes, default=0)
+
+        # FRAMES PER SECOND
+        panel.blit(font.render(f'FPS: {self.fps():.0f}  max: {longestFrame * 1000:.2f} ms', 1, textColor), (5, 5))
+
+        # FRAME TIME GRAPH
+        # one bar for every frame, the top of the graph is the longest frame
+        graphTop = lineHeight + 8
+        for i, frameTime in enumerate(frameTimes):
+            barHeight = frameTime / max(longestFrame, 1e-9) * graphHeight
+            pygame.draw.line(panel, textColor, (5 + i, graphTop + graphHeight), (5 + i, graphTop + graphHeight - barHeight))
+
+        # PHASE TIMES
+        y = graphTop + graphHeight + 4
+        for phase, seconds in averages.items():
+            panel.blit(font.render(f'{phase}: {seconds * 1000:.2f} ms', 1, textColor), (5, y))
+            y += lineHeight
+
+        return surfaceIn.blit(panel, (surfaceIn.get_width() - width - 5, 5))
@@ -0,0 +1,439 @@
+#-----------------------------------------------------------------------------
+# Game engine
+#
+# The rules of a game: the round timer, the rounds, the score, picking up the
+# flag and placing the player and the flag in each maze. The engine never
+# opens a display or reads pygame events, it is moved forward with
+# step(inputs, dt), so bots, fuzzers and balance simulations can run it
+# as fast as the physics allows. main.py draws the engine's state and turns
+# key presses into its inputs.
+#
+# Usage:
+#   python game_engine.py --games 10 --seed 1
+#-----------------------------------------------------------------------------
+
+import random
+import numpy
+from ball import Ball
+from flag import Flag
+from maze_generator import MazeGenerator
+from maze_prefetcher import MazePrefetcher
+from maze_solver import distanceField
+from grid_collider import GridCollider
+
+# The colors the ball and the flag are drawn with
+BALLCOLOR = (255, 0, 0)
+FLAGCOLOR = (0, 255, 0)
+
+def calculateRandomStartPoint(mazeSize, cellSize, mazeStartPoint, randomSource=random):
+    '''
+    Finds a random position within the maze
+
+    Determines a random position in the maze so that the position in
+    pixels will be in the center of a cell in the maze.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The amount of cells in the maze
+        [x, y]
+
+    cellSize: int
+        the pixel size of each cell
+
+    mazeStartPoint: List<int>
+        The top-left corner of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The random stream used to choose the cell
+
+    Returns
+    -------
+    List<int>
+        A randomly chosen pixel position in the maze
+        [x, y]
+    '''
+    # Return a random 2-d point inside the maze
+    #  The point is centered in a randomly chosen cell
+    return [randomSource.randint(1, mazeSize[0] - 1) * cellSize + cellSize * 0.5 + mazeStartPoint[0],
+            randomSource.randint(1, mazeSize[1] - 1) * cellSize + cellSize * 0.5 + mazeStartPoint[1]]
+
+class GameEngine():
+    '''
+    GameEngine
+
+    Plays a game of rounds in new mazes without drawing anything.
+    The player moves in fixed physics steps, collecting the flag scores points
+    and moves the player and the flag, and each round ends when its timer runs out.
+
+    FUNCTIONS
+        __init__(self, mazeSizeIn, cellSizeIn, mazeStartPointIn, seedIn, buildMazeIn, prefetchIn, ...)
+            Creates an engine with no maze
+
+        buildGridMaze(self, seed)
+            Builds a maze that is collided with straight from its wall masks
+
+        startGame(self)
+            Starts a new game in a new maze
+
+        newMaze(self)
+            Swaps in the next maze
+
+        restartCurrentMaze(self)
+            Moves the player and the flag to new random places in the maze
+
+        step(self, inputs, dt)
+            Moves the game forward and returns what happened
+
+        alpha(self)
+            Returns how far between its last two physics steps the ball should be drawn
+
+        shutdown(self)
+            Stops building mazes in the background
+    '''
+    def __init__(self, mazeSizeIn, cellSizeIn, mazeStartPointIn=(0, 0), seedIn=None, buildMazeIn=None, prefetchIn=False,
+                 timePerRoundIn=30, roundsPerGameIn=3, physicsTimestepIn=1 / 240, maxSubstepsIn=8, algorithmIn='recursiveBacktracker'):
+        '''
+        Initializes a GameEngine Object
+
+        Object contains the rules of the game, the current maze, the ball and the flag,
+        and the random streams of the mazes and positions.
+
+        Parameters
+        ----------
+        mazeSizeIn: List<int>
+            The number of cells in the maze
+            [x, y]
+
+        cellSizeIn: int
+            the pixel size of a cell
+
+        mazeStartPointIn: List<int>
+            The top left corner of the maze
+            [x, y]
+
+        seedIn: int or str
+            The seed of every maze and every position of the player and flag.
+            If None every game is different.
+
+        buildMazeIn: function(seed)
+            Builds a maze and returns the MazeGrid, its walls and what the ball collides with.
+            If None buildGridMaze is used.
+
+        prefetchIn: bool
+            Whether to build the next maze in a background thread while a round is played
+
+        timePerRoundIn: float
+            The seconds in each round
+
+        roundsPerGameIn: int
+            The number of rounds in a game
+
+        physicsTimestepIn: float
+            The seconds in each physics step
+
+        maxSubstepsIn: int
+            The most physics steps in one call to step
+
+        algorithmIn: str
+            The algorithm buildGridMaze generates mazes with
+
+        Returns
+        -------
+        None
+        '''
+        self.mazeSize = mazeSizeIn
+        self.cellSize = cellSizeIn
+        self.mazeStartPoint = mazeStartPointIn
+        self.timePerRound = timePerRoundIn
+        self.roundsPerGame = roundsPerGameIn
+        self.physicsTimestep = physicsTimestepIn
+        self.maxSubsteps = maxSubstepsIn
+        self.algorithm = algorithmIn
+
+        # the seeds of the mazes come from one stream so a seeded game can be replayed
+        self.seed = seedIn
+        self.seedRandom = random.Random(seedIn)
+        self.mazeSeed = None if seedIn is None else self.seedRandom.getrandbits(32)
+        # the random stream used to place the player and the flag
+        self.positionRandom = random.Random()
+
+        self.buildMaze = buildMazeIn if buildMazeIn is not None else self.buildGridMaze
+        # builds the next maze in a background thread while a round is played
+        self.prefetcher = MazePrefetcher(self.buildMaze) if prefetchIn else None
+
+        # the current maze, its walls and what the ball collides with
+        self.grid = None
+        self.walls = []
+        self.collider = None
+
+        self.ball = Ball([mazeStartPointIn[0] + cellSizeIn * 0.5, mazeStartPointIn[1] + cellSizeIn * 0.5], cellSizeIn * 0.25, BALLCOLOR)
+        self.flag = Flag([mazeStartPointIn[0] + cellSizeIn * 0.5, mazeStartPointIn[1] + cellSizeIn * 0.5], 3, FLAGCOLOR)
+        # the flag is placed at least this many steps away from the player
+        self.minimumFlagDistance = 10
+        # the number of steps from the player to the flag
+        self.flagDistance = 0
+
+        self.gameTimer = 0
+        self.roundNumber = 1
+        self.score = 0
+        self.isOver = False
+
+        # time that has passed but has not been simulated yet
+        self.physicsAccumulator = 0
+
+    def buildGridMaze(self, seed=None):
+        '''
+        Builds a maze without changing the current maze
+
+        No Wall Objects are made, the ball collides with the maze's wall masks.
+
+        Parameters
+        ----------
+        seed: int or str
+            The seed of the maze. If None a new random maze is made.
+
+        Returns
+        -------
+        MazeGrid
+            The generated maze
+
+        List<Wall()>
+            An empty list
+
+        GridCollider()
+            What the ball collides with
+        '''
+        generator = MazeGenerator(self.mazeSize, True, self.algorithm)
+        generator.generateMaze(seed=seed)
+        return generator.grid, [], GridCollider(generator.grid, self.mazeStartPoint, self.cellSize)
+
+    def startGame(self):
+        '''
+        Starts a new game
+
+        Swaps in a new maze, places the player and the flag
+        and resets the timer, the round number and the score.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        self.newMaze()
+        self.restartCurrentMaze()
+
+        self.gameTimer = self.timePerRound
+        self.roundNumber = 1
+        self.score = 0
+        self.isOver = False
+        self.physicsAccumulator = 0
+
+    def newMaze(self):
+        '''
+        Swaps in the next maze
+
+        If the engine prefetches, the maze built in the background is taken
+        and the one after it is started. If the game has a seed the player and flag
+        positions in the maze are the same every time it is replayed.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        nextSeed = None if self.seed is None else self.seedRandom.getrandbits(32)
+
+        # replay the same player and flag positions for the same seed
+        if(self.mazeSeed is not None): self.positionRandom.seed(self.mazeSeed)
+
+        # the maze, its walls and its collider are swapped in together
+        if(self.prefetcher is not None):
+            self.grid, self.walls, self.collider = self.prefetcher.take(self.mazeSeed)
+            # start building the next round's maze in the background
+            self.prefetcher.prefetch(nextSeed)
+        else:
+            self.grid, self.walls, self.collider = self.buildMaze(self.mazeSeed)
+
+        self.mazeSeed = nextSeed
+
+    def restartCurrentMaze(self):
+        '''
+        Restarts the maze
+
+        Updates the position of the player and the flag to a new random location in the maze.
+        The flag is always at least minimumFlagDistance steps away from the player
+        along the paths of the maze.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        # put the player in a random location in the maze
+        self.ball.pos = calculateRandomStartPoint(self.mazeSize, self.cellSize, self.mazeStartPoint, self.positionRandom)
+        # the ball jumps so it is not drawn between its old and new positions
+        self.ball.previousPos = self.ball.pos.copy()
+
+        # find how many steps every cell is from the player
+        ballCell = [int((self.ball.pos[0] - self.mazeStartPoint[0]) // self.cellSize),
+                    int((self.ball.pos[1] - self.mazeStartPoint[1]) // self.cellSize)]
+        distances = distanceField(self.grid.asArray(), ballCell)
+
+        # put the flag in a random cell that is far enough away
+        # if no cell is far enough use the furthest cell
+        farCells = numpy.argwhere(distances >= self.minimumFlagDistance)
+        if(len(farCells) == 0): farCells = numpy.argwhere(distances == distances.max())
+        flagY, flagX = farCells[self.positionRandom.randrange(len(farCells))]
+
+        self.flag.pos = [flagX * self.cellSize + self.cellSize * 0.5 + self.mazeStartPoint[0],
+                         flagY * self.cellSize + self.cellSize * 0.5 + self.mazeStartPoint[1]]
+        self.flagDistance = int(distances[flagY, flagX])
+
+    def step(self, inputs, dt):
+        '''
+        Moves the game forward
+
+        The timer counts down, the ball moves in fixed physics steps, and the
+        flag is collected if the ball reaches it. When the timer runs out the next
+        round starts in a new maze, or the game ends after the last round.
+        Nothing happens once the game is over.
+
+        Parameters
+        ----------
+        inputs: string
+            The direction the player is moving in
+            'left', 'right', 'up', 'down' or '' to stand still
+
+        dt: float
+            The seconds that have passed since the last step
+
+        Returns
+        -------
+        List<string>
+            What happened during the step
+            'flag' if the flag was collected, 'round' if a new round started in a new maze,
+            'gameOver' if the last round ended
+
+        Raises
+        -------
+        ValueError
+            If inputs is not 'left', 'right', 'up', 'down' or ''
+        '''
+        events = []
+        if(self.isOver): return events
+
+        # Remove the elapsed time from the timer
+        self.gameTimer -= dt
+
+        # tell the ball object what direction it should move
+        self.ball.setMove(inputs != '', inputs)
+
+        # move the ball in fixed steps
+        # time left over is carried to the next step
+        self.physicsAccumulator += dt
+        substeps = 0
+        while(self.physicsAccumulator >= self.physicsTimestep and substeps < self.maxSubsteps):
+            self.ball.step(self.collider, self.physicsTimestep)
+            self.physicsAccumulator -= self.physicsTimestep
+            substeps += 1
+
+        # if the step was too long drop the time that could not be simulated
+        if(self.physicsAccumulator >= self.physicsTimestep): self.physicsAccumulator = 0
+
+        # If the player has reached the flag
+        if(self.flag.isColliding(self.ball.pos, self.ball.size)):
+            # increase the score
+            # longer paths to the flag and less time used give more points
+            self.score += int(self.flagDistance * 10 * self.gameTimer / self.timePerRound)
+            # randomly place the player, and flag in the maze
+            self.restartCurrentMaze()
+            events.append('flag')
+
+        # if time runs out
+        if(self.gameTimer < 0):
+            # if there are no more rounds left, end the game
+            if(self.roundNumber == self.roundsPerGame):
+                self.isOver = True
+                events.append('gameOver')
+                return events
+
+            # Start a new round with a new maze
+            self.roundNumber += 1
+            self.gameTimer = self.timePerRound
+            self.newMaze()
+            self.restartCurrentMaze()
+            events.append('round')
+
+        return events
+
+    def alpha(self):
+        '''
+        Finds how far between its last two physics steps the ball should be drawn
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        float
+            0 for the previous physics step up to 1 for the current one
+        '''
+        return self.physicsAccumulator / self.physicsTimestep
+
+    def shutdown(self):
+        '''
+        Stops building mazes in the background
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        if(self.prefetcher is not None): self.prefetcher.shutdown()
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Play games with a bot that picks a random direction every half second.')
+    parser.add_argument('--games', type=int, default=10, help='the number of games to play')
+    parser.add_argument('--size', default='20x12', help='the maze size like 20x12')
+    parser.add_argument('--dt', type=float, default=1 / 120, help='the seconds in each step')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    mazeSize = [int(value) for value in args.size.lower().split('x')]
+    engine = GameEngine(mazeSize, 20, seedIn=args.seed)
+    botRandom = random.Random(args.seed)
+
+    steps = 0
+    scores = []
+    startTime = time.perf_counter()
+    for game in range(args.games):
+        engine.startGame()
+        direction = ''
+        while(not engine.isOver):
+            # pick a new direction every half second
+            if(steps % int(0.5 / args.dt) == 0): direction = botRandom.choice(['left', 'right', 'up', 'down', ''])
+            engine.step(direction, args.dt)
+            steps += 1
+        scores.append(engine.score)
+    elapsed = time.perf_counter() - startTime
+
+    print(f'{args.games} games, {steps} steps in {elapsed:.2f} s ({steps / elapsed:,.0f} steps/s)')
+    print(f'Scores: {scores}')
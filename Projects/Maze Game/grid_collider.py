@@ -0,0 +1,150 @@
+from wall import rectCollision
+from maze_grid import TOPWALL, BOTTOMWALL, RIGHTWALL, LEFTWALL
+
+class GridCollider():
+    '''
+    GridCollider
+
+    Collides the player with the walls of a maze straight from its wall masks.
+    No Wall Objects are needed, the wall rectangles of the cells the player
+    overlaps are worked out from the cell's position and the wall thickness.
+
+    FUNCTIONS
+        __init__(self, gridIn, startingPosIn, cellSizeIn)
+            Creates the collider for a maze
+
+        __len__(self)
+            Returns the number of cells in the maze
+
+        findCell(self, pos)
+            Returns the cell that contains a position
+
+        cellWalls(self, cellPos)
+            Returns the wall rectangles of a cell
+
+        collide(self, playerPos, playerSize)
+            Checks the player against the walls of the nearby cells
+    '''
+    def __init__(self, gridIn, startingPosIn, cellSizeIn):
+        '''
+        Initializes a GridCollider Object
+
+        Object contains the maze and the position and size of its cells on the surface.
+
+        Parameters
+        ----------
+        gridIn: MazeGrid() or MappedMazeGrid()
+            The maze the player moves through
+
+        startingPosIn: List<int>
+            The top left corner of the maze
+            [x, y]
+
+        cellSizeIn: int
+            the pixel size of a cell
+
+        Returns
+        -------
+        None
+        '''
+        self.grid = gridIn
+        self.mazeSize = gridIn.mazeSize
+        self.startingPos = startingPosIn
+        self.cellSize = cellSizeIn
+
+        # the walls are the same thickness as the walls made by makeWalls
+        self.thickness = cellSizeIn * 0.1
+
+    def __len__(self):
+        return self.mazeSize[0] * self.mazeSize[1]
+
+    def findCell(self, pos):
+        '''
+        Finds the cell that contains a position
+
+        Positions outside the maze give the closest cell on its edge.
+
+        Parameters
+        ----------
+        pos: List<int>
+            A position on the surface
+            [x, y]
+
+        Returns
+        -------
+        List<int>
+            The x and y position of the cell
+            [x, y]
+        '''
+        x = int((pos[0] - self.startingPos[0]) // self.cellSize)
+        y = int((pos[1] - self.startingPos[1]) // self.cellSize)
+        return [min(max(x, 0), self.mazeSize[0] - 1), min(max(y, 0), self.mazeSize[1] - 1)]
+
+    def cellWalls(self, cellPos):
+        '''
+        Finds the wall rectangles of a cell
+
+        Every wall is a strip along one side of the cell and inside it,
+        in the same place makeWalls would put it.
+
+        Parameters
+        ----------
+        cellPos: List<int>
+            The x and y position of the cell
+            [x, y]
+
+        Returns
+        -------
+        List<List<float>>
+            The rectangle of every wall of the cell in the order left, right, top, bottom
+            [left, top, width, height]
+        '''
+        walls = self.grid.getWalls(cellPos)
+        left = cellPos[0] * self.cellSize + self.startingPos[0]
+        top = cellPos[1] * self.cellSize + self.startingPos[1]
+        far = self.cellSize - self.thickness
+
+        rectangles = []
+        if(walls & LEFTWALL): rectangles.append([left, top, self.thickness, self.cellSize])
+        if(walls & RIGHTWALL): rectangles.append([left + far, top, self.thickness, self.cellSize])
+        if(walls & TOPWALL): rectangles.append([left, top, self.cellSize, self.thickness])
+        if(walls & BOTTOMWALL): rectangles.append([left, top + far, self.cellSize, self.thickness])
+
+        return rectangles
+
+    def collide(self, playerPos, playerSize):
+        '''
+        Determine if the player is colliding with any walls
+
+        Works like Ball.validateMove but only the walls of the cells
+        the player overlaps are checked.
+
+        Parameters
+        ----------
+        playerPos: List<int>
+            The position of the player on the surface
+
+        playerSize: int
+            The radius of the circle that represents the player
+
+        Returns
+        -------
+        bool
+            True if the player is colliding with a wall otherwise False
+
+        List<int>
+            The new position of the player.
+            If the player is colliding with a wall, the position will be adjusted
+            otherwise it will remain the same.
+        '''
+        left, top = self.findCell([playerPos[0] - playerSize - 1, playerPos[1] - playerSize - 1])
+        right, bottom = self.findCell([playerPos[0] + playerSize + 1, playerPos[1] + playerSize + 1])
+
+        # every wall lies inside its own cell so only the overlapped cells can collide
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                for rectangle in self.cellWalls([x, y]):
+                    result = rectCollision(rectangle, playerPos, playerSize)
+                    if(result[0]): return result
+
+        return (False, playerPos)
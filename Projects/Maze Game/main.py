@@ -26,13 +26,20 @@
 #   - Various screens for the Start Menu, Help Menu, Game Screen, and Game Over Screen
 #-----------------------------------------------------------------------------
 
+import os
+import time
 import pygame
-import random
-from ball import Ball
-from flag import Flag
 from wall import Wall
 from button import Button
 from maze_generator import MazeGenerator
+from maze_cache import MazeCache
+from wall_mesher import makeMergedWalls
+from wall_index import WallIndex
+from grid_collider import GridCollider
+from text_cache import TextCache
+from camera import Camera, ChunkRenderer
+from frame_profiler import FrameProfiler
+from game_engine import GameEngine
 
 pygame.init()
 
@@ -47,24 +54,48 @@ GIANTTEXT = pygame.font.SysFont("Arial", 40)
 LARGETEXT = pygame.font.SysFont("Arial", 25)
 SMALLTEXT = pygame.font.SysFont("Arial", 20)
 TINYTEXT = pygame.font.SysFont("Arial", 15)
+# text is rendered once and reused until it is not used for a while
+textCache = TextCache(maxEntriesIn=128)
 
 surfaceSize = 500
 
+# Timing variables
+# the most frames drawn each second, 0 draws frames as fast as possible
+frameRate = 130
+# the ball moves in fixed steps of this many seconds whatever the frame rate is
+physicsTimestep = 1 / 240
+# the most physics steps in one frame so a long frame cannot stall the game
+maxSubsteps = 8
+# only send the parts of the screen that changed to the display
+# instead of the whole screen every frame
+dirtyRendering = True
+# F3 shows how long each part of a frame takes
+# F4 records this many frames with cProfile and saves them to a file
+profileFrames = 120
+
 # Maze variables
 cellSize = 20
+# the maze can be made larger than the view, the view then scrolls to follow the player
 mazeSize = (int(surfaceSize * 0.8 // cellSize), int(surfaceSize * 0.5 // cellSize))
 mazeStartPoint = (surfaceSize*0.1, surfaceSize*0.3)
-mazeWalls = []
-mazeGenerator = MazeGenerator(mazeSize)
-
-# Player variables
-ballStartPoint = [mazeStartPoint[0] + cellSize*0.5, mazeStartPoint[1] + cellSize*0.5]
-ball = Ball(ballStartPoint, cellSize * 0.25, pygame.Color('red'))
-
-# Flag variables 
-flagStartPoint = [random.randint(1, mazeSize[0]) * cellSize + cellSize * 0.5 + mazeStartPoint[0],
-                  random.randint(1, mazeSize[1]) * cellSize + cellSize * 0.5 + mazeStartPoint[1]]
-flag = Flag(flagStartPoint, 3, pygame.Color('green'))
+# the most space the maze can take up on the screen
+mazeViewSize = (surfaceSize * 0.8, surfaceSize * 0.5)
+# what the ball collides with, made from the walls or straight from the maze
+# 'walls': the walls sorted by cell so the ball only checks the walls near it
+# 'grid': the wall masks of the maze so no Wall Objects are needed for collisions
+collisionMode = 'walls'
+# draws the current maze from chunks that are rendered once and reused
+mazeChunks = None
+# the part of the maze that can be seen, made for each maze from its size
+camera = None
+# mazes generated from a seed are cached so a repeated seed is instant
+mazeCache = MazeCache(maxEntriesIn=32, maxBytesIn=16 * 1024 * 1024)
+# the algorithm of new mazes is mazeGenerator.algorithm
+mazeGenerator = MazeGenerator(mazeSize, True, cacheIn=mazeCache)
+
+# Round variables
+timePerRound = 30
+roundsPerGame = 3
 
 def writeText(surface, text, textPos, font, textColor):
     '''
@@ -93,13 +124,14 @@ def writeText(surface, text, textPos, font, textColor):
         
     Returns
     -------
-    None
+    pygame.Rect()
+        The area of the surface that was drawn on
     '''
-    # Render the text onto a surface
-    textSurface = font.render(text, 1, textColor)
+    # Render the text onto a surface, or reuse it if it was rendered before
+    textSurface = textCache.render(font, text, textColor)
     
     # blit the surface onto surfaceIn at the given position
-    surface.blit(textSurface, textPos)
+    return surface.blit(textSurface, textPos)
     
 def writeTextCentered(surfaceIn, text, textCenter, font, textColor):
     '''
@@ -129,84 +161,99 @@ def writeTextCentered(surfaceIn, text, textCenter, font, textColor):
         
     Returns
     -------
-    None
+    pygame.Rect()
+        The area of the surface that was drawn on
     '''
-    # Render the text onto a surface
-    textSurface = font.render(text, 1, textColor)
+    # Render the text onto a surface, or reuse it if it was rendered before
+    textSurface = textCache.render(font, text, textColor)
     
     # blit the surface onto surfaceIn using
     #  the given position as a center
-    surfaceIn.blit(textSurface, (textCenter[0] - textSurface.get_width()/2,
-                                 textCenter[1] - textSurface.get_height()/2))
+    return surfaceIn.blit(textSurface, (textCenter[0] - textSurface.get_width()/2,
+                                        textCenter[1] - textSurface.get_height()/2))
 
-def calculateRandomStartPoint(mazeSize, cellSize, mazeStartPoint):
+def buildMaze(seed=None):
     '''
-    Finds a random position within the maze
+    Builds a maze without changing the current maze
 
-    Determines a random position in the maze so that the position in
-    pixels will be in the center of a cell in the maze.
+    Generates a maze with its own MazeGenerator and the collider the ball uses.
+    In the walls collision mode the wall objects are created for it. Shared walls
+    and walls in a line are merged so there are as few walls as possible.
+    Nothing used by the frame loop is changed so it can run in a background thread.
 
     Parameters
     ----------
-    mazeSize: List<int>
-        The amount of cells in the maze
-        [x, y]
-        
-    cellSize: int
-        the pixel size of each cell
-        
-    mazeStartPoint: List<int>
-        The top-left corner of the maze
-        [x, y]
+    seed: int or str
+        The seed of the maze. If None a new random maze is made.
         
     Returns
     -------
-    List<int>
-        A randomly chosen pixel position in the maze
-        [x, y]
+    MazeGrid
+        The generated maze
+    
+    List<Wall()>
+        The walls that make up the maze, empty in the grid collision mode
+    
+    WallIndex() or GridCollider()
+        What the ball collides with
     '''
-    # Return a random 2-d point inside the maze
-    #  The point is centered in a randomly chosen cell
-    return [random.randint(1, mazeSize[0] - 1) * cellSize + cellSize * 0.5 + mazeStartPoint[0],
-            random.randint(1, mazeSize[1] - 1) * cellSize + cellSize * 0.5 + mazeStartPoint[1]]
+    generator = MazeGenerator(mazeSize, True, mazeGenerator.algorithm, cacheIn=mazeCache)
+    generator.generateMaze(seed=seed)
+    
+    # the walls are only needed to collide with, the maze is drawn from its chunks
+    if(collisionMode == 'grid'):
+        walls = []
+        collider = GridCollider(generator.grid, mazeStartPoint, cellSize)
+    else:
+        walls = makeMergedWalls(mazeStartPoint, generator.grid.asArray(), cellSize, WALLCOLOR)
+        collider = WallIndex(walls, mazeStartPoint, cellSize, mazeSize)
+    
+    return generator.grid, walls, collider
 
-def initializeNewMaze():
+def restoreArea(surface, rect):
     '''
-    Initializes a new maze
+    Draws the background and the maze over part of the screen
 
-    Creates a new randomly generated maze and creates the wall objects that will make up the maze.
+    Covers up whatever was drawn there, like the player or text.
 
     Parameters
     ----------
-    None
+    surface: pygame.Surface()
+        The surface that will be drawn onto
+        
+    rect: pygame.Rect()
+        The area of the surface to draw
         
     Returns
     -------
     None
     '''
-    global mazeWalls
-    # Generate a new maze
-    mazeGenerator.generateMaze()
-    # Create wall objects
-    mazeWalls = makeWalls(mazeStartPoint, mazeGenerator.maze, cellSize, WALLCOLOR)
+    surface.fill(BACKGROUNDCOLOR, rect)
+    # only the part of the area that is in the view has maze in it
+    mazeChunks.draw(surface, camera, rect)
 
-def restartCurrentMaze():
+def initializeMazeChunks(grid):
     '''
-    Restarts the maze
+    Starts drawing a new maze
 
-    Updates the position of the player and the flag to a new random location in the maze.
+    The camera is made to fit the maze's size, so a maze larger than the view scrolls.
+    The maze's chunks are rendered the first time they are seen and reused for the whole round.
 
     Parameters
     ----------
-    None
+    grid: MazeGrid
+        The maze to draw
         
     Returns
     -------
     None
     '''
-    # put the player and the flag in a random location in the maze
-    ball.pos = calculateRandomStartPoint(mazeSize, cellSize, mazeStartPoint)
-    flag.pos = calculateRandomStartPoint(mazeSize, cellSize, mazeStartPoint)
+    global mazeChunks, camera
+    # the view is never larger than the maze
+    mazeWidth, mazeHeight = grid.mazeSize[0] * cellSize, grid.mazeSize[1] * cellSize
+    camera = Camera(pygame.Rect(mazeStartPoint, (min(mazeWidth, mazeViewSize[0]), min(mazeHeight, mazeViewSize[1]))),
+                    pygame.Rect(mazeStartPoint, (mazeWidth, mazeHeight)))
+    mazeChunks = ChunkRenderer(grid.asArray(), mazeStartPoint, cellSize, BACKGROUNDCOLOR, WALLCOLOR)
 
 def makeWalls(startingPos, maze, cellSize, wallColor):
     '''
@@ -306,47 +353,100 @@ def addButtonColumn(buttonsToAdd, buttonInfo):
                    BUTTONCOLOR,
                    button[1],
                    TEXTCOLOR,
-                   buttonInfo['font'])
+                   buttonInfo['font'],
+                   textCache)
             )
     return buttons
 
-def main():
+def main(headless=False, frameLimit=None, inputScript=None, seed=None):
     '''
     Main loop of the game
 
-    Runs the game. Controls the initialization and display of different screens,
-    events, the scoring system, and the timing system.
+    Runs the game. Controls the initialization and display of different screens
+    and events. The rules of the game, like the timer and the score, are played
+    by a GameEngine and this loop draws it and gives it the player's input.
+    
+    In headless mode nothing is shown on a display, every frame takes the same
+    amount of game time and the time each frame takes to run is recorded
+    for the game state it ran in.
 
     Parameters
     ----------
-    None
+    headless: bool
+        Whether to run without a display
+        
+    frameLimit: int
+        The game quits after this many frames. If None it runs until it is quit.
+        
+    inputScript: function(frameNumber)
+        Returns a list of pygame events to add before each frame, like clicks and key presses.
+        If None only real events are used.
+        
+    seed: int or str
+        The seed of every maze and every position of the player and flag.
+        If None every game is different.
         
     Returns
     -------
-    None
+    Dictionary<string, List<float>>
+        The seconds each frame took to run for each game state, empty unless headless
     '''
+    # the dummy video driver draws to memory instead of a window
+    if(headless):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.display.quit()
+        pygame.display.init()
+    
     clock = pygame.time.Clock()
     mainSurface = pygame.display.set_mode((surfaceSize, surfaceSize))
-  
-    isWPressed, isAPressed, isSPressed, isDPressed = False, False, False, False
     
-    gameTimer = 0
-    timePerRound = 30
+    # {gameState: [seconds]}
+    frameTimes = {}
+    frameNumber = 0
     
-    roundNumber = 1
-    roundsPerGame = 3
+    # times each part of every frame
+    frameProfiler = FrameProfiler()
+    showProfiler = False
     
-    score = 0
+    # plays the rounds, the timer and the score
+    # the next maze is built in the background while a round is played
+    engine = GameEngine(mazeSize, cellSize, mazeStartPoint, seedIn=seed, buildMazeIn=buildMaze, prefetchIn=True,
+                        timePerRoundIn=timePerRound, roundsPerGameIn=roundsPerGame,
+                        physicsTimestepIn=physicsTimestep, maxSubstepsIn=maxSubsteps)
+  
+    isWPressed, isAPressed, isSPressed, isDPressed = False, False, False, False
     
     buttons = []
     
+    # the parts of the screen that changed this frame
+    dirtyRects = []
+    # the areas of the objects drawn over the maze last frame
+    previousRects = []
+    # True when the whole screen needs to be drawn
+    redrawScreen = True
+    # True when the window was uncovered or restored and lost what was on it
+    screenExposed = False
+    
     gameState = 'initializeStart'
     
     play = True
     while play:
         
         # time between frames in seconds
-        deltatime = clock.tick(130)/1000
+        # a headless game is not slowed down and every frame is the same length
+        if(headless):
+            clock.tick()
+            deltatime = 1 / (frameRate if frameRate > 0 else 130)
+        else: deltatime = clock.tick(frameRate)/1000
+        
+        frameStart = time.perf_counter()
+        frameState = gameState
+        frameProfiler.startFrame()
+        
+        # add the scripted events for this frame
+        if(inputScript is not None):
+            for event in inputScript(frameNumber):
+                pygame.event.post(event)
         
         # all events that are currently triggered
         events = pygame.event.get()
@@ -356,6 +456,27 @@ def main():
             if event.type == pygame.QUIT:
                 play = False
                 
+            # if F3 is pressed show or hide the profiler
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                showProfiler = not showProfiler
+                redrawScreen = True
+                
+            # if F4 is pressed record the next frames with cProfile
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                frameProfiler.captureFrames(profileFrames)
+                
+            # if the window was uncovered or restored the whole screen is drawn and sent again
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWRESTORED):
+                redrawScreen = True
+                screenExposed = True
+        
+        # without dirty rendering every screen is drawn every frame
+        # the profiler changes every frame and covers the other screens so they are redrawn too
+        dirtyRects.clear()
+        if(not dirtyRendering or showProfiler): redrawScreen = True
+        
+        frameProfiler.mark('events')
+                
         if(gameState == 'initializeStart'):
             
             # Create a column of buttons for the start screen
@@ -380,6 +501,7 @@ def main():
             
             # switch to the start screen
             gameState = 'start'
+            redrawScreen = True
             
         if(gameState == 'start'):
             # if the mouse button is clicked
@@ -389,15 +511,20 @@ def main():
                     # Check if any of the buttons were clicked
                     for button in buttons:
                         # if they were clicked switch to their associated game state
-                        if(button.isClicked(pygame.mouse.get_pos())): gameState = button.nextGameState
+                        if(button.isClicked(event.pos)): gameState = button.nextGameState
             
-            mainSurface.fill(BACKGROUNDCOLOR)
-            
-            # Draw a title and the buttons
-            writeText(mainSurface, "THE MOST A-MAZE-ING GAME EVER", (30, 100), LARGETEXT, TEXTCOLOR)
-            
-            for button in buttons:
-                button.draw(mainSurface)
+            # the start screen does not change so it is only drawn when it is opened
+            if(redrawScreen):
+                mainSurface.fill(BACKGROUNDCOLOR)
+                
+                # Draw a title and the buttons
+                writeText(mainSurface, "THE MOST A-MAZE-ING GAME EVER", (30, 100), LARGETEXT, TEXTCOLOR)
+                
+                for button in buttons:
+                    button.draw(mainSurface)
+                
+                dirtyRects.append(mainSurface.get_rect())
+                redrawScreen = False
 
         elif(gameState == 'initializeHelp'):
             # Create a column of buttons for the start screen
@@ -421,6 +548,7 @@ def main():
             
             # switch to the help screen
             gameState = 'help'
+            redrawScreen = True
             
         elif(gameState == 'help'):
             # if the mouse button is clicked
@@ -430,20 +558,25 @@ def main():
                     # Check if any of the buttons were clicked
                     for button in buttons:
                         # if they were clicked switch to their associated game state
-                        if(button.isClicked(pygame.mouse.get_pos())): gameState = button.nextGameState
-            
-            mainSurface.fill(BACKGROUNDCOLOR)
+                        if(button.isClicked(event.pos)): gameState = button.nextGameState
             
-            # Draw instuctions for the player 
-            writeText(mainSurface, "Use WASD to navigate the maze", (30, 50), LARGETEXT, TEXTCOLOR)
-            writeText(mainSurface, "Collect the Green Circle to gain points", (30, 80), LARGETEXT, TEXTCOLOR)
-            writeText(mainSurface, "When time runs out you will be ", (30, 110), LARGETEXT, TEXTCOLOR)
-            writeText(mainSurface, "given a new maze", (40, 140), LARGETEXT, TEXTCOLOR)
-            writeText(mainSurface, f"After {roundsPerGame} rounds are over the game ends", (30, 170), LARGETEXT, TEXTCOLOR)
-            
-            # Draw the buttons
-            for button in buttons:
-                button.draw(mainSurface)
+            # the help screen does not change so it is only drawn when it is opened
+            if(redrawScreen):
+                mainSurface.fill(BACKGROUNDCOLOR)
+                
+                # Draw instuctions for the player 
+                writeText(mainSurface, "Use WASD to navigate the maze", (30, 50), LARGETEXT, TEXTCOLOR)
+                writeText(mainSurface, "Collect the Green Circle to gain points", (30, 80), LARGETEXT, TEXTCOLOR)
+                writeText(mainSurface, "When time runs out you will be ", (30, 110), LARGETEXT, TEXTCOLOR)
+                writeText(mainSurface, "given a new maze", (40, 140), LARGETEXT, TEXTCOLOR)
+                writeText(mainSurface, f"After {engine.roundsPerGame} rounds are over the game ends", (30, 170), LARGETEXT, TEXTCOLOR)
+                
+                # Draw the buttons
+                for button in buttons:
+                    button.draw(mainSurface)
+                
+                dirtyRects.append(mainSurface.get_rect())
+                redrawScreen = False
             
         elif(gameState == 'initializeGame'):
             
@@ -466,24 +599,16 @@ def main():
             buttons.clear()
             buttons = addButtonColumn(buttonsToAdd, buttonInfo)
             
-            # Create a new maze
-            # place the player and flag in the maze
-            initializeNewMaze()
-            restartCurrentMaze()
-            
-            # Initalize the timer, the round number, and the score
-            gameTimer = timePerRound
-            roundNumber = 1
-            score = 0
+            # Create a new maze, place the player and flag in the maze
+            # and initalize the timer, the round number, and the score
+            engine.startGame()
+            initializeMazeChunks(engine.grid)
             
             # switch to the game screen
             gameState = 'game'
+            redrawScreen = True
             
         elif(gameState == 'game'):
-            # Remove the elapsed time from the timer
-            gameTimer -= deltatime
-            
-            
             for event in events:
                 # if a key is pressed
                 if event.type == pygame.KEYDOWN:
@@ -506,51 +631,73 @@ def main():
                     # Check if any of the buttons were clicked
                     for button in buttons:
                         # if they were clicked, switch to their associated game state
-                        if(button.isClicked(pygame.mouse.get_pos())): gameState = button.nextGameState
-
-            # tell the ball object what direction it should move
-            if(isWPressed): ball.setMove(True, 'up')
-            elif(isAPressed): ball.setMove(True, 'left')
-            elif(isSPressed): ball.setMove(True, 'down')
-            elif(isDPressed): ball.setMove(True, 'right')
-            else: ball.setMove(False, '')
-                
-            mainSurface.fill(BACKGROUNDCOLOR)
-        
-            # draw the walls 
-            for wall in mazeWalls:
-                wall.draw(mainSurface)
+                        if(button.isClicked(event.pos)): gameState = button.nextGameState
+
+            # the direction the ball should move
+            if(isWPressed): direction = 'up'
+            elif(isAPressed): direction = 'left'
+            elif(isSPressed): direction = 'down'
+            elif(isDPressed): direction = 'right'
+            else: direction = ''
+            
+            frameProfiler.mark('state')
+            
+            # move the ball, count down the timer and check for the flag
+            engineEvents = engine.step(direction, deltatime)
+            
+            # if there are no more rounds left, end the game
+            if('gameOver' in engineEvents): gameState = 'initializeGameOver'
+            
+            # the new round's maze is drawn from the start
+            if('round' in engineEvents):
+                initializeMazeChunks(engine.grid)
+                redrawScreen = True
             
-            # draw the player and the flag
-            flag.draw(mainSurface)
-            ball.update(mainSurface, mazeWalls, deltatime)
+            frameProfiler.mark('physics')
+                
+            # the ball is drawn between its last two steps so it moves smoothly
+            alpha = engine.alpha()
+            
+            # keep the player in the middle of the view
+            cameraMoved = camera.follow(engine.ball.interpolatedPos(alpha))
+            
+            # draw the background and the part of the maze that can be seen
+            if(redrawScreen):
+                mainSurface.fill(BACKGROUNDCOLOR)
+                mazeChunks.draw(mainSurface, camera, camera.viewRect)
+                dirtyRects.append(mainSurface.get_rect())
+                redrawScreen = False
+            
+            # otherwise only cover up what was drawn last frame
+            # and the whole view if it moved
+            else:
+                if(cameraMoved): dirtyRects.append(mazeChunks.draw(mainSurface, camera, camera.viewRect))
+                for rect in previousRects:
+                    restoreArea(mainSurface, rect)
+                dirtyRects.extend(previousRects)
+            
+            # draw the player and the flag where they are in the view
+            mainSurface.set_clip(camera.viewRect)
+            previousRects = [engine.flag.draw(mainSurface, camera.offset)]
+            previousRects.append(engine.ball.draw(mainSurface, alpha, camera.offset))
+            mainSurface.set_clip(None)
+            
+            frameProfiler.mark('draw')
             
             # draw the buttons
+            # they do not move so they only need to be sent to the display when the whole screen is
             for button in buttons:
                 button.draw(mainSurface)
             
             # write text for the Time Left, the Rounds, and the Score
-            writeText(mainSurface, f'Time Left: {str(round(gameTimer, 2))}', (10, 10), SMALLTEXT, TEXTCOLOR)
-            writeText(mainSurface, f'Rounds: {roundNumber}', (10, 40), SMALLTEXT, TEXTCOLOR)
-            writeText(mainSurface, f'Score: {score}', (10, 70), SMALLTEXT, TEXTCOLOR)
-            
-            # If the player has reached the flag
-            if(flag.isColliding(ball.pos, ball.size)):
-                # randomly place the player, and flag in the maze
-                restartCurrentMaze()
-                # increase the score
-                score += int(gameTimer * 10)
-            
-            # if time runs out
-            if(gameTimer < 0):
-                # if there are no more rounds left, end the game
-                if(roundNumber == roundsPerGame): gameState = 'initializeGameOver'
-                # otherwise increment the roundNumber
-                roundNumber += 1
-                # Start a new round with a new maze
-                gameTimer = timePerRound
-                initializeNewMaze()
-                restartCurrentMaze()
+            # the time changes every frame so it is drawn from cached digits
+            timeRect = writeText(mainSurface, 'Time Left: ', (10, 10), SMALLTEXT, TEXTCOLOR)
+            previousRects.append(timeRect.union(textCache.drawGlyphs(mainSurface, SMALLTEXT, str(round(engine.gameTimer, 2)), TEXTCOLOR, timeRect.topright)))
+            previousRects.append(writeText(mainSurface, f'Rounds: {engine.roundNumber}', (10, 40), SMALLTEXT, TEXTCOLOR))
+            previousRects.append(writeText(mainSurface, f'Score: {engine.score}', (10, 70), SMALLTEXT, TEXTCOLOR))
+            dirtyRects.extend(previousRects)
+            
+            frameProfiler.mark('hud')
         
         elif(gameState == 'initializeGameOver'):
             # Create a column of buttons for the game over screen
@@ -575,6 +722,7 @@ def main():
             
             # switch to the game over screen
             gameState = 'gameOver'
+            redrawScreen = True
         
         elif(gameState == 'gameOver'):
             # if the mouse button is clicked
@@ -583,16 +731,21 @@ def main():
                     # Check if any of the buttons were clicked
                     for button in buttons:
                         # if they were clicked, switch to their associated game state
-                        if(button.isClicked(pygame.mouse.get_pos())): gameState = button.nextGameState
-            
-            mainSurface.fill(BACKGROUNDCOLOR)
-            # write a game over message and the final score
-            writeTextCentered(mainSurface, "GAME OVER", (surfaceSize/2, 100), GIANTTEXT, TEXTCOLOR)
-            writeTextCentered(mainSurface, f"Score: {score}", (surfaceSize/2, 140), LARGETEXT, TEXTCOLOR)
-            
-            # draw the buttons
-            for button in buttons:
-                button.draw(mainSurface)
+                        if(button.isClicked(event.pos)): gameState = button.nextGameState
+            
+            # the game over screen does not change so it is only drawn when it is opened
+            if(redrawScreen):
+                mainSurface.fill(BACKGROUNDCOLOR)
+                # write a game over message and the final score
+                writeTextCentered(mainSurface, "GAME OVER", (surfaceSize/2, 100), GIANTTEXT, TEXTCOLOR)
+                writeTextCentered(mainSurface, f"Score: {engine.score}", (surfaceSize/2, 140), LARGETEXT, TEXTCOLOR)
+                
+                # draw the buttons
+                for button in buttons:
+                    button.draw(mainSurface)
+                
+                dirtyRects.append(mainSurface.get_rect())
+                redrawScreen = False
         
         elif(gameState == 'quit'):
             play = False
@@ -600,8 +753,32 @@ def main():
         else:
             raise ValueError(f'{gameState} is not a valid Game State')
 
-        pygame.display.flip()
+        frameProfiler.mark('state')
+        
+        # draw the profiler over everything else
+        if(showProfiler):
+            dirtyRects.append(frameProfiler.drawOverlay(mainSurface, TINYTEXT))
+            frameProfiler.mark('profiler')
+        
+        # send the changed parts of the screen to the display
+        # the whole screen is sent after the window lost what was on it
+        if(dirtyRendering and not screenExposed): pygame.display.update(dirtyRects)
+        else: pygame.display.update()
+        screenExposed = False
         
+        frameProfiler.mark('display')
+        frameProfiler.endFrame()
+        
+        # record how long the frame took to run
+        if(headless): frameTimes.setdefault(frameState, []).append(time.perf_counter() - frameStart)
+        
+        frameNumber += 1
+        if(frameLimit is not None and frameNumber >= frameLimit): play = False
+        
+    engine.shutdown()
     pygame.quit()
+    
+    return frameTimes
         
-main()
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,683 @@
+#-----------------------------------------------------------------------------
+# Maze generating algorithms
+#
+# Every algorithm has the same signature: algorithm(mazeSize, randomSource)
+# and returns a MazeGrid with the walls of a perfect maze.
+#
+# mazeSize is the [x, y] size of the maze and randomSource is the random module
+# or a random.Random object. The vectorized algorithms draw a seed from randomSource
+# for a numpy random generator so every algorithm uses the same random stream.
+#-----------------------------------------------------------------------------
+
+import numpy
+from maze_grid import MazeGrid, ALLWALLS, TOPWALL, BOTTOMWALL, RIGHTWALL, LEFTWALL
+from disjoint_set import DisjointSet
+
+def numpyGenerator(randomSource):
+    '''
+    Creates a numpy random generator from a python random source
+
+    Parameters
+    ----------
+    randomSource: random or random.Random()
+        The source the seed is taken from
+
+    Returns
+    -------
+    numpy.random.Generator
+        A generator seeded from the random source
+    '''
+    return numpy.random.default_rng(randomSource.getrandbits(64))
+
+def gridFromArray(walls):
+    '''
+    Creates a finished MazeGrid from wall masks
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    Returns
+    -------
+    MazeGrid
+        A grid with a copy of the walls where every cell has been checked
+    '''
+    grid = MazeGrid((walls.shape[1], walls.shape[0]))
+    grid.asArray()[:] = walls
+    grid.fillChecked(True)
+    return grid
+
+def carvePassages(walls, openRight, openDown):
+    '''
+    Removes walls between neighbouring cells
+
+    Both walls of each pair of cells are removed so the cells connect to one another.
+    A batch of mazes can be carved at once by adding a first dimension to every array.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x) or (count, y, x). Changed in place.
+
+    openRight: numpy.ndarray
+        A bool array with the shape (y, x - 1). True if a cell connects to the cell on its right
+
+    openDown: numpy.ndarray
+        A bool array with the shape (y - 1, x). True if a cell connects to the cell below it
+
+    Returns
+    -------
+    None
+    '''
+    openRight = openRight.astype(numpy.uint8)
+    openDown = openDown.astype(numpy.uint8)
+
+    # remove the right wall of the cell and the left wall of its neighbour
+    walls[..., :, :-1] &= ~(openRight * numpy.uint8(RIGHTWALL))
+    walls[..., :, 1:] &= ~(openRight * numpy.uint8(LEFTWALL))
+
+    # remove the bottom wall of the cell and the top wall of its neighbour
+    walls[..., :-1, :] &= ~(openDown * numpy.uint8(BOTTOMWALL))
+    walls[..., 1:, :] &= ~(openDown * numpy.uint8(TOPWALL))
+
+def recursiveBacktracker(mazeSize, randomSource):
+    '''
+    Generates a maze using a recursive backtracking algorithm.
+
+    Works the same way as MazeGenerator.generateMaze but stores the maze in a MazeGrid.
+    The stack holds flat cell indexes and the checked values are bits so
+    large mazes use a small amount of memory.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+    '''
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    grid = MazeGrid((width, height))
+
+    walls = grid.walls
+    checked = grid.checked
+
+    # Cells that have been reached by the algorithm and still have unchecked neighbors.
+    # Starting square for the algorithm
+    cellsStack = [0]
+
+    # While there are still uncheck cells to path to
+    while(len(cellsStack) > 0):
+
+        # look at the last cell in the stack
+        # set its checked bit
+        index = cellsStack[-1]
+        checked[index >> 3] |= 1 << (index & 7)
+        x = index % width
+
+        # FIND NEIGHBOURING CELLS
+        # (wall of this cell, wall of the neighbour, index of the neighbour)
+        neighbourCells = []
+
+        # LEFT NEIGHBOUR
+        if(x > 0 and not checked[(index - 1) >> 3] & (1 << ((index - 1) & 7))):
+            neighbourCells.append((LEFTWALL, RIGHTWALL, index - 1))
+
+        # RIGHT NEIGHBOUR
+        if(x + 1 < width and not checked[(index + 1) >> 3] & (1 << ((index + 1) & 7))):
+            neighbourCells.append((RIGHTWALL, LEFTWALL, index + 1))
+
+        # TOP NEIGHBOUR
+        if(index >= width and not checked[(index - width) >> 3] & (1 << ((index - width) & 7))):
+            neighbourCells.append((TOPWALL, BOTTOMWALL, index - width))
+
+        # BOTTOM NEIGHBOUR
+        if(index + width < width * height and not checked[(index + width) >> 3] & (1 << ((index + width) & 7))):
+            neighbourCells.append((BOTTOMWALL, TOPWALL, index + width))
+
+        # CONTINUE THE PATH
+        if(len(neighbourCells) > 0):
+            # choose a random neighbour
+            wall, neighbourWall, nextIndex = randomSource.choice(neighbourCells)
+
+            # remove the walls of the current cell and the next cell
+            #  so that they connect to one another
+            walls[index] &= ~wall
+            walls[nextIndex] &= ~neighbourWall
+
+            # add the next cell to the end of the stack
+            cellsStack.append(nextIndex)
+
+        # if there are no neighbours
+        else:
+            # remove this cell from the stack
+            cellsStack.pop()
+
+    return grid
+
+def binaryTree(mazeSize, randomSource):
+    '''
+    Generates a maze using the binary tree algorithm.
+
+    Every cell connects to the cell above it or the cell to its right.
+    See binaryTreeBatch.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+    '''
+    return gridFromArray(binaryTreeBatch(1, mazeSize, randomSource)[0])
+
+def binaryTreeBatch(count, mazeSize, randomSource):
+    '''
+    Generates mazes using the binary tree algorithm.
+
+    Every cell connects to the cell above it or the cell to its right.
+    Each choice is independent so every maze of the batch is made with a few array operations.
+    The top row is always one long corridor and so is the right column.
+
+    Parameters
+    ----------
+    count: int
+        The number of mazes
+
+    mazeSize: List<int>
+        The x and y size of each maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    numpy.ndarray
+        The uint8 wall masks of the mazes with the shape (count, y, x)
+    '''
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    walls = numpy.full((count, height, width), ALLWALLS, dtype=numpy.uint8)
+    rng = numpyGenerator(randomSource)
+
+    # True if a cell connects upwards, otherwise it connects to the right
+    goUp = rng.random((count, height, width)) < 0.5
+
+    # the top row can only go right and the right column can only go up
+    goUp[:, 0, :] = False
+    goUp[:, :, -1] = True
+    goRight = ~goUp
+    # the top right cell has nowhere to go
+    goUp[:, 0, -1] = False
+    goRight[:, 0, -1] = False
+
+    # a cell going up opens the bottom wall of the cell above it
+    carvePassages(walls, goRight[:, :, :-1], goUp[:, 1:, :])
+
+    return walls
+
+def sidewinder(mazeSize, randomSource):
+    '''
+    Generates a maze using the sidewinder algorithm.
+
+    Each row is split into random runs of connected cells and one random cell
+    of every run connects to the row above. See sidewinderBatch.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+    '''
+    return gridFromArray(sidewinderBatch(1, mazeSize, randomSource)[0])
+
+def sidewinderBatch(count, mazeSize, randomSource):
+    '''
+    Generates mazes using the sidewinder algorithm.
+
+    Each row is split into random runs of connected cells and one random cell
+    of every run connects to the row above. The top row is one long corridor.
+    The runs of every row of every maze are found at the same time with array operations.
+
+    Parameters
+    ----------
+    count: int
+        The number of mazes
+
+    mazeSize: List<int>
+        The x and y size of each maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    numpy.ndarray
+        The uint8 wall masks of the mazes with the shape (count, y, x)
+    '''
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    walls = numpy.full((count, height, width), ALLWALLS, dtype=numpy.uint8)
+    rng = numpyGenerator(randomSource)
+
+    # True if a cell continues its run to the right
+    openRight = rng.random((count, height, width - 1)) < 0.5
+    # the top row is one run
+    openRight[:, 0, :] = True
+
+    # A run ends wherever it does not continue to the right
+    # and always at the end of a row
+    runEnds = numpy.ones((count, height - 1, width), dtype=bool)
+    runEnds[:, :, :-1] = ~openRight[:, 1:]
+    runEnds = numpy.flatnonzero(runEnds)
+
+    # the first cell of each run, runs never cross rows or mazes
+    runStarts = numpy.empty_like(runEnds)
+    runStarts[:1] = 0
+    runStarts[1:] = runEnds[:-1] + 1
+
+    # pick one random cell from each run to connect upwards
+    chosen = runStarts + (rng.random(len(runEnds)) * (runEnds - runStarts + 1)).astype(runEnds.dtype)
+    goUp = numpy.zeros(count * (height - 1) * width, dtype=bool)
+    goUp[chosen] = True
+
+    carvePassages(walls, openRight, goUp.reshape(count, height - 1, width))
+
+    return walls
+
+def ellerRows(width, height, randomSource):
+    '''
+    Generates the rows of a maze using Eller's algorithm.
+
+    Only the sets of the current row are remembered so memory does not
+    depend on the height of the maze. See ellerBatchRows.
+
+    Parameters
+    ----------
+    width: int
+        The number of cells in each row
+
+    height: int
+        The number of rows in the maze.
+        If None the maze never ends and the bottom row is never closed.
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Yields
+    -------
+    numpy.ndarray
+        The uint8 wall masks of each row, from top to bottom
+    '''
+    for rows in ellerBatchRows(1, width, height, randomSource):
+        yield rows[0]
+
+def ellerBatchRows(count, width, height, randomSource):
+    '''
+    Generates the rows of several mazes using Eller's algorithm.
+
+    Only the sets of the current row are remembered so memory does not
+    depend on the height of the mazes. The rows of all the mazes are handled
+    as one long row where cells of different mazes are never joined.
+    The random choices and the set bookkeeping are done with array operations.
+    Rows are made lazily, one for each time the generator is advanced.
+
+    Parameters
+    ----------
+    count: int
+        The number of mazes
+
+    width: int
+        The number of cells in each row
+
+    height: int
+        The number of rows in the mazes.
+        If None the mazes never end and the bottom row is never closed.
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Yields
+    -------
+    numpy.ndarray
+        The uint8 wall masks of the next row of every maze with the shape (count, x)
+    '''
+    rng = numpyGenerator(randomSource)
+    cellCount = count * width
+
+    # the set every cell of the current rows belongs to
+    # set numbers are never shared between mazes
+    sets = numpy.arange(cellCount)
+    # cells of the current rows that connect to the rows above
+    openUp = numpy.zeros(cellCount, dtype=bool)
+
+    y = 0
+    while(height is None or y < height):
+        isLastRow = (y == height - 1) if height is not None else False
+
+        # JOIN NEIGHBOURING CELLS
+        # the last row joins every neighbour that is in a different set
+        if(isLastRow):
+            joins = numpy.ones((count, width - 1), dtype=bool)
+        else:
+            joins = rng.random((count, width - 1)) < 0.5
+
+        # the index in the long row of the left cell of each join
+        candidates = numpy.flatnonzero(joins)
+        if(width > 1): candidates = candidates // (width - 1) * width + candidates % (width - 1)
+
+        # union-find over the set numbers of these rows so a join never makes a loop
+        parent = list(range(int(sets.max()) + 1 if cellCount > 0 else 0))
+        openRight = numpy.zeros((count, width), dtype=bool)
+        flatOpenRight = openRight.reshape(-1)
+        rowSets = sets.tolist()
+        for x in candidates.tolist():
+            a = parent[rowSets[x]]
+            while(parent[a] != a): a = parent[a]
+            b = parent[rowSets[x + 1]]
+            while(parent[b] != b): b = parent[b]
+
+            if(a != b):
+                parent[b] = a
+                flatOpenRight[x] = True
+
+        # point every set number at its root
+        parent = numpy.array(parent)
+        while(True):
+            nextParent = parent[parent]
+            if((nextParent == parent).all()): break
+            parent = nextParent
+        sets = parent[sets]
+
+        # CONNECT TO THE NEXT ROW
+        openDown = numpy.zeros(cellCount, dtype=bool)
+        if(not isLastRow):
+            openDown = (rng.random((count, width)) < 0.5).reshape(-1)
+
+            # every set needs at least one cell that connects downwards
+            # give each cell a random priority and force the first cell of each set
+            order = numpy.lexsort((rng.random(cellCount), sets))
+            firstOfSet = numpy.ones(cellCount, dtype=bool)
+            firstOfSet[1:] = sets[order[1:]] != sets[order[:-1]]
+            openDown[order[firstOfSet]] = True
+
+        # BUILD THE WALL MASKS OF THESE ROWS
+        openRight = openRight[:, :-1].astype(numpy.uint8)
+        rows = numpy.full((count, width), ALLWALLS, dtype=numpy.uint8)
+        rows[:, :-1] &= ~(openRight * numpy.uint8(RIGHTWALL))
+        rows[:, 1:] &= ~(openRight * numpy.uint8(LEFTWALL))
+        rows &= ~(openDown.reshape(count, width).astype(numpy.uint8) * numpy.uint8(BOTTOMWALL))
+        rows &= ~(openUp.reshape(count, width).astype(numpy.uint8) * numpy.uint8(TOPWALL))
+        yield rows
+
+        # cells that do not connect downwards start a new set in the next rows
+        # renumber the sets so the numbers stay smaller than 2 * count * width
+        sets = numpy.where(openDown, sets, numpy.arange(cellCount) + cellCount)
+        sets = numpy.unique(sets, return_inverse=True)[1].reshape(cellCount)
+        openUp = openDown
+        y += 1
+
+def eller(mazeSize, randomSource):
+    '''
+    Generates a maze using Eller's algorithm.
+
+    The maze is made one row at a time by ellerRows.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+    '''
+    return gridFromArray(ellerBatch(1, mazeSize, randomSource)[0])
+
+def ellerBatch(count, mazeSize, randomSource):
+    '''
+    Generates mazes using Eller's algorithm.
+
+    The same row of every maze is made at the same time by ellerBatchRows.
+
+    Parameters
+    ----------
+    count: int
+        The number of mazes
+
+    mazeSize: List<int>
+        The x and y size of each maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    numpy.ndarray
+        The uint8 wall masks of the mazes with the shape (count, y, x)
+    '''
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    walls = numpy.empty((count, height, width), dtype=numpy.uint8)
+
+    for y, rows in enumerate(ellerBatchRows(count, width, height, randomSource)):
+        walls[:, y] = rows
+
+    return walls
+
+def kruskal(mazeSize, randomSource):
+    '''
+    Generates a maze using randomized Kruskal's algorithm.
+
+    Every wall between two cells is an edge. The edges are shuffled in one array
+    and each edge is opened if its two cells are not connected yet, which is
+    checked with a DisjointSet. The result is an unbiased maze with no long corridors.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+    '''
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    grid = MazeGrid((width, height))
+    rng = numpyGenerator(randomSource)
+
+    # every edge is stored as cell * 2 + 0 for the right wall or cell * 2 + 1 for the bottom wall
+    cells = numpy.arange(width * height, dtype=numpy.int64)
+    rightEdges = cells[cells % width < width - 1] * 2
+    downEdges = cells[:(height - 1) * width] * 2 + 1
+    edges = rng.permutation(numpy.concatenate((rightEdges, downEdges)))
+
+    openRight = numpy.zeros(width * height, dtype=bool)
+    openDown = numpy.zeros(width * height, dtype=bool)
+
+    cellSets = DisjointSet(width * height)
+    edgesLeft = width * height - 1
+    for edge in edges.tolist():
+        # a perfect maze has one less passage than it has cells
+        if(edgesLeft == 0): break
+
+        cell = edge >> 1
+        if(edge & 1):
+            if(cellSets.union(cell, cell + width)):
+                openDown[cell] = True
+                edgesLeft -= 1
+        else:
+            if(cellSets.union(cell, cell + 1)):
+                openRight[cell] = True
+                edgesLeft -= 1
+
+    carvePassages(grid.asArray(), openRight.reshape(height, width)[:, :-1], openDown.reshape(height, width)[:-1, :])
+    grid.fillChecked(True)
+
+    return grid
+
+def wilson(mazeSize, randomSource):
+    '''
+    Generates a maze using Wilson's algorithm.
+
+    Random walks start from cells that are not in the maze yet and wander until they
+    reach the maze. Only the last direction taken out of each cell is kept, which
+    erases loops, and the walk is then added to the maze. Every possible maze is equally
+    likely. The walk directions are kept in a bytearray and the random steps are drawn
+    in large batches.
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+    '''
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    cellCount = width * height
+    grid = MazeGrid((width, height))
+    rng = numpyGenerator(randomSource)
+
+    walls = grid.walls
+    inMaze = bytearray(cellCount)
+    # the direction each cell was last left in during the current walk
+    walkDirections = bytearray(cellCount)
+
+    # (change in the flat index, wall of the cell, wall of the neighbour) for
+    # 0: right, 1: left, 2: down, 3: up
+    moves = ((1, RIGHTWALL, LEFTWALL), (-1, LEFTWALL, RIGHTWALL),
+             (width, BOTTOMWALL, TOPWALL), (-width, TOPWALL, BOTTOMWALL))
+
+    # random directions are drawn in batches, smaller batches for small mazes
+    randomDirections = []
+    randomIndex = 0
+    batchSize = min(65536, 16 * cellCount)
+
+    # the maze starts with one random cell
+    inMaze[int(rng.integers(cellCount))] = 1
+
+    for start in range(cellCount):
+        if(inMaze[start]): continue
+
+        # RANDOM WALK until the walk reaches the maze
+        cell = start
+        while(not inMaze[cell]):
+            if(randomIndex == len(randomDirections)):
+                randomDirections = rng.integers(0, 4, size=batchSize, dtype=numpy.uint8).tolist()
+                randomIndex = 0
+            direction = randomDirections[randomIndex]
+            randomIndex += 1
+
+            # draw again if the direction leaves the maze
+            x = cell % width
+            if((direction == 0 and x == width - 1) or (direction == 1 and x == 0) or
+               (direction == 2 and cell + width >= cellCount) or (direction == 3 and cell < width)):
+                continue
+
+            walkDirections[cell] = direction
+            cell += moves[direction][0]
+
+        # ADD THE WALK TO THE MAZE following the last direction out of each cell
+        cell = start
+        while(not inMaze[cell]):
+            offset, wall, neighbourWall = moves[walkDirections[cell]]
+            inMaze[cell] = 1
+            walls[cell] &= ~wall
+            walls[cell + offset] &= ~neighbourWall
+            cell += offset
+
+    grid.fillChecked(True)
+    return grid
+
+def generateBatch(algorithm, count, mazeSize, randomSource):
+    '''
+    Generates many mazes of the same size into one array
+
+    Algorithms with a batch version make every maze at once with array operations.
+    The others make the mazes one at a time into the array.
+
+    Parameters
+    ----------
+    algorithm: str
+        One of the keys of ALGORITHMS
+
+    count: int
+        The number of mazes
+
+    mazeSize: List<int>
+        The x and y size of each maze
+        [x, y]
+
+    randomSource: random or random.Random()
+        The source of the random choices
+
+    Returns
+    -------
+    numpy.ndarray
+        The uint8 wall masks of the mazes with the shape (count, y, x)
+    '''
+    if(algorithm in BATCHALGORITHMS):
+        return BATCHALGORITHMS[algorithm](count, mazeSize, randomSource)
+
+    walls = numpy.empty((count, int(mazeSize[1]), int(mazeSize[0])), dtype=numpy.uint8)
+    for i in range(count):
+        walls[i] = ALGORITHMS[algorithm](mazeSize, randomSource).asArray()
+    return walls
+
+# Every algorithm that MazeGenerator can use
+# {name: function}
+ALGORITHMS = {
+    'recursiveBacktracker': recursiveBacktracker,
+    'binaryTree': binaryTree,
+    'sidewinder': sidewinder,
+    'eller': eller,
+    'kruskal': kruskal,
+    'wilson': wilson
+    }
+
+# Algorithms that can make a whole batch of mazes with array operations
+# {name: function(count, mazeSize, randomSource)}
+BATCHALGORITHMS = {
+    'binaryTree': binaryTreeBatch,
+    'sidewinder': sidewinderBatch,
+    'eller': ellerBatch
+    }
@@ -0,0 +1,277 @@
+#-----------------------------------------------------------------------------
+# Maze analytics
+#
+# Difficulty metrics computed with array operations over wall masks.
+# Every function takes the walls of one maze with the shape (y, x) or of a
+# batch of mazes with the shape (count, y, x). A batch returns one value per maze.
+#
+# A batch is searched as one tall maze of shape (count * y, x). The outer walls
+# of every maze are closed so searches never cross from one maze into another,
+# which lets every maze of the batch be searched at the same time.
+#-----------------------------------------------------------------------------
+
+import numpy
+from maze_solver import distanceField
+
+# The number of open sides of a cell for every wall mask
+OPENSIDES = numpy.array([4 - bin(mask).count('1') for mask in range(16)], dtype=numpy.uint8)
+
+def asBatch(walls):
+    '''
+    Gives one maze a batch dimension
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    Returns
+    -------
+    numpy.ndarray
+        The walls with the shape (count, y, x)
+
+    bool
+        True if the walls were a single maze
+    '''
+    walls = numpy.asarray(walls, dtype=numpy.uint8)
+    if(walls.ndim == 2): return walls[numpy.newaxis], True
+    return walls, False
+
+def unbatch(values, isSingle):
+    '''
+    Removes the batch dimension from results of a single maze
+
+    Parameters
+    ----------
+    values: numpy.ndarray
+        One value for every maze
+
+    isSingle: bool
+        True if the walls were a single maze
+
+    Returns
+    -------
+    int or float or numpy.ndarray
+        A single value or the array of values
+    '''
+    return values[0].item() if isSingle else values
+
+def countOpenSides(walls):
+    '''
+    Counts the open sides of every cell
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of open sides of every cell, with the same shape as walls
+    '''
+    return OPENSIDES[numpy.asarray(walls) & 0x0F]
+
+def deadEndCount(walls):
+    '''
+    Counts the dead ends of a maze
+
+    A dead end is a cell with only one open side.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of dead ends of the maze, or of every maze in the batch
+    '''
+    walls, isSingle = asBatch(walls)
+    return unbatch((countOpenSides(walls) == 1).sum(axis=(1, 2)), isSingle)
+
+def junctionCount(walls):
+    '''
+    Counts the junctions of a maze
+
+    A junction is a cell with three or four open sides.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of junctions of the maze, or of every maze in the batch
+    '''
+    walls, isSingle = asBatch(walls)
+    return unbatch((countOpenSides(walls) >= 3).sum(axis=(1, 2)), isSingle)
+
+def meanCorridorLength(walls):
+    '''
+    Finds the average length of the corridors of a maze
+
+    A corridor is a path between two cells that are not straight passages
+    (dead ends and junctions) through cells with exactly two open sides.
+    Its length is the number of steps along it.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The mean corridor length of the maze, or of every maze in the batch
+    '''
+    walls, isSingle = asBatch(walls)
+    openSides = countOpenSides(walls).astype(numpy.int64)
+
+    # every passage is counted by both of its cells
+    passages = openSides.sum(axis=(1, 2)) / 2
+
+    # every corridor has two ends, each at a cell that is not a straight passage
+    corridorEnds = numpy.where(openSides != 2, openSides, 0).sum(axis=(1, 2))
+    corridors = corridorEnds / 2
+
+    return unbatch(numpy.where(corridors > 0, passages / numpy.maximum(corridors, 1), 0.0), isSingle)
+
+def batchDistances(walls, startCells):
+    '''
+    Finds the distance from a start cell to every cell of every maze of a batch
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (count, y, x)
+
+    startCells: numpy.ndarray
+        The x and y position of the start cell of every maze with the shape (count, 2)
+
+    Returns
+    -------
+    numpy.ndarray
+        The int32 distances with the shape (count, y, x)
+    '''
+    count, height, width = walls.shape
+
+    # search the batch as one tall maze
+    tallStarts = numpy.column_stack((startCells[:, 0], startCells[:, 1] + numpy.arange(count) * height))
+    return distanceField(walls.reshape(count * height, width), tallStarts).reshape(count, height, width)
+
+def farthestCells(distances):
+    '''
+    Finds the cell furthest from the start in every maze of a batch
+
+    Parameters
+    ----------
+    distances: numpy.ndarray
+        Distances with the shape (count, y, x)
+
+    Returns
+    -------
+    numpy.ndarray
+        The x and y position of the furthest cell of every maze with the shape (count, 2)
+    '''
+    count, height, width = distances.shape
+    farthest = distances.reshape(count, -1).argmax(axis=1)
+    return numpy.column_stack((farthest % width, farthest // width))
+
+def longestPathLength(walls):
+    '''
+    Finds the length of the longest path of a maze
+
+    Uses two breadth-first searches: the cell furthest from any cell is one
+    end of the longest path, and the cell furthest from that is the other end.
+    This is exact for perfect mazes.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of steps of the longest path of the maze, or of every maze in the batch
+    '''
+    walls, isSingle = asBatch(walls)
+    count = walls.shape[0]
+
+    # search from the top-left cell, then from the furthest cell found
+    distances = batchDistances(walls, numpy.zeros((count, 2), dtype=numpy.int64))
+    distances = batchDistances(walls, farthestCells(distances))
+
+    return unbatch(distances.reshape(count, -1).max(axis=1), isSingle)
+
+def solutionLength(walls, startCell, goalCell):
+    '''
+    Finds the length of the path between two cells of a maze
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    startCell: List<int>
+        The x and y position of the start cell, used for every maze of a batch
+        [x, y]
+
+    goalCell: List<int>
+        The x and y position of the goal cell, used for every maze of a batch
+        [x, y]
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of steps between the cells of the maze, or of every maze in the batch.
+        -1 if the goal cannot be reached.
+    '''
+    walls, isSingle = asBatch(walls)
+    count = walls.shape[0]
+
+    startCells = numpy.tile(numpy.asarray(startCell, dtype=numpy.int64), (count, 1))
+    distances = batchDistances(walls, startCells)
+
+    return unbatch(distances[:, int(goalCell[1]), int(goalCell[0])], isSingle)
+
+def analyzeMazes(walls, startCell=None, goalCell=None):
+    '''
+    Finds every difficulty metric of a maze
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        Wall masks with the shape (y, x) or (count, y, x)
+
+    startCell: List<int>
+        The start of the solution. If None the top-left cell is used.
+        [x, y]
+
+    goalCell: List<int>
+        The end of the solution. If None the bottom-right cell is used.
+        [x, y]
+
+    Returns
+    -------
+    Dictionary<string, dynamic>
+        {'deadEnds', 'junctions', 'longestPath', 'meanCorridorLength', 'solutionLength'}
+        Each is a single value for one maze or an array for a batch.
+    '''
+    walls = numpy.asarray(walls, dtype=numpy.uint8)
+    height, width = walls.shape[-2:]
+
+    if(startCell is None): startCell = [0, 0]
+    if(goalCell is None): goalCell = [width - 1, height - 1]
+
+    return {
+        'deadEnds': deadEndCount(walls),
+        'junctions': junctionCount(walls),
+        'longestPath': longestPathLength(walls),
+        'meanCorridorLength': meanCorridorLength(walls),
+        'solutionLength': solutionLength(walls, startCell, goalCell)
+        }
@@ -0,0 +1,166 @@
+from collections import OrderedDict
+import threading
+
+class MazeCache():
+    '''
+    MazeCache
+
+    A least recently used cache of generated mazes.
+    Mazes are stored as copies of MazeGrid Objects and looked up with a
+    (mazeSize, algorithm, seed) key. When the cache is over its entry or byte
+    limit the mazes that were used the longest time ago are removed.
+    The cache can be shared with a background thread.
+
+    FUNCTIONS
+        __init__(self, maxEntriesIn, maxBytesIn)
+            Creates an empty cache with limits on its size
+
+        makeKey(self, mazeSize, algorithm, seed)
+            Returns the key of a maze
+
+        get(self, key)
+            Returns a cached maze or None
+
+        put(self, key, gridIn)
+            Adds a maze to the cache
+
+        clear(self)
+            Removes every maze from the cache
+    '''
+    def __init__(self, maxEntriesIn=64, maxBytesIn=64 * 1024 * 1024):
+        '''
+        Initializes a MazeCache Object
+
+        Object contains the cached mazes in the order they were used,
+        the limits of the cache and counters for hits and misses.
+
+        Parameters
+        ----------
+        maxEntriesIn: int
+            The most mazes the cache will hold
+
+        maxBytesIn: int
+            The most bytes of maze data the cache will hold
+
+        Returns
+        -------
+        None
+        '''
+        self.maxEntries = maxEntriesIn
+        self.maxBytes = maxBytesIn
+
+        # {key: MazeGrid}, the last entry is the most recently used
+        self.entries = OrderedDict()
+        self.currentBytes = 0
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def makeKey(self, mazeSize, algorithm, seed):
+        '''
+        Creates the key of a maze
+
+        Parameters
+        ----------
+        mazeSize: List<int>
+            The x and y size of the maze
+            [x, y]
+
+        algorithm: str
+            The name of the algorithm that generated the maze
+
+        seed: int or str
+            The seed of the random stream that generated the maze
+
+        Returns
+        -------
+        tuple
+            ((x, y), algorithm, seed)
+        '''
+        return ((int(mazeSize[0]), int(mazeSize[1])), algorithm, seed)
+
+    def get(self, key):
+        '''
+        Gets a maze from the cache
+
+        The maze becomes the most recently used maze.
+        A copy is returned so changing it does not change the cached maze.
+
+        Parameters
+        ----------
+        key: tuple
+            The key made by makeKey
+
+        Returns
+        -------
+        MazeGrid or None
+            A copy of the cached maze, or None if it is not in the cache
+        '''
+        with self.lock:
+            grid = self.entries.get(key)
+
+            if(grid is None):
+                self.misses += 1
+                return None
+
+            # move the maze to the most recently used end
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return grid.copy()
+
+    def put(self, key, gridIn):
+        '''
+        Adds a maze to the cache
+
+        A copy of the maze is stored so later changes to the grid do not change the cache.
+        The least recently used mazes are removed until the cache is within its limits.
+        A maze larger than maxBytes is not cached.
+
+        Parameters
+        ----------
+        key: tuple
+            The key made by makeKey
+
+        gridIn: MazeGrid
+            The maze to cache
+
+        Returns
+        -------
+        None
+        '''
+        size = gridIn.getMemorySize()
+        if(size > self.maxBytes or self.maxEntries <= 0): return
+        gridIn = gridIn.copy()
+
+        with self.lock:
+            # replace an old maze with the same key
+            if(key in self.entries):
+                self.currentBytes -= self.entries.pop(key).getMemorySize()
+
+            self.entries[key] = gridIn
+            self.currentBytes += size
+
+            # remove the least recently used mazes until the cache is small enough
+            while(len(self.entries) > self.maxEntries or self.currentBytes > self.maxBytes):
+                oldKey, oldGrid = self.entries.popitem(last=False)
+                self.currentBytes -= oldGrid.getMemorySize()
+
+    def clear(self):
+        '''
+        Removes every maze from the cache
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        with self.lock:
+            self.entries.clear()
+            self.currentBytes = 0
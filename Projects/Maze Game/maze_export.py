@@ -0,0 +1,269 @@
+#-----------------------------------------------------------------------------
+# Maze image export
+#
+# Saves mazes from MazeGenerator as PNG files. The pixels of every image are
+# worked out from the wall masks with array operations and written through
+# pygame.surfarray, so no Wall Objects or display are needed.
+# The walls are where makeWalls in main would draw them, to within a pixel
+# when a tenth of the cell size is not a whole number.
+#
+# Usage:
+#   python maze_export.py --count 1000 --size 20x12 --cell-size 4
+#   python maze_export.py --count 10 --algorithm kruskal --solution --output-dir previews
+#-----------------------------------------------------------------------------
+
+import argparse
+import os
+import numpy
+import pygame
+from maze_generator import MazeGenerator
+from maze_algorithms import ALGORITHMS
+from maze_grid import TOPWALL, BOTTOMWALL, RIGHTWALL, LEFTWALL
+from maze_solver import astarPath
+
+# The colors of the game
+BACKGROUNDCOLOR = (6, 36, 84)
+WALLCOLOR = (255, 255, 255)
+SOLUTIONCOLOR = (0, 255, 0)
+
+# The most mazes generated at once
+BATCHSIZE = 256
+
+def pixelCells(walls, cellSize):
+    '''
+    Finds the cell and the position inside the cell of every pixel
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    cellSize: int
+        the pixel size of a cell
+
+    Returns
+    -------
+    numpy.ndarray
+        The wall mask of the cell of every pixel with the shape (y * cellSize, x * cellSize)
+
+    numpy.ndarray
+        The x position of every pixel column inside its cell with the shape (1, x * cellSize)
+
+    numpy.ndarray
+        The y position of every pixel row inside its cell with the shape (y * cellSize, 1)
+    '''
+    height, width = walls.shape
+    cellWalls = numpy.repeat(numpy.repeat(walls, cellSize, axis=0), cellSize, axis=1)
+    insideX = (numpy.arange(width * cellSize) % cellSize)[numpy.newaxis, :]
+    insideY = (numpy.arange(height * cellSize) % cellSize)[:, numpy.newaxis]
+    return cellWalls, insideX, insideY
+
+def wallPixels(walls, cellSize):
+    '''
+    Finds the pixels covered by walls
+
+    Every wall is a strip a tenth of a cell wide along one side of its cell, inside the cell.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    cellSize: int
+        the pixel size of a cell
+
+    Returns
+    -------
+    numpy.ndarray
+        A bool array with the shape (y * cellSize, x * cellSize) that is True on the walls
+    '''
+    cellWalls, insideX, insideY = pixelCells(walls, cellSize)
+    # thin walls are still one pixel wide so small images show them
+    thickness = max(1, int(cellSize * 0.1))
+
+    return ((((cellWalls & LEFTWALL) != 0) & (insideX < thickness)) |
+            (((cellWalls & RIGHTWALL) != 0) & (insideX >= cellSize - thickness)) |
+            (((cellWalls & TOPWALL) != 0) & (insideY < thickness)) |
+            (((cellWalls & BOTTOMWALL) != 0) & (insideY >= cellSize - thickness)))
+
+def pathPixels(path, mazeSize, cellSize):
+    '''
+    Finds the pixels covered by a path
+
+    The path is a line through the centers of its cells a quarter of a cell wide.
+
+    Parameters
+    ----------
+    path: List<List<int>>
+        The cells of the path in order
+        [[x, y], ...]
+
+    mazeSize: List<int>
+        The number of cells in the maze
+        [x, y]
+
+    cellSize: int
+        the pixel size of a cell
+
+    Returns
+    -------
+    numpy.ndarray
+        A bool array with the shape (y * cellSize, x * cellSize) that is True on the path
+    '''
+    path = numpy.asarray(path, dtype=numpy.int64).reshape(-1, 2)
+
+    # the sides of each cell the path leaves through, using the wall bits as directions
+    sides = numpy.zeros((mazeSize[1], mazeSize[0]), dtype=numpy.uint8)
+    onPath = numpy.zeros((mazeSize[1], mazeSize[0]), dtype=bool)
+    onPath[path[:, 1], path[:, 0]] = True
+
+    steps = numpy.diff(path, axis=0)
+    for step, side, backSide in (((1, 0), RIGHTWALL, LEFTWALL), ((-1, 0), LEFTWALL, RIGHTWALL),
+                                 ((0, 1), BOTTOMWALL, TOPWALL), ((0, -1), TOPWALL, BOTTOMWALL)):
+        moving = (steps == step).all(axis=1)
+        # the cell the step leaves and the cell it enters
+        sides[path[:-1][moving, 1], path[:-1][moving, 0]] |= side
+        sides[path[1:][moving, 1], path[1:][moving, 0]] |= backSide
+
+    cellSides, insideX, insideY = pixelCells(sides, cellSize)
+    cellOnPath = numpy.repeat(numpy.repeat(onPath, cellSize, axis=0), cellSize, axis=1)
+
+    # distances from the center line of the cell
+    center = (cellSize - 1) / 2
+    halfWidth = max(cellSize / 8, 0.5)
+    nearX = numpy.abs(insideX - center) <= halfWidth
+    nearY = numpy.abs(insideY - center) <= halfWidth
+
+    return cellOnPath & ((nearX & nearY) |
+                         (((cellSides & RIGHTWALL) != 0) & nearY & (insideX >= center)) |
+                         (((cellSides & LEFTWALL) != 0) & nearY & (insideX <= center)) |
+                         (((cellSides & BOTTOMWALL) != 0) & nearX & (insideY >= center)) |
+                         (((cellSides & TOPWALL) != 0) & nearX & (insideY <= center)))
+
+def renderMaze(walls, cellSize, solution=False):
+    '''
+    Creates the image of a maze
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    cellSize: int
+        the pixel size of a cell
+
+    solution: bool
+        Whether to draw the path from the top left cell to the bottom right cell
+
+    Returns
+    -------
+    numpy.ndarray
+        The uint8 RGB pixels with the shape (y * cellSize, x * cellSize, 3)
+    '''
+    walls = numpy.asarray(walls, dtype=numpy.uint8)
+    height, width = walls.shape
+
+    image = numpy.empty((height * cellSize, width * cellSize, 3), dtype=numpy.uint8)
+    image[:] = BACKGROUNDCOLOR
+
+    if(solution):
+        path = astarPath(walls, [0, 0], [width - 1, height - 1])
+        if(path is not None): image[pathPixels(path, (width, height), cellSize)] = SOLUTIONCOLOR
+
+    image[wallPixels(walls, cellSize)] = WALLCOLOR
+    return image
+
+def saveImage(image, path):
+    '''
+    Saves an image as a PNG file
+
+    Parameters
+    ----------
+    image: numpy.ndarray
+        The uint8 RGB pixels with the shape (y, x, 3)
+
+    path: str
+        The file to write
+
+    Returns
+    -------
+    None
+    '''
+    # surfarray uses (x, y) arrays
+    pygame.image.save(pygame.surfarray.make_surface(image.transpose(1, 0, 2)), path)
+
+def exportMazes(count, mazeSize, algorithm, cellSize, outputDir, seed=None, solution=False):
+    '''
+    Generates mazes and saves each one as a PNG file
+
+    The mazes are generated in batches with MazeGenerator.generateBatch.
+
+    Parameters
+    ----------
+    count: int
+        The number of mazes
+
+    mazeSize: List<int>
+        The number of cells in each maze
+        [x, y]
+
+    algorithm: str
+        The algorithm that generates the mazes
+
+    cellSize: int
+        the pixel size of a cell
+
+    outputDir: str
+        The folder the images are saved in
+
+    seed: int or str
+        The seed of the mazes. If None different mazes are made every time.
+
+    solution: bool
+        Whether to draw the path from the top left cell to the bottom right cell
+
+    Returns
+    -------
+    List<str>
+        The paths of the saved images
+    '''
+    os.makedirs(outputDir, exist_ok=True)
+    generator = MazeGenerator(mazeSize, True, algorithm, seedIn=seed)
+
+    paths = []
+    while(len(paths) < count):
+        for walls in generator.generateBatch(min(BATCHSIZE, count - len(paths))):
+            path = os.path.join(outputDir, f'maze_{len(paths):05d}.png')
+            saveImage(renderMaze(walls, cellSize, solution), path)
+            paths.append(path)
+
+    return paths
+
+def main():
+    '''
+    Exports mazes from the command line
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    '''
+    parser = argparse.ArgumentParser(description='Save generated mazes as PNG images.')
+    parser.add_argument('--count', type=int, default=100, help='the number of mazes')
+    parser.add_argument('--size', default='20x12', help='the maze size like 20x12')
+    parser.add_argument('--algorithm', default='recursiveBacktracker', choices=list(ALGORITHMS))
+    parser.add_argument('--cell-size', type=int, default=20, help='the pixel size of a cell')
+    parser.add_argument('--seed', help='the seed of the mazes')
+    parser.add_argument('--solution', action='store_true', help='draw the path from the top left to the bottom right')
+    parser.add_argument('--output-dir', default='mazes', help='the folder the images are saved in')
+    args = parser.parse_args()
+
+    mazeSize = [int(value) for value in args.size.lower().split('x')]
+    paths = exportMazes(args.count, mazeSize, args.algorithm, args.cell_size, args.output_dir, args.seed, args.solution)
+    print(f'Saved {len(paths)} mazes to {args.output_dir}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,453 @@
+#-----------------------------------------------------------------------------
+# Maze files
+#
+# Mazes are saved in a dense binary format: a small header followed by the
+# walls of every cell as 4 bits, two cells per byte. The low 4 bits of a byte
+# are the even cell and the high 4 bits are the odd cell, cells are stored
+# row by row. Loading memory-maps the file so a huge maze opens instantly and
+# only the pages that are looked at are read from disk.
+#
+# Header (little-endian, 64 bytes)
+#   magic       4s   b'MAZE'
+#   version     H    2
+#   flags       H    1 if the seed is stored
+#   width       I    the x size of the maze
+#   height      I    the y size of the maze
+#   algorithm   32s  the name of the algorithm, padded with zeros
+#   seed        q    the seed of the maze
+#   checksum    I    the crc32 of the cell data
+#   reserved    4x
+#
+# Version 1 files have a 48 byte header with a 16 byte algorithm name
+# and can still be loaded.
+#-----------------------------------------------------------------------------
+
+import mmap
+import struct
+import zlib
+import numpy
+from maze_grid import MazeGrid, MazeGridView, WALLBITS
+
+MAGIC = b'MAZE'
+VERSION = 2
+# the header of every version that can be loaded
+# {version: struct.Struct}
+HEADERFORMATS = {1: struct.Struct('<4sHHII16sqI4x'),
+                 2: struct.Struct('<4sHHII32sqI4x')}
+HEADERFORMAT = HEADERFORMATS[VERSION]
+# the most bytes of an algorithm name that can be saved
+ALGORITHMSIZE = 32
+SEEDSTORED = 1
+
+def packWalls(walls):
+    '''
+    Packs wall masks into 4 bits per cell
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with any shape
+
+    Returns
+    -------
+    bytes
+        Two cells per byte, the even cell in the low 4 bits
+    '''
+    walls = numpy.ascontiguousarray(walls, dtype=numpy.uint8).ravel() & 0x0F
+
+    # add an empty cell so every byte has two cells
+    if(len(walls) % 2 == 1): walls = numpy.append(walls, numpy.uint8(0))
+
+    return (walls[0::2] | (walls[1::2] << 4)).tobytes()
+
+def unpackWalls(data, cellCount):
+    '''
+    Unpacks 4 bits per cell into wall masks
+
+    Parameters
+    ----------
+    data: bytes-like
+        The packed cells made by packWalls
+
+    cellCount: int
+        The number of cells to unpack
+
+    Returns
+    -------
+    numpy.ndarray
+        A flat uint8 array with one wall mask per cell
+    '''
+    packed = numpy.frombuffer(data, dtype=numpy.uint8, count=(cellCount + 1) // 2)
+
+    walls = numpy.empty(len(packed) * 2, dtype=numpy.uint8)
+    walls[0::2] = packed & 0x0F
+    walls[1::2] = packed >> 4
+    return walls[:cellCount]
+
+def saveMaze(path, grid, algorithm='', seed=None):
+    '''
+    Saves a maze to a file
+
+    Parameters
+    ----------
+    path: str
+        The path of the file. An existing file is replaced.
+
+    grid: MazeGrid or MappedMazeGrid
+        The maze to save
+
+    algorithm: str
+        The name of the algorithm that generated the maze. At most ALGORITHMSIZE ascii characters.
+
+    seed: int
+        The seed that generated the maze. Seeds that are not integers are not stored.
+
+    Returns
+    -------
+    None
+
+    Raises
+    -------
+    ValueError
+        If the algorithm name is not ascii or is longer than ALGORITHMSIZE characters
+    '''
+    # a name that does not fit is not cut short, the maze could not be regenerated from it
+    algorithmName = algorithm.encode('ascii')
+    if(len(algorithmName) > ALGORITHMSIZE):
+        raise ValueError(f'algorithm names can be at most {ALGORITHMSIZE} characters, {algorithm!r} is too long')
+
+    data = packWalls(grid.asArray())
+
+    flags = 0
+    if(isinstance(seed, int) and -2**63 <= seed < 2**63):
+        flags |= SEEDSTORED
+    else:
+        seed = 0
+
+    header = HEADERFORMAT.pack(MAGIC, VERSION, flags, grid.mazeSize[0], grid.mazeSize[1],
+                               algorithmName, seed, zlib.crc32(data))
+
+    with open(path, 'wb') as mazeFile:
+        mazeFile.write(header)
+        mazeFile.write(data)
+
+def readHeader(data):
+    '''
+    Reads the header of a maze file
+
+    Parameters
+    ----------
+    data: bytes-like
+        The start of the file
+
+    Returns
+    -------
+    Dictionary<string, dynamic>
+        {'mazeSize': (x, y), 'algorithm': str, 'seed': int or None, 'checksum': int, 'headerSize': int}
+
+    Raises
+    -------
+    ValueError
+        If the data is not a maze file or its version is not supported
+    '''
+    if(len(data) < 6):
+        raise ValueError('The file is too small to be a maze file')
+
+    # the magic and the version are in the same place in every version
+    magic, version = struct.unpack_from('<4sH', data)
+
+    if(magic != MAGIC):
+        raise ValueError('The file is not a maze file')
+    if(version not in HEADERFORMATS):
+        raise ValueError(f'Maze file version {version} is not supported')
+
+    headerFormat = HEADERFORMATS[version]
+    if(len(data) < headerFormat.size):
+        raise ValueError('The file is too small to be a maze file')
+
+    magic, version, flags, width, height, algorithm, seed, checksum = headerFormat.unpack_from(data)
+
+    return {
+        'mazeSize': (width, height),
+        'algorithm': algorithm.rstrip(b'\0').decode('ascii'),
+        'seed': seed if flags & SEEDSTORED else None,
+        'checksum': checksum,
+        'headerSize': headerFormat.size
+        }
+
+def loadMaze(path, mapped=True, verify=False):
+    '''
+    Loads a maze from a file
+
+    Parameters
+    ----------
+    path: str
+        The path of the file
+
+    mapped: bool
+        If True the file is memory-mapped and cells are read when they are looked at.
+        If False the whole maze is read into a MazeGrid.
+
+    verify: bool
+        If True the checksum is checked. This reads the whole file.
+
+    Returns
+    -------
+    MappedMazeGrid or MazeGrid
+        The loaded maze. Its header is stored in its header attribute.
+
+    Raises
+    -------
+    ValueError
+        If the file is not a maze file, is too short, or its checksum is wrong
+    '''
+    grid = MappedMazeGrid(path)
+
+    if(verify and not grid.verifyChecksum()):
+        grid.close()
+        raise ValueError(f'The checksum of {path} does not match its cells')
+
+    if(mapped): return grid
+
+    # copy the cells into a normal grid
+    loadedGrid = grid.copy()
+    grid.close()
+    return loadedGrid
+
+class MappedMazeGrid():
+    '''
+    MappedMazeGrid
+
+    A read-only maze that is read from a memory-mapped maze file.
+    It can be used anywhere a MazeGrid is read.
+
+    FUNCTIONS
+        __init__(self, pathIn)
+            Opens and memory-maps a maze file
+
+        getWalls(self, cellPos)
+            Returns the wall mask of a cell
+
+        hasWall(self, cellPos, direction)
+            Returns true if a cell has a wall in the given direction
+
+        isChecked(self, cellPos)
+            Returns true, every saved cell is part of the maze
+
+        asArray(self)
+            Returns the wall masks of every cell as a numpy array
+
+        getMemorySize(self)
+            Returns the number of bytes of cell data in the file
+
+        copy(self)
+            Returns the maze read into a MazeGrid that can be changed
+
+        verifyChecksum(self)
+            Returns true if the cell data matches the checksum in the header
+
+        view(self)
+            Returns a read-only view that can be indexed like a list of Cells
+
+        close(self)
+            Closes the file
+    '''
+    def __init__(self, pathIn):
+        '''
+        Initializes a MappedMazeGrid Object
+
+        Object contains the open file, the memory map of the file and its header.
+
+        Parameters
+        ----------
+        pathIn: str
+            The path of the maze file
+
+        Returns
+        -------
+        None
+
+        Raises
+        -------
+        ValueError
+            If the file is not a maze file or is too short
+        '''
+        self.file = open(pathIn, 'rb')
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.header = readHeader(self.data)
+        except (ValueError, OSError):
+            self.file.close()
+            raise
+
+        self.mazeSize = self.header['mazeSize']
+        self.cellCount = self.mazeSize[0] * self.mazeSize[1]
+        # where the cells start, after the header of the file's version
+        self.cellStart = self.header['headerSize']
+
+        if(len(self.data) < self.cellStart + (self.cellCount + 1) // 2):
+            self.close()
+            raise ValueError(f'{pathIn} is shorter than its header says')
+
+    def getWalls(self, cellPos):
+        '''
+        Gets the walls of a cell
+
+        Only the byte of this cell is read from the file.
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        Returns
+        -------
+        int
+          The wall mask of the cell. A combination of TOPWALL, BOTTOMWALL, RIGHTWALL and LEFTWALL
+        '''
+        index = cellPos[1] * self.mazeSize[0] + cellPos[0]
+        return (self.data[self.cellStart + (index >> 1)] >> ((index & 1) * 4)) & 0x0F
+
+    def hasWall(self, cellPos, direction):
+        '''
+        Determine if a cell has a wall
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        direction : int
+          The wall to look at. Uses the same keys as Cell.walls
+          -1: top, 1: bottom, 2: right, -2: left
+
+        Returns
+        -------
+        bool
+          True if the cell has a wall in that direction otherwise False
+        '''
+        return bool(self.getWalls(cellPos) & WALLBITS[direction])
+
+    def isChecked(self, cellPos):
+        '''
+        Determine if a cell has been checked
+
+        Saved mazes are finished so every cell has been checked.
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        Returns
+        -------
+        bool
+          Always True
+        '''
+        return True
+
+    def asArray(self):
+        '''
+        Gets the wall masks as a numpy array
+
+        The whole maze is read and unpacked into a new array.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        numpy.ndarray
+          A uint8 array with the shape (y, x)
+        '''
+        cells = self.data[self.cellStart:self.cellStart + (self.cellCount + 1) // 2]
+        return unpackWalls(cells, self.cellCount).reshape(self.mazeSize[1], self.mazeSize[0])
+
+    def getMemorySize(self):
+        '''
+        Gets the size of the cell data
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+          The number of bytes of cell data in the file
+        '''
+        return (self.cellCount + 1) // 2
+
+    def copy(self):
+        '''
+        Reads the maze into a MazeGrid
+
+        The whole maze is read. The copy can be changed and stays usable after the file is closed.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        MazeGrid
+          A grid with the same walls where every cell is checked. Its header is stored in its header attribute.
+        '''
+        grid = MazeGrid(self.mazeSize)
+        grid.asArray()[:] = self.asArray()
+        grid.fillChecked(True)
+        grid.header = self.header
+        return grid
+
+    def verifyChecksum(self):
+        '''
+        Determine if the cells match the checksum in the header
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+          True if the crc32 of the cell data matches the header otherwise False
+        '''
+        cells = self.data[self.cellStart:self.cellStart + (self.cellCount + 1) // 2]
+        return zlib.crc32(cells) == self.header['checksum']
+
+    def view(self):
+        '''
+        Gets a read-only view of the grid
+
+        The view can be indexed like the list of Cells made by MazeGenerator
+        maze[y][x].walls[direction]
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        MazeGridView
+          A read-only view of this grid
+        '''
+        return MazeGridView(self)
+
+    def close(self):
+        '''
+        Closes the memory map and the file
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        self.data.close()
+        self.file.close()
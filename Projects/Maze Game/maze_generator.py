@@ -1,4 +1,8 @@
 import random
+from maze_grid import MazeGrid, WALLBITS
+import maze_file
+from maze_algorithms import ALGORITHMS, ellerRows, generateBatch
+from maze_tiling import tiledMaze
 
 class Cell():
     '''
@@ -46,16 +50,37 @@ class MazeGenerator():
     An object that can store and generate new random mazes
     
     FUNCTIONS
-        __init__(self, mazeSizeIn)
+        __init__(self, mazeSizeIn, packedIn, algorithmIn, seedIn, cacheIn)
             Creates a new MazeGenerator with an initial value
             
         updateCell(self, cellPos, wallsIn, checkedIn)
             Updates the values stored in a cell object
         
-        generateMaze(self)
-            Generates a new random maze using recursive backtracking
+        generateMaze(self, algorithm, seed)
+            Generates a new random maze using the chosen algorithm
+        
+        continueStream(self, algorithm, seed)
+            Reseeds the random stream after a maze made from a seed
+        
+        generateTiledMaze(self, tileSize, maxWorkers, algorithm, seed)
+            Generates a new random maze in tiles on several CPU cores
+        
+        generateBatch(self, count, algorithm, seed)
+            Generates many mazes into one array
+        
+        loadGrid(self, gridIn)
+            Makes a MazeGrid the current maze
+        
+        streamMaze(self, endless)
+            Yields the rows of a new maze one at a time using Eller's algorithm
+        
+        saveMaze(self, path)
+            Saves the current maze to a maze file
+        
+        loadMaze(self, path, mapped)
+            Loads a maze file as the current maze
     '''
-    def __init__(self, mazeSizeIn):
+    def __init__(self, mazeSizeIn, packedIn=False, algorithmIn='recursiveBacktracker', seedIn=None, cacheIn=None):
         '''
         Initializes a MazeGenerator Object
 
@@ -67,6 +92,20 @@ class MazeGenerator():
         mazeSizeIn : List<int>
           A 2 element list for the x and y size of the maze.
           [x, y]
+          
+        packedIn : bool
+          If True the maze is stored in a compact MazeGrid instead of Cell Objects.
+          self.maze is then a read-only view that is indexed the same way.
+          
+        algorithmIn : str
+          The algorithm used by generateMaze. One of the keys of maze_algorithms.ALGORITHMS
+          'recursiveBacktracker', 'binaryTree', 'sidewinder', 'eller', 'kruskal' or 'wilson'
+          
+        seedIn : int or str
+          The seed of the generator's random stream. If None the stream is seeded randomly.
+          
+        cacheIn : MazeCache
+          A cache of mazes that is used when generateMaze is given a seed. Can be None.
 
         Returns
         -------
@@ -74,6 +113,18 @@ class MazeGenerator():
         '''
         
         self.mazeSize = mazeSizeIn
+        self.packed = packedIn
+        self.algorithm = algorithmIn
+        self.cache = cacheIn
+        
+        # Every generator has its own random stream so mazes can be regenerated from a seed
+        self.seed = seedIn
+        # the algorithm that made the current maze, saved with it by saveMaze
+        self.mazeAlgorithm = algorithmIn
+        self.random = random.Random(seedIn)
+        
+        # The compact storage of the maze, only used in packed mode
+        self.grid = None
         
         
     def updateCell(self, cellPos, wallsIn, checkedIn):
@@ -98,25 +149,86 @@ class MazeGenerator():
         IndexError
           If the mazeSize has less than 2 elements an Index error will be raised
         '''
+        # in packed mode the view is read-only so the grid is changed instead
+        # the same cell as self.maze[cellPos[0]][cellPos[1]] is updated
+        if(self.packed):
+            # a memory-mapped maze is read-only so it is copied into a MazeGrid first
+            if(isinstance(self.grid, maze_file.MappedMazeGrid)): self.loadGrid(self.grid.copy())
+            
+            mask = 0
+            for direction, bit in WALLBITS.items():
+                if(wallsIn[direction]): mask |= bit
+            self.grid.setWalls([cellPos[1], cellPos[0]], mask)
+            self.grid.setChecked([cellPos[1], cellPos[0]], checkedIn)
+            return
+        
         # Update the cell at position [x, y] with the new values
         self.maze[cellPos[0]][cellPos[1]].walls = wallsIn
         self.maze[cellPos[0]][cellPos[1]].checked = checkedIn
     
-    def generateMaze(self):
+    def generateMaze(self, algorithm=None, seed=None):
         '''
-        Generates a maze using a recursive backtracking algorithm.
+        Generates a maze using the chosen algorithm.
 
         Creates paths to each Cell in the maze using a recursive backtracking algorithm
         and updates the Cells walls values to reflect the paths in the maze.
+        The other algorithms in maze_algorithms.ALGORITHMS generate a MazeGrid
+        which is converted to Cells unless the generator is in packed mode.
+        
+        If a seed is given the random stream is reseeded so the same seed, size
+        and algorithm always make the same maze. If the generator has a cache
+        the maze is taken from it when it was generated before. Afterwards the
+        stream is in the same state whether or not the maze came from the cache.
 
         Parameters
         ----------
-        None
+        algorithm : str
+          The algorithm to use. If None the generator's algorithm is used.
+          'recursiveBacktracker', 'binaryTree', 'sidewinder', 'eller', 'kruskal' or 'wilson'
+          
+        seed : int or str
+          The seed of the maze. If None the generator's random stream continues.
 
         Returns
         -------
         None
+
+        Raises
+        -------
+        ValueError
+          If the algorithm is not one of the keys of maze_algorithms.ALGORITHMS
         '''
+        if(algorithm is None): algorithm = self.algorithm
+        
+        if(algorithm not in ALGORITHMS):
+            raise ValueError(f'algorithm must be one of {list(ALGORITHMS)}')
+        
+        # restart the random stream from the seed
+        # the seed and algorithm are remembered as those of the current maze
+        self.seed = seed
+        self.mazeAlgorithm = algorithm
+        if(seed is not None): self.random.seed(seed)
+        
+        # look for the maze in the cache
+        cacheKey = None
+        if(self.cache is not None and seed is not None):
+            cacheKey = self.cache.makeKey(self.mazeSize, algorithm, seed)
+            cachedGrid = self.cache.get(cacheKey)
+            
+            if(cachedGrid is not None):
+                self.loadGrid(cachedGrid)
+                self.continueStream(algorithm, seed)
+                return
+        
+        # packed mazes, cached mazes and the vectorized algorithms are generated into a MazeGrid
+        if(self.packed or algorithm != 'recursiveBacktracker' or cacheKey is not None):
+            grid = ALGORITHMS[algorithm](self.mazeSize, self.random)
+            if(cacheKey is not None): self.cache.put(cacheKey, grid)
+            
+            self.loadGrid(grid)
+            self.continueStream(algorithm, seed)
+            return
+        
         # Create a new maze of default cells
         self.maze = [[Cell() for i in range(self.mazeSize[0])] for j in range(self.mazeSize[1])]
         
@@ -175,7 +287,7 @@ class MazeGenerator():
             if(len(neighbourCells) > 0):
                 # choose a random neighbour
                 # ('direction', Cell position)
-                nextCell = random.choice(list(neighbourCells.items()))
+                nextCell = self.random.choice(list(neighbourCells.items()))
                 
                 # remove the walls of the current cell and the next cell
                 #  so that they connect to one another
@@ -188,4 +300,235 @@ class MazeGenerator():
             # if there are no neighbours
             else:
                 # remove this cell from the stack
-                cellsStack.pop()
\ No newline at end of file
+                cellsStack.pop()
+        
+        self.continueStream(algorithm, seed)
+    
+    def continueStream(self, algorithm, seed):
+        '''
+        Reseeds the random stream after a maze made from a seed.
+
+        A maze taken from the cache uses no random numbers, so the stream is
+        reseeded from the seed, size and algorithm instead of continuing from
+        wherever the generation left it. The next unseeded maze is then the same
+        whether or not the last maze came from the cache.
+
+        Parameters
+        ----------
+        algorithm : str
+          The algorithm that made the maze
+          
+        seed : int or str
+          The seed of the maze. If None the stream is not changed.
+
+        Returns
+        -------
+        None
+        '''
+        if(seed is None): return
+        self.random.seed(f'{int(self.mazeSize[0])}x{int(self.mazeSize[1])}:{algorithm}:{seed}:next')
+    
+    def generateTiledMaze(self, tileSize=(256, 256), maxWorkers=None, algorithm=None, seed=None):
+        '''
+        Generates a maze in tiles on several CPU cores.
+
+        The maze is split into tiles that are generated as separate perfect mazes
+        in a process pool and then joined by a random spanning tree over the tiles,
+        so the result is still a perfect maze. Meant for very large mazes.
+
+        Parameters
+        ----------
+        tileSize : List<int>
+          The x and y size of each tile
+          [x, y]
+          
+        maxWorkers : int
+          The number of processes to use. If None one is used for every CPU core.
+          
+        algorithm : str
+          The algorithm used for every tile. If None the generator's algorithm is used.
+          
+        seed : int or str
+          The seed of the maze. If None the generator's random stream continues.
+
+        Returns
+        -------
+        None
+
+        Raises
+        -------
+        ValueError
+          If the algorithm is not one of the keys of maze_algorithms.ALGORITHMS
+        '''
+        if(algorithm is None): algorithm = self.algorithm
+        
+        if(algorithm not in ALGORITHMS):
+            raise ValueError(f'algorithm must be one of {list(ALGORITHMS)}')
+        
+        # restart the random stream from the seed
+        # the seed and algorithm are remembered as those of the current maze
+        self.seed = seed
+        self.mazeAlgorithm = algorithm
+        if(seed is not None): self.random.seed(seed)
+        
+        self.loadGrid(tiledMaze(self.mazeSize, tileSize, algorithm, self.random, maxWorkers))
+        self.continueStream(algorithm, seed)
+    
+    def generateBatch(self, count, algorithm=None, seed=None):
+        '''
+        Generates many mazes of the generator's size into one array.
+
+        Binary Tree, Sidewinder and Eller's make every maze of the batch at once
+        with array operations. The other algorithms make the mazes one at a time.
+        The current maze is not changed.
+
+        Parameters
+        ----------
+        count : int
+          The number of mazes
+          
+        algorithm : str
+          The algorithm to use. If None the generator's algorithm is used.
+          
+        seed : int or str
+          The seed of the batch. If None the generator's random stream continues.
+
+        Returns
+        -------
+        numpy.ndarray
+          The uint8 wall masks of the mazes with the shape (count, y, x).
+          A combination of TOPWALL, BOTTOMWALL, RIGHTWALL and LEFTWALL from maze_grid
+
+        Raises
+        -------
+        ValueError
+          If the algorithm is not one of the keys of maze_algorithms.ALGORITHMS
+        '''
+        if(algorithm is None): algorithm = self.algorithm
+        
+        if(algorithm not in ALGORITHMS):
+            raise ValueError(f'algorithm must be one of {list(ALGORITHMS)}')
+        
+        # restart the random stream from the seed
+        if(seed is not None): self.random.seed(seed)
+        
+        return generateBatch(algorithm, count, self.mazeSize, self.random)
+    
+    def loadGrid(self, gridIn):
+        '''
+        Makes a MazeGrid the current maze.
+
+        In packed mode self.maze becomes a read-only view of the grid,
+        otherwise the grid is converted into Cell Objects.
+        A memory-mapped maze that was the current maze is closed.
+
+        Parameters
+        ----------
+        gridIn : MazeGrid
+          The maze to use
+
+        Returns
+        -------
+        None
+        '''
+        # close the file of the last memory-mapped maze
+        if(isinstance(self.grid, maze_file.MappedMazeGrid) and self.grid is not gridIn): self.grid.close()
+        
+        if(self.packed):
+            self.grid = gridIn
+            self.maze = gridIn.view()
+            return
+        
+        # Create a Cell Object with the same walls for every cell in the grid
+        self.grid = None
+        self.maze = [[Cell() for i in range(self.mazeSize[0])] for j in range(self.mazeSize[1])]
+        for y, row in enumerate(gridIn.view()):
+            for x, cell in enumerate(row):
+                self.maze[y][x].walls = dict(cell.walls)
+                self.maze[y][x].checked = cell.checked
+    
+    def streamMaze(self, endless=False):
+        '''
+        Yields the rows of a new maze one at a time.
+
+        Rows are generated lazily with Eller's algorithm so memory only depends on
+        the width of the maze. Nothing is stored in self.maze, the consumer
+        can write each row to a file or draw it as it arrives.
+
+        Parameters
+        ----------
+        endless : bool
+          If True rows are generated forever instead of stopping after mazeSize[1] rows.
+
+        Yields
+        -------
+        numpy.ndarray
+          The uint8 wall masks of each row, from top to bottom.
+          A combination of TOPWALL, BOTTOMWALL, RIGHTWALL and LEFTWALL from maze_grid
+        '''
+        height = None if endless else int(self.mazeSize[1])
+        yield from ellerRows(int(self.mazeSize[0]), height, self.random)
+    
+    def saveMaze(self, path):
+        '''
+        Saves the current maze to a maze file.
+
+        The walls are stored with 4 bits per cell along with the size,
+        the algorithm and the seed of the maze. See maze_file.
+
+        Parameters
+        ----------
+        path : str
+          The path of the file. An existing file is replaced.
+
+        Returns
+        -------
+        None
+        '''
+        grid = self.grid
+        
+        # Cell Objects are copied into a grid first
+        if(grid is None):
+            grid = MazeGrid(self.mazeSize)
+            for y, row in enumerate(self.maze):
+                for x, cell in enumerate(row):
+                    mask = 0
+                    for direction, bit in WALLBITS.items():
+                        if(cell.walls[direction]): mask |= bit
+                    grid.setWalls([x, y], mask)
+        
+        maze_file.saveMaze(path, grid, self.mazeAlgorithm, self.seed)
+    
+    def loadMaze(self, path, mapped=True):
+        '''
+        Loads a maze file as the current maze.
+
+        The size, algorithm and seed of the generator are set from the file.
+        In packed mode a memory-mapped file is used without reading it,
+        only the cells that are looked at are read from disk.
+
+        Parameters
+        ----------
+        path : str
+          The path of the file
+          
+        mapped : bool
+          If True the file is memory-mapped, otherwise it is read into a MazeGrid
+
+        Returns
+        -------
+        None
+
+        Raises
+        -------
+        ValueError
+          If the file is not a maze file or is too short
+        '''
+        grid = maze_file.loadMaze(path, mapped)
+        
+        self.mazeSize = grid.mazeSize
+        self.seed = grid.header['seed']
+        self.mazeAlgorithm = grid.header['algorithm']
+        if(grid.header['algorithm'] in ALGORITHMS): self.algorithm = grid.header['algorithm']
+        
+        self.loadGrid(grid)
@@ -0,0 +1,472 @@
+from collections.abc import Mapping
+import numpy
+
+# Bit flags for each of the four walls of a cell
+TOPWALL = 1
+BOTTOMWALL = 2
+RIGHTWALL = 4
+LEFTWALL = 8
+ALLWALLS = TOPWALL | BOTTOMWALL | RIGHTWALL | LEFTWALL
+
+# The bit flag of each wall using the same keys as Cell.walls
+# {direction: bit}
+WALLBITS = {-1: TOPWALL, 1: BOTTOMWALL, 2: RIGHTWALL, -2: LEFTWALL}
+
+class MazeGrid():
+    '''
+    MazeGrid
+
+    Compact storage for the walls of every cell in a maze.
+    The walls of each cell are stored as a 4-bit mask in one flat bytearray
+    and whether each cell has been checked is stored as one bit in a bitset.
+
+    FUNCTIONS
+        __init__(self, mazeSizeIn)
+            Creates a new grid where every cell has all four of its walls
+
+        getWalls(self, cellPos)
+            Returns the wall mask of a cell
+
+        setWalls(self, cellPos, wallsIn)
+            Changes the wall mask of a cell
+
+        hasWall(self, cellPos, direction)
+            Returns true if a cell has a wall in the given direction
+
+        removeWall(self, cellPos, direction)
+            Removes the wall between a cell and its neighbour
+
+        isChecked(self, cellPos)
+            Returns true if a cell has been checked by the algorithm
+
+        setChecked(self, cellPos, checkedIn)
+            Changes the checked value of a cell
+
+        fillChecked(self, checkedIn)
+            Changes the checked value of every cell
+
+        asArray(self)
+            Returns a numpy view of the wall masks
+
+        getMemorySize(self)
+            Returns the number of bytes used to store the grid
+
+        copy(self)
+            Returns a new grid with the same walls and checked values
+
+        view(self)
+            Returns a read-only view that can be indexed like a list of Cells
+    '''
+    def __init__(self, mazeSizeIn):
+        '''
+        Initializes a MazeGrid Object
+
+        Object contains the size of the maze, a bytearray with the wall mask of every
+        cell and a bytearray with one checked bit for every cell.
+        Every cell starts with all four walls and unchecked.
+
+        Parameters
+        ----------
+        mazeSizeIn : List<int>
+          A 2 element list for the x and y size of the maze.
+          [x, y]
+
+        Returns
+        -------
+        None
+        '''
+        self.mazeSize = (int(mazeSizeIn[0]), int(mazeSizeIn[1]))
+
+        cellCount = self.mazeSize[0] * self.mazeSize[1]
+
+        # One byte per cell, the low 4 bits are the walls
+        # cells are stored row by row: index = y * width + x
+        self.walls = bytearray([ALLWALLS]) * cellCount
+
+        # One bit per cell
+        self.checked = bytearray((cellCount + 7) // 8)
+
+    def getWalls(self, cellPos):
+        '''
+        Gets the walls of a cell
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        Returns
+        -------
+        int
+          The wall mask of the cell. A combination of TOPWALL, BOTTOMWALL, RIGHTWALL and LEFTWALL
+        '''
+        return self.walls[cellPos[1] * self.mazeSize[0] + cellPos[0]]
+
+    def setWalls(self, cellPos, wallsIn):
+        '''
+        Changes the walls of a cell
+
+        Only the given cell is changed, the walls of its neighbours are left as they are.
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        wallsIn : int
+          The new wall mask of the cell
+
+        Returns
+        -------
+        None
+        '''
+        self.walls[cellPos[1] * self.mazeSize[0] + cellPos[0]] = wallsIn & ALLWALLS
+
+    def hasWall(self, cellPos, direction):
+        '''
+        Determine if a cell has a wall
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        direction : int
+          The wall to look at. Uses the same keys as Cell.walls
+          -1: top, 1: bottom, 2: right, -2: left
+
+        Returns
+        -------
+        bool
+          True if the cell has a wall in that direction otherwise False
+        '''
+        return bool(self.getWalls(cellPos) & WALLBITS[direction])
+
+    def removeWall(self, cellPos, direction):
+        '''
+        Removes the wall between a cell and its neighbour
+
+        The wall of the cell and the opposite wall of the neighbour are both removed
+        so that the two cells connect to one another.
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        direction : int
+          The wall to remove. Uses the same keys as Cell.walls
+          -1: top, 1: bottom, 2: right, -2: left
+
+        Returns
+        -------
+        None
+
+        Raises
+        -------
+        IndexError
+          If the neighbour in that direction is outside of the maze
+        '''
+        # the position of the neighbour in that direction
+        # left and right are +-2, top and bottom are +-1
+        neighbourPos = [cellPos[0] + direction // 2 if abs(direction) == 2 else cellPos[0],
+                        cellPos[1] + direction if abs(direction) == 1 else cellPos[1]]
+
+        if(not (0 <= neighbourPos[0] < self.mazeSize[0] and 0 <= neighbourPos[1] < self.mazeSize[1])):
+            raise IndexError(f'{cellPos} has no neighbour in direction {direction}')
+
+        # clear the wall bit of both cells
+        self.walls[cellPos[1] * self.mazeSize[0] + cellPos[0]] &= ~WALLBITS[direction] & ALLWALLS
+        self.walls[neighbourPos[1] * self.mazeSize[0] + neighbourPos[0]] &= ~WALLBITS[-direction] & ALLWALLS
+
+    def isChecked(self, cellPos):
+        '''
+        Determine if a cell has been checked
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        Returns
+        -------
+        bool
+          True if the cell has been checked otherwise False
+        '''
+        index = cellPos[1] * self.mazeSize[0] + cellPos[0]
+        return bool(self.checked[index >> 3] & (1 << (index & 7)))
+
+    def setChecked(self, cellPos, checkedIn):
+        '''
+        Changes the checked value of a cell
+
+        Parameters
+        ----------
+        cellPos : List<int>
+          The x and y position of the cell in the maze.
+          [x, y]
+
+        checkedIn : bool
+          Whether or not the cell has been checked
+
+        Returns
+        -------
+        None
+        '''
+        index = cellPos[1] * self.mazeSize[0] + cellPos[0]
+        if(checkedIn):
+            self.checked[index >> 3] |= 1 << (index & 7)
+        else:
+            self.checked[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def fillChecked(self, checkedIn):
+        '''
+        Changes the checked value of every cell
+
+        Parameters
+        ----------
+        checkedIn : bool
+          Whether or not every cell has been checked
+
+        Returns
+        -------
+        None
+        '''
+        self.checked[:] = bytes([0xFF if checkedIn else 0]) * len(self.checked)
+
+    def asArray(self):
+        '''
+        Gets the wall masks as a numpy array
+
+        The array shares its memory with the grid so no data is copied,
+        and changes to the array change the grid.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        numpy.ndarray
+          A uint8 array with the shape (y, x)
+        '''
+        return numpy.frombuffer(self.walls, dtype=numpy.uint8).reshape(self.mazeSize[1], self.mazeSize[0])
+
+    def getMemorySize(self):
+        '''
+        Gets the memory used by the grid
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+          The number of bytes used to store the walls and the checked bits
+        '''
+        return len(self.walls) + len(self.checked)
+
+    def copy(self):
+        '''
+        Copies the grid
+
+        Changes to the copy do not change this grid.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        MazeGrid
+          A new grid with the same walls and checked values
+        '''
+        grid = MazeGrid(self.mazeSize)
+        grid.walls[:] = self.walls
+        grid.checked[:] = self.checked
+        return grid
+
+    def view(self):
+        '''
+        Gets a read-only view of the grid
+
+        The view can be indexed like the list of Cells made by MazeGenerator
+        maze[y][x].walls[direction]
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        MazeGridView
+          A read-only view of this grid
+        '''
+        return MazeGridView(self)
+
+class MazeGridView():
+    '''
+    MazeGridView
+
+    A read-only view of a MazeGrid that can be indexed like a list of rows of Cells.
+    maze[y][x].walls[direction] and maze[y][x].checked
+
+    FUNCTIONS
+        __init__(self, gridIn)
+            Creates a view of a grid
+
+        __len__(self)
+            Returns the number of rows in the maze
+
+        __getitem__(self, y)
+            Returns a view of a row of the maze
+
+        __iter__(self)
+            Iterates over the rows of the maze
+    '''
+    def __init__(self, gridIn):
+        '''
+        Initializes a MazeGridView Object
+
+        Parameters
+        ----------
+        gridIn : MazeGrid
+          The grid that will be viewed
+
+        Returns
+        -------
+        None
+        '''
+        self.grid = gridIn
+
+    def __len__(self):
+        return self.grid.mazeSize[1]
+
+    def __getitem__(self, y):
+        # range() handles negative indexes and raises the IndexError
+        return RowView(self.grid, range(self.grid.mazeSize[1])[y])
+
+    def __iter__(self):
+        for y in range(self.grid.mazeSize[1]):
+            yield RowView(self.grid, y)
+
+class RowView():
+    '''
+    RowView
+
+    A read-only view of one row of a MazeGrid.
+
+    FUNCTIONS
+        __init__(self, gridIn, yIn)
+            Creates a view of a row of a grid
+
+        __len__(self)
+            Returns the number of cells in the row
+
+        __getitem__(self, x)
+            Returns a view of a cell in the row
+
+        __iter__(self)
+            Iterates over the cells in the row
+    '''
+    def __init__(self, gridIn, yIn):
+        '''
+        Initializes a RowView Object
+
+        Parameters
+        ----------
+        gridIn : MazeGrid
+          The grid that will be viewed
+
+        yIn : int
+          The y position of the row in the maze
+
+        Returns
+        -------
+        None
+        '''
+        self.grid = gridIn
+        self.y = yIn
+
+    def __len__(self):
+        return self.grid.mazeSize[0]
+
+    def __getitem__(self, x):
+        return CellView(self.grid, range(self.grid.mazeSize[0])[x], self.y)
+
+    def __iter__(self):
+        for x in range(self.grid.mazeSize[0]):
+            yield CellView(self.grid, x, self.y)
+
+class CellView():
+    '''
+    CellView
+
+    A read-only view of one cell of a MazeGrid that behaves like a Cell.
+
+    FUNCTIONS
+        __init__(self, gridIn, xIn, yIn)
+            Creates a view of a cell of a grid
+    '''
+    def __init__(self, gridIn, xIn, yIn):
+        '''
+        Initializes a CellView Object
+
+        Parameters
+        ----------
+        gridIn : MazeGrid
+          The grid that will be viewed
+
+        xIn : int
+          The x position of the cell in the maze
+
+        yIn : int
+          The y position of the cell in the maze
+
+        Returns
+        -------
+        None
+        '''
+        self.walls = WallsView(gridIn.getWalls((xIn, yIn)))
+        self.checked = gridIn.isChecked((xIn, yIn))
+
+class WallsView(Mapping):
+    '''
+    WallsView
+
+    A read-only dictionary of the walls of a cell.
+    Uses the same keys as Cell.walls
+
+    FUNCTIONS
+        __init__(self, wallsIn)
+            Creates a view of a wall mask
+    '''
+    def __init__(self, wallsIn):
+        '''
+        Initializes a WallsView Object
+
+        Parameters
+        ----------
+        wallsIn : int
+          The wall mask of the cell
+
+        Returns
+        -------
+        None
+        '''
+        self.mask = wallsIn
+
+    def __getitem__(self, direction):
+        return bool(self.mask & WALLBITS[direction])
+
+    def __iter__(self):
+        return iter(WALLBITS)
+
+    def __len__(self):
+        return len(WALLBITS)
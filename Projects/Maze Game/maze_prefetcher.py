@@ -0,0 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+
+class MazePrefetcher():
+    '''
+    MazePrefetcher
+
+    Builds the next maze in a background thread while the current round is played.
+    The finished maze is handed over in one step so the frame loop never waits
+    on maze generation unless the next maze is needed before it is done.
+
+    FUNCTIONS
+        __init__(self, buildMazeIn)
+            Creates a prefetcher with the function that builds a maze
+
+        prefetch(self, seed)
+            Starts building a maze in the background
+
+        isReady(self)
+            Returns true if the prefetched maze is finished
+
+        take(self, seed)
+            Returns the prefetched maze, or builds one if there is none for that seed
+
+        shutdown(self)
+            Stops the background thread
+    '''
+    def __init__(self, buildMazeIn):
+        '''
+        Initializes a MazePrefetcher Object
+
+        Object contains the function that builds a maze and a single worker
+        thread that runs it.
+
+        Parameters
+        ----------
+        buildMazeIn: function(seed)
+            Builds a maze and everything needed to play it. Runs in the worker thread
+            so it must not change anything the frame loop is using.
+
+        Returns
+        -------
+        None
+        '''
+        self.buildMaze = buildMazeIn
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        # the maze being built and the seed it was built with
+        self.future = None
+        self.futureSeed = None
+
+    def prefetch(self, seed=None):
+        '''
+        Starts building a maze in the background
+
+        A maze that was prefetched before and not taken is thrown away.
+
+        Parameters
+        ----------
+        seed: int or str
+            The seed of the maze. If None a new random maze is made.
+
+        Returns
+        -------
+        None
+        '''
+        if(self.future is not None): self.future.cancel()
+
+        self.future = self.executor.submit(self.buildMaze, seed)
+        self.futureSeed = seed
+
+    def isReady(self):
+        '''
+        Determine if the prefetched maze is finished
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            True if a prefetched maze is finished otherwise False
+        '''
+        return self.future is not None and self.future.done()
+
+    def take(self, seed=None):
+        '''
+        Gets the prefetched maze
+
+        If a maze was prefetched with the same seed it is returned, waiting for it
+        to finish if needed. Otherwise a maze is built right away.
+
+        Parameters
+        ----------
+        seed: int or str
+            The seed of the maze. If None a new random maze is made.
+
+        Returns
+        -------
+        dynamic
+            Whatever buildMaze returned
+        '''
+        future, futureSeed = self.future, self.futureSeed
+        self.future, self.futureSeed = None, None
+
+        # use the prefetched maze if it was built with the right seed
+        if(future is not None and futureSeed == seed and not future.cancelled()):
+            return future.result()
+
+        if(future is not None): future.cancel()
+        return self.buildMaze(seed)
+
+    def shutdown(self):
+        '''
+        Stops the background thread
+
+        A maze that has not started building is cancelled.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        self.future = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,133 @@
+#-----------------------------------------------------------------------------
+# Maze solving
+#
+# Path finding over the wall masks of a maze (MazeGrid.asArray()).
+# distanceField runs a breadth-first search one whole frontier at a time with
+# array operations. astarPath finds a single path between two cells.
+# Cells outside of the maze are never reached because the outer walls of a
+# maze are always closed.
+#-----------------------------------------------------------------------------
+
+import heapq
+import numpy
+from maze_grid import TOPWALL, BOTTOMWALL, RIGHTWALL, LEFTWALL
+
+def distanceField(walls, startCells):
+    '''
+    Finds the path distance from the start cells to every cell
+
+    The search moves outwards one step at a time. Every step handles the whole
+    frontier of cells at once with array operations.
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    startCells: List<int> or List<List<int>>
+        The x and y position of the start cell, or a list of start cells
+        [x, y] or [[x, y], ...]
+
+    Returns
+    -------
+    numpy.ndarray
+        An int32 array with the shape (y, x). The number of steps from the closest
+        start cell to each cell, or -1 if the cell cannot be reached.
+    '''
+    height, width = walls.shape
+    flatWalls = walls.ravel()
+
+    # accept one cell or a list of cells
+    startCells = numpy.asarray(startCells, dtype=numpy.int64).reshape(-1, 2)
+    frontier = numpy.unique(startCells[:, 1] * width + startCells[:, 0])
+
+    distances = numpy.full(height * width, -1, dtype=numpy.int32)
+    distances[frontier] = 0
+
+    # (wall that blocks the move, change in the flat index)
+    moves = ((RIGHTWALL, 1), (LEFTWALL, -1), (BOTTOMWALL, width), (TOPWALL, -width))
+
+    distance = 0
+    while(len(frontier) > 0):
+        distance += 1
+        frontierWalls = flatWalls[frontier]
+
+        nextFrontier = []
+        for wall, offset in moves:
+            # neighbours that are open and have not been reached yet
+            neighbours = frontier[(frontierWalls & wall) == 0] + offset
+            neighbours = neighbours[distances[neighbours] < 0]
+
+            distances[neighbours] = distance
+            nextFrontier.append(neighbours)
+
+        frontier = numpy.concatenate(nextFrontier)
+
+    return distances.reshape(height, width)
+
+def astarPath(walls, startCell, goalCell):
+    '''
+    Finds the shortest path between two cells using A*
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    startCell: List<int>
+        The x and y position of the start cell
+        [x, y]
+
+    goalCell: List<int>
+        The x and y position of the goal cell
+        [x, y]
+
+    Returns
+    -------
+    List<List<int>> or None
+        The cells of the path from the start to the goal, including both.
+        None if the goal cannot be reached.
+    '''
+    height, width = walls.shape
+    flatWalls = walls.ravel().tolist()
+
+    start = int(startCell[1]) * width + int(startCell[0])
+    goal = int(goalCell[1]) * width + int(goalCell[0])
+    goalX, goalY = int(goalCell[0]), int(goalCell[1])
+
+    # (wall that blocks the move, change in the flat index)
+    moves = ((RIGHTWALL, 1), (LEFTWALL, -1), (BOTTOMWALL, width), (TOPWALL, -width))
+
+    # the cell each cell was reached from and the steps it took to reach it
+    cameFrom = {start: None}
+    steps = {start: 0}
+
+    # (steps + distance left to the goal, steps, cell)
+    openCells = [(abs(start % width - goalX) + abs(start // width - goalY), 0, start)]
+
+    while(len(openCells) > 0):
+        estimate, cellSteps, cell = heapq.heappop(openCells)
+
+        if(cell == goal):
+            # follow the cells back to the start
+            path = []
+            while(cell is not None):
+                path.append([cell % width, cell // width])
+                cell = cameFrom[cell]
+            path.reverse()
+            return path
+
+        # skip cells that were reached faster after being added
+        if(cellSteps > steps[cell]): continue
+
+        for wall, offset in moves:
+            if(flatWalls[cell] & wall): continue
+
+            neighbour = cell + offset
+            if(neighbour not in steps or cellSteps + 1 < steps[neighbour]):
+                steps[neighbour] = cellSteps + 1
+                cameFrom[neighbour] = cell
+                remaining = abs(neighbour % width - goalX) + abs(neighbour // width - goalY)
+                heapq.heappush(openCells, (cellSteps + 1 + remaining, cellSteps + 1, neighbour))
+
+    return None
@@ -0,0 +1,133 @@
+#-----------------------------------------------------------------------------
+# Tiled maze generation
+#
+# A very large maze is split into tiles and every tile is generated as its own
+# perfect maze in a separate process. The tiles are then joined by a random
+# spanning tree over the tile graph: each pair of neighbouring tiles in the tree
+# gets exactly one opening in the wall between them. Every tile is a tree and
+# the tiles are joined like a tree, so the whole maze is still a perfect maze.
+#-----------------------------------------------------------------------------
+
+from concurrent.futures import ProcessPoolExecutor
+import random
+import numpy
+from maze_grid import MazeGrid
+from maze_algorithms import ALGORITHMS
+
+def generateTile(tileInfo):
+    '''
+    Generates the maze of one tile
+
+    Runs in a worker process so it only takes and returns simple values.
+
+    Parameters
+    ----------
+    tileInfo: tuple
+        (width, height, algorithm, seed) of the tile
+
+    Returns
+    -------
+    bytes
+        The wall masks of the tile, row by row
+    '''
+    width, height, algorithm, seed = tileInfo
+    return bytes(ALGORITHMS[algorithm]((width, height), random.Random(seed)).walls)
+
+def tiledMaze(mazeSize, tileSize, algorithm, randomSource, maxWorkers=None):
+    '''
+    Generates a maze in tiles on several CPU cores
+
+    Parameters
+    ----------
+    mazeSize: List<int>
+        The x and y size of the maze
+        [x, y]
+
+    tileSize: List<int>
+        The x and y size of each tile. Tiles on the right and bottom edges can be smaller.
+        [x, y]
+
+    algorithm: str
+        The algorithm used for every tile. One of the keys of maze_algorithms.ALGORITHMS
+
+    randomSource: random or random.Random()
+        The source of the seeds of the tiles and of the openings between them
+
+    maxWorkers: int
+        The number of processes to use. If None one is used for every CPU core.
+        If 1 the tiles are generated in this process.
+
+    Returns
+    -------
+    MazeGrid
+        The generated maze
+
+    Raises
+    -------
+    ValueError
+        If the algorithm is not one of the keys of maze_algorithms.ALGORITHMS
+    '''
+    if(algorithm not in ALGORITHMS):
+        raise ValueError(f'algorithm must be one of {list(ALGORITHMS)}')
+
+    width, height = int(mazeSize[0]), int(mazeSize[1])
+    tileWidth, tileHeight = max(1, int(tileSize[0])), max(1, int(tileSize[1]))
+
+    # the top-left corner of every column and row of tiles
+    tileXs = list(range(0, width, tileWidth))
+    tileYs = list(range(0, height, tileHeight))
+
+    # GENERATE THE TILES
+    # (width, height, algorithm, seed) of every tile, row by row
+    tiles = []
+    for tileY in tileYs:
+        for tileX in tileXs:
+            tiles.append((min(tileWidth, width - tileX), min(tileHeight, height - tileY),
+                          algorithm, randomSource.getrandbits(64)))
+
+    if(maxWorkers == 1 or len(tiles) == 1):
+        tileWalls = [generateTile(tile) for tile in tiles]
+    else:
+        with ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+            tileWalls = list(executor.map(generateTile, tiles))
+
+    # copy every tile into its place in the maze
+    grid = MazeGrid((width, height))
+    walls = grid.asArray()
+    for i, tileBytes in enumerate(tileWalls):
+        tileX, tileY = tileXs[i % len(tileXs)], tileYs[i // len(tileXs)]
+        tileW, tileH = tiles[i][0], tiles[i][1]
+        walls[tileY:tileY + tileH, tileX:tileX + tileW] = numpy.frombuffer(tileBytes, dtype=numpy.uint8).reshape(tileH, tileW)
+
+    # JOIN THE TILES
+    # every pair of neighbouring tiles: (tile index, neighbour index, direction)
+    tileEdges = []
+    for row in range(len(tileYs)):
+        for column in range(len(tileXs)):
+            index = row * len(tileXs) + column
+            if(column + 1 < len(tileXs)): tileEdges.append((index, index + 1, 2))
+            if(row + 1 < len(tileYs)): tileEdges.append((index, index + len(tileXs), 1))
+    randomSource.shuffle(tileEdges)
+
+    # random spanning tree of the tiles using a union-find
+    parent = list(range(len(tiles)))
+    for index, neighbourIndex, direction in tileEdges:
+        a = index
+        while(parent[a] != a): a = parent[a]
+        b = neighbourIndex
+        while(parent[b] != b): b = parent[b]
+
+        # the tiles are already connected
+        if(a == b): continue
+        parent[b] = a
+
+        # open one random cell on the border the two tiles share
+        tileX, tileY = tileXs[index % len(tileXs)], tileYs[index // len(tileXs)]
+        tileW, tileH = tiles[index][0], tiles[index][1]
+        if(direction == 2):
+            grid.removeWall([tileX + tileW - 1, tileY + randomSource.randrange(tileH)], 2)
+        else:
+            grid.removeWall([tileX + randomSource.randrange(tileW), tileY + tileH - 1], 1)
+
+    grid.fillChecked(True)
+    return grid
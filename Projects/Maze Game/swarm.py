@@ -0,0 +1,376 @@
+#-----------------------------------------------------------------------------
+# Swarm simulation
+#
+# Moves many balls through a maze at once. The positions, directions, speeds
+# and radii of the balls are stored in numpy arrays (one row per ball) and
+# every step resolves all of them against the walls with array operations.
+#
+# The walls are an array of rectangles with four strips per cell, in the same
+# place makeWalls would put them. A ball smaller than half a cell can only
+# overlap a 2x2 block of cells, so each ball is checked against 16 rectangles.
+#
+# Usage:
+#   python swarm.py --agents 1000 --size 100x100 --steps 600
+#-----------------------------------------------------------------------------
+
+import numpy
+import pygame
+from maze_grid import TOPWALL, BOTTOMWALL, RIGHTWALL, LEFTWALL
+
+# left, right, up and down as [x, y]
+DIRECTIONS = numpy.array([[-1, 0], [1, 0], [0, -1], [0, 1]], dtype=numpy.float64)
+
+def cellWallRectangles(walls, startingPos, cellSize):
+    '''
+    Creates the wall rectangles of every cell
+
+    Parameters
+    ----------
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    startingPos: List<int>
+        The top left corner of the maze
+
+    cellSize: int
+        the pixel size of a cell
+
+    Returns
+    -------
+    numpy.ndarray
+        The rectangles with the shape (y, x, 4, 4). The third axis is the left, right,
+        top and bottom wall and the last axis is [left, top, right, bottom].
+
+    numpy.ndarray
+        A bool array with the shape (y, x, 4) that is True where the wall exists
+    '''
+    walls = numpy.asarray(walls, dtype=numpy.uint8)
+    height, width = walls.shape
+    thickness = cellSize * 0.1
+    far = cellSize - thickness
+
+    # the top left corner of every cell
+    left = numpy.broadcast_to(numpy.arange(width) * cellSize + startingPos[0], (height, width))
+    top = numpy.broadcast_to((numpy.arange(height) * cellSize + startingPos[1])[:, numpy.newaxis], (height, width))
+
+    rectangles = numpy.empty((height, width, 4, 4), dtype=numpy.float64)
+    # LEFT WALL
+    rectangles[:, :, 0] = numpy.stack((left, top, left + thickness, top + cellSize), axis=-1)
+    # RIGHT WALL
+    rectangles[:, :, 1] = numpy.stack((left + far, top, left + far + thickness, top + cellSize), axis=-1)
+    # TOP WALL
+    rectangles[:, :, 2] = numpy.stack((left, top, left + cellSize, top + thickness), axis=-1)
+    # BOTTOM WALL
+    rectangles[:, :, 3] = numpy.stack((left, top + far, left + cellSize, top + far + thickness), axis=-1)
+
+    present = numpy.stack((walls & LEFTWALL, walls & RIGHTWALL, walls & TOPWALL, walls & BOTTOMWALL), axis=-1) != 0
+
+    return rectangles, present
+
+def randomCellCenters(count, mazeSize, startingPos, cellSize, generator):
+    '''
+    Picks random cells and finds their centers
+
+    Parameters
+    ----------
+    count: int
+        The number of positions
+
+    mazeSize: List<int>
+        The number of cells in the maze
+        [x, y]
+
+    startingPos: List<int>
+        The top left corner of the maze
+
+    cellSize: int
+        the pixel size of a cell
+
+    generator: numpy.random.Generator
+        The source of the random cells
+
+    Returns
+    -------
+    numpy.ndarray
+        The positions with the shape (count, 2)
+    '''
+    cells = generator.integers(0, mazeSize, size=(count, 2))
+    return cells * cellSize + cellSize * 0.5 + numpy.asarray(startingPos, dtype=numpy.float64)
+
+class BallSwarm():
+    '''
+    BallSwarm
+
+    Many balls that move through a maze together.
+    Every value is a numpy array with one row for every ball.
+
+    FUNCTIONS
+        __init__(self, positionsIn, radiusIn, speedIn)
+            Creates the swarm with initial positions
+
+        __len__(self)
+            Returns the number of balls
+
+        setMaze(self, walls, startingPos, cellSize)
+            Creates the wall rectangles the balls collide with
+
+        setDirections(self, directionsIn)
+            Changes the direction of every ball
+
+        wander(self, generator, turnChance)
+            Turns the balls that hit a wall and some random balls
+
+        resolve(self, positions)
+            Moves balls that collide with a wall out of it
+
+        step(self, deltatime)
+            Moves every ball and resolves its collisions
+
+        draw(self, surfaceIn, colorIn)
+            Draws every ball as a circle on a surface
+    '''
+    def __init__(self, positionsIn, radiusIn, speedIn=100):
+        '''
+        Initializes a BallSwarm Object
+
+        Object contains the position, direction, speed and size of every ball.
+
+        Parameters
+        ----------
+        positionsIn: numpy.ndarray
+            The x-y position of every ball with the shape (count, 2)
+
+        radiusIn: float or numpy.ndarray
+            The radius of the balls, the same for all or one for every ball
+
+        speedIn: float or numpy.ndarray
+            The speed of the balls in pixels per second, the same for all or one for every ball
+
+        Returns
+        -------
+        None
+        '''
+        self.positions = numpy.array(positionsIn, dtype=numpy.float64).reshape(-1, 2)
+        count = len(self.positions)
+
+        self.radii = numpy.broadcast_to(numpy.asarray(radiusIn, dtype=numpy.float64), (count,)).copy()
+        self.speeds = numpy.broadcast_to(numpy.asarray(speedIn, dtype=numpy.float64), (count,)).copy()
+        self.directions = numpy.zeros((count, 2), dtype=numpy.float64)
+
+        # True for the balls that hit a wall in the last step
+        self.colliding = numpy.zeros(count, dtype=bool)
+
+        self.rectangles = None
+        self.present = None
+
+    def __len__(self):
+        return len(self.positions)
+
+    def setMaze(self, walls, startingPos, cellSize):
+        '''
+        Creates the wall rectangles the balls collide with
+
+        Parameters
+        ----------
+        walls: numpy.ndarray
+            The uint8 wall masks of the maze with the shape (y, x)
+
+        startingPos: List<int>
+            The top left corner of the maze
+
+        cellSize: int
+            the pixel size of a cell
+
+        Returns
+        -------
+        None
+
+        Raises
+        -------
+        ValueError
+            If a ball is not smaller than half a cell
+        '''
+        # a ball must fit in a 2x2 block of cells, including the 1 pixel the snapping adds
+        if(len(self.radii) > 0 and (self.radii.max() + 1) * 2 >= cellSize):
+            raise ValueError('Every ball must be smaller than half a cell')
+
+        self.rectangles, self.present = cellWallRectangles(walls, startingPos, cellSize)
+        self.startingPos = numpy.asarray(startingPos, dtype=numpy.float64)
+        self.cellSize = cellSize
+
+    def setDirections(self, directionsIn):
+        '''
+        Changes the direction of every ball
+
+        Parameters
+        ----------
+        directionsIn: numpy.ndarray
+            The direction of every ball with the shape (count, 2)
+
+        Returns
+        -------
+        None
+        '''
+        self.directions[:] = directionsIn
+
+    def wander(self, generator, turnChance=0.02):
+        '''
+        Turns the balls that hit a wall and some random balls
+
+        Each ball that turns picks a new direction from left, right, up and down.
+
+        Parameters
+        ----------
+        generator: numpy.random.Generator
+            The source of the random turns
+
+        turnChance: float
+            The chance that a ball that did not hit a wall turns
+
+        Returns
+        -------
+        None
+        '''
+        turning = self.colliding | (generator.random(len(self)) < turnChance)
+        self.directions[turning] = DIRECTIONS[generator.integers(0, 4, int(turning.sum()))]
+
+    def resolve(self, positions):
+        '''
+        Moves balls that collide with a wall out of it
+
+        Works like Wall.isColliding for every ball at once. Each ball is snapped out of
+        the first wall it collides with, checking its cells row by row and the walls of
+        a cell in the order left, right, top, bottom.
+
+        Parameters
+        ----------
+        positions: numpy.ndarray
+            The positions to check with the shape (count, 2)
+
+        Returns
+        -------
+        numpy.ndarray
+            The new positions with the shape (count, 2)
+
+        numpy.ndarray
+            A bool array that is True for the balls that collided with a wall
+
+        Raises
+        -------
+        ValueError
+            If setMaze has not been called
+        '''
+        if(self.rectangles is None): raise ValueError('No walls are initialized')
+
+        height, width = self.present.shape[:2]
+        radii = self.radii[:, numpy.newaxis]
+
+        # the first and last cell each ball overlaps on each axis
+        relative = positions - self.startingPos
+        first = numpy.floor((relative - radii - 1) / self.cellSize).astype(numpy.int64)
+        last = numpy.floor((relative + radii + 1) / self.cellSize).astype(numpy.int64)
+        limits = numpy.array([width - 1, height - 1])
+        first = numpy.clip(first, 0, limits)
+        last = numpy.clip(last, 0, limits)
+
+        # the 2x2 block of cells, row by row
+        second = numpy.minimum(first + 1, last)
+        cellX = numpy.stack((first[:, 0], second[:, 0], first[:, 0], second[:, 0]), axis=1)
+        cellY = numpy.stack((first[:, 1], first[:, 1], second[:, 1], second[:, 1]), axis=1)
+
+        # the 16 wall rectangles near each ball
+        count = len(positions)
+        rectangles = self.rectangles[cellY, cellX].reshape(count, 16, 4)
+        present = self.present[cellY, cellX].reshape(count, 16)
+        wallLeft, wallTop, wallRight, wallBottom = numpy.moveaxis(rectangles, -1, 0)
+
+        x = positions[:, 0:1]
+        y = positions[:, 1:2]
+
+        # the same checks as Wall.isColliding
+        # a ball left of, right of or between the edges of every wall
+        isLeft = x < wallLeft
+        isRight = x > wallRight
+        hitX = numpy.where(isLeft, x + radii > wallLeft, numpy.where(isRight, x - radii < wallRight, True))
+        snappedX = numpy.where(isLeft, wallLeft - radii - 1, numpy.where(isRight, wallRight + radii + 1, x))
+
+        # a ball above, below or between the edges of every wall
+        isAbove = y < wallTop
+        isBelow = y > wallBottom
+        hitY = numpy.where(isAbove, y + radii > wallTop, numpy.where(isBelow, y - radii < wallBottom, True))
+        snappedY = numpy.where(isAbove, wallTop - radii - 1, numpy.where(isBelow, wallBottom + radii + 1, y))
+
+        hits = hitX & hitY & present
+        colliding = hits.any(axis=1)
+
+        # snap to the first wall each ball hit
+        firstHit = hits.argmax(axis=1)
+        balls = numpy.arange(count)
+        snapped = numpy.column_stack((snappedX[balls, firstHit], snappedY[balls, firstHit]))
+
+        return numpy.where(colliding[:, numpy.newaxis], snapped, positions), colliding
+
+    def step(self, deltatime):
+        '''
+        Moves every ball and resolves its collisions
+
+        Parameters
+        ----------
+        deltatime: float
+            The time that has elapsed since the last step
+
+        Returns
+        -------
+        None
+        '''
+        positions = self.positions + self.directions * (self.speeds * deltatime)[:, numpy.newaxis]
+        self.positions, self.colliding = self.resolve(positions)
+
+    def draw(self, surfaceIn, colorIn):
+        '''
+        Draws every ball as a circle
+
+        Parameters
+        ----------
+        surfaceIn: pygame.Surface()
+            The surface that the balls will be drawn onto
+
+        colorIn: pygame.Color() or (r, g, b)
+            The color of the balls
+
+        Returns
+        -------
+        None
+        '''
+        for position, radius in zip(self.positions.tolist(), self.radii.tolist()):
+            pygame.draw.circle(surfaceIn, colorIn, position, radius)
+
+if __name__ == '__main__':
+    import argparse
+    import time
+    from maze_generator import MazeGenerator
+
+    parser = argparse.ArgumentParser(description='Simulate a swarm of balls wandering through a maze.')
+    parser.add_argument('--agents', type=int, default=1000, help='the number of balls')
+    parser.add_argument('--size', default='100x100', help='the maze size like 20x12')
+    parser.add_argument('--steps', type=int, default=600, help='the number of steps to simulate')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    mazeSize = [int(value) for value in args.size.lower().split('x')]
+    cellSize = 20
+    generator = MazeGenerator(mazeSize, True, 'kruskal', seedIn=args.seed)
+    generator.generateMaze()
+
+    randomGenerator = numpy.random.default_rng(args.seed)
+    swarm = BallSwarm(randomCellCenters(args.agents, mazeSize, [0, 0], cellSize, randomGenerator), 5)
+    swarm.setMaze(generator.grid.asArray(), [0, 0], cellSize)
+
+    startTime = time.perf_counter()
+    for i in range(args.steps):
+        swarm.wander(randomGenerator)
+        swarm.step(1 / 120)
+    elapsed = time.perf_counter() - startTime
+
+    print(f'{args.agents} balls, {args.steps} steps in {elapsed:.2f} s '
+          f'({args.agents * args.steps / elapsed:,.0f} ball steps/s)')
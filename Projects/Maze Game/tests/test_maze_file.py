@@ -0,0 +1,51 @@
+import struct
+import zlib
+import pytest
+import maze_file
+from maze_algorithms import ALGORITHMS
+from maze_generator import MazeGenerator
+
+def test_every_algorithm_name_fits():
+    for algorithm in ALGORITHMS:
+        assert len(algorithm.encode('ascii')) <= maze_file.ALGORITHMSIZE
+
+@pytest.mark.parametrize('mapped', [True, False])
+def test_saved_recursive_backtracker_maze_regenerates_from_header(tmp_path, mapped):
+    path = str(tmp_path / 'backtracker.maze')
+    generator = MazeGenerator([12, 9], True)
+    generator.generateMaze(seed=5)
+    generator.saveMaze(path)
+
+    loaded = MazeGenerator([1, 1], True)
+    loaded.loadMaze(path, mapped)
+    assert loaded.mazeAlgorithm == 'recursiveBacktracker'
+    assert loaded.seed == 5
+
+    regenerated = MazeGenerator(loaded.mazeSize, True)
+    regenerated.generateMaze(algorithm=loaded.mazeAlgorithm, seed=loaded.seed)
+    assert (regenerated.grid.asArray() == generator.grid.asArray()).all()
+    assert (loaded.grid.asArray() == generator.grid.asArray()).all()
+
+    if(mapped): loaded.grid.close()
+
+def test_long_algorithm_name_raises(tmp_path):
+    generator = MazeGenerator([4, 4], True)
+    generator.generateMaze(seed=1)
+
+    with pytest.raises(ValueError):
+        maze_file.saveMaze(str(tmp_path / 'long.maze'), generator.grid, 'a' * (maze_file.ALGORITHMSIZE + 1))
+
+def test_version_one_file_loads(tmp_path):
+    generator = MazeGenerator([7, 5], True, 'kruskal')
+    generator.generateMaze(seed=3)
+    data = maze_file.packWalls(generator.grid.asArray())
+
+    # a file written with the old 48 byte header
+    path = tmp_path / 'old.maze'
+    path.write_bytes(struct.pack('<4sHHII16sqI4x', maze_file.MAGIC, 1, maze_file.SEEDSTORED, 7, 5,
+                                 b'kruskal', 3, zlib.crc32(data)) + data)
+
+    grid = maze_file.loadMaze(str(path), verify=True)
+    assert grid.header['algorithm'] == 'kruskal'
+    assert (grid.asArray() == generator.grid.asArray()).all()
+    grid.close()
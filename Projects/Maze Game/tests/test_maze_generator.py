@@ -0,0 +1,38 @@
+import pytest
+from maze_generator import MazeGenerator
+
+def mazeAfterTiledMaze(seed, warmUp):
+    generator = MazeGenerator([24, 16], True, 'kruskal')
+    # use some of the random stream first so only the seed can make the mazes match
+    for i in range(warmUp):
+        generator.generateMaze()
+
+    generator.generateTiledMaze(tileSize=(8, 8), maxWorkers=1, seed=seed)
+    tiled = generator.grid.asArray().copy()
+    generator.generateMaze()
+    return tiled, generator.grid.asArray().copy()
+
+def test_maze_after_seeded_tiled_maze_is_reproducible():
+    firstTiled, firstNext = mazeAfterTiledMaze(7, 0)
+    secondTiled, secondNext = mazeAfterTiledMaze(7, 3)
+
+    assert (firstTiled == secondTiled).all()
+    assert (firstNext == secondNext).all()
+
+    # the stream continues from the seed like it does after generateMaze
+    reference = MazeGenerator([24, 16], True, 'kruskal')
+    reference.continueStream('kruskal', 7)
+    reference.generateMaze()
+    assert (firstNext == reference.grid.asArray()).all()
+
+def test_tiled_maze_with_bad_algorithm_keeps_state():
+    generator = MazeGenerator([16, 16], True, 'kruskal', seedIn=4)
+    generator.generateMaze(seed=2)
+    state = generator.random.getstate()
+
+    with pytest.raises(ValueError):
+        generator.generateTiledMaze(tileSize=(8, 8), maxWorkers=1, algorithm='notAnAlgorithm', seed=9)
+
+    assert generator.seed == 2
+    assert generator.mazeAlgorithm == 'kruskal'
+    assert generator.random.getstate() == state
@@ -0,0 +1,28 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+import main
+from maze_generator import MazeGenerator
+from wall_mesher import makeMergedWalls
+
+def coveredPixels(walls, size):
+    surface = pygame.Surface(size)
+    surface.fill((0, 0, 0))
+    for wall in walls:
+        wall.draw(surface)
+    return pygame.surfarray.array2d(surface) != 0
+
+@pytest.mark.parametrize('cellSize', [20, 25, 13, 7])
+@pytest.mark.parametrize('startingPos', [(0, 0), (50.0, 150.0), (3.5, 1.25)])
+def test_merged_walls_cover_the_same_pixels_as_make_walls(cellSize, startingPos):
+    generator = MazeGenerator([14, 9], True, 'kruskal')
+    generator.generateMaze(seed=3)
+    size = (int(startingPos[0]) + 15 * cellSize, int(startingPos[1]) + 10 * cellSize)
+
+    cellWalls = main.makeWalls(startingPos, generator.maze, cellSize, (255, 255, 255))
+    mergedWalls = makeMergedWalls(startingPos, generator.grid.asArray(), cellSize, (255, 255, 255))
+
+    assert (coveredPixels(mergedWalls, size) == coveredPixels(cellWalls, size)).all()
+    assert len(mergedWalls) < len(cellWalls)
@@ -0,0 +1,150 @@
+from collections import OrderedDict
+import pygame
+
+class TextCache():
+    '''
+    TextCache
+
+    A least recently used cache of rendered text.
+    Text surfaces are looked up with a (font, text, color) key so text that does
+    not change is only rendered once. Text that changes every frame, like a timer,
+    can be drawn one cached character at a time instead.
+
+    FUNCTIONS
+        __init__(self, maxEntriesIn)
+            Creates an empty cache with a limit on its size
+
+        render(self, font, text, color)
+            Returns the rendered text, rendering it if it is not cached
+
+        drawGlyphs(self, surfaceIn, font, text, color, pos)
+            Draws text one cached character at a time
+
+        clear(self)
+            Removes every surface from the cache
+    '''
+    def __init__(self, maxEntriesIn=256):
+        '''
+        Initializes a TextCache Object
+
+        Object contains the rendered text in the order it was used,
+        the limit of the cache and counters for hits and misses.
+
+        Parameters
+        ----------
+        maxEntriesIn: int
+            The most text surfaces the cache will hold
+
+        Returns
+        -------
+        None
+        '''
+        self.maxEntries = maxEntriesIn
+
+        # {(font, text, color): pygame.Surface()}, the last entry is the most recently used
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def render(self, font, text, color):
+        '''
+        Gets the rendered text
+
+        The text is rendered and added to the cache if it is not already in it.
+        The least recently used text is removed when the cache is full.
+        The surface is shared with the cache so it should not be changed.
+
+        Parameters
+        ----------
+        font: pygame.Font()
+            The font used to render the text
+
+        text: string
+            What the text will say
+
+        color: pygame.Color() or (r, g, b)
+            The color of the text
+
+        Returns
+        -------
+        pygame.Surface()
+            The rendered text
+        '''
+        # pygame.Color cannot be used in a key so it is turned into a tuple
+        key = (font, text, tuple(color))
+        textSurface = self.entries.get(key)
+
+        if(textSurface is not None):
+            # move the text to the most recently used end
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return textSurface
+
+        self.misses += 1
+        textSurface = font.render(text, 1, color)
+        if(self.maxEntries <= 0): return textSurface
+
+        self.entries[key] = textSurface
+        # remove the least recently used text until the cache is small enough
+        while(len(self.entries) > self.maxEntries):
+            self.entries.popitem(last=False)
+
+        return textSurface
+
+    def drawGlyphs(self, surfaceIn, font, text, color, pos):
+        '''
+        Draws text one character at a time
+
+        Every character is a cached surface, so text that changes every frame
+        (like a timer) is never rendered again after each character has been seen once.
+
+        Parameters
+        ----------
+        surfaceIn: pygame.Surface()
+            The surface that the text will be drawn onto
+
+        font: pygame.Font()
+            The font used to render the text
+
+        text: string
+            What the text will say
+
+        color: pygame.Color() or (r, g, b)
+            The color of the text
+
+        pos: List<int>
+            The top left corner of the text on the surface
+            [x, y]
+
+        Returns
+        -------
+        pygame.Rect()
+            The area of the surface that was drawn on
+        '''
+        drawnRect = pygame.Rect(pos[0], pos[1], 0, 0)
+        x = pos[0]
+        for character in text:
+            # blit each character after the one before it
+            glyph = self.render(font, character, color)
+            drawnRect.union_ip(surfaceIn.blit(glyph, (x, pos[1])))
+            x += glyph.get_width()
+
+        return drawnRect
+
+    def clear(self):
+        '''
+        Removes every surface from the cache
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        '''
+        self.entries.clear()
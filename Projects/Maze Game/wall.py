@@ -81,66 +81,96 @@ class Wall():
             If the player is colliding with a wall, the position will be adjusted
                 otherwise it will remain the same.
         '''
-        snappedPlayerPos = playerPos.copy()
-        # The highest and lowest y values of the player's circle
-        playerTop    = playerPos[1] - playerSize
-        playerBottom = playerPos[1] + playerSize
-        
-        # The highest and lowest y values of the wall's rectangle
-        wallTop = self.rectangle[1]
-        wallBottom = self.rectangle[1] + self.rectangle[3]
-        
-        # The highest and lowest x values of the player's circle
-        playerLeft   = playerPos[0] - playerSize
-        playerRight  = playerPos[0] + playerSize
+        return rectCollision(self.rectangle, playerPos, playerSize)
+
+def rectCollision(rectangle, playerPos, playerSize):
+    '''
+    Determine if the player is colliding with a rectangle
+
+    Using the position and dimenstions of the rectangle and player
+    determine if they are colliding.
+
+    Parameters
+    ----------
+    rectangle: pygame.Rect() or [left, top, width, height]
+        The rectangle of a wall
+
+    playerPos: List<int>
+        The position of the player on the surface
         
-        # The highest and lowest x values of the wall's rectangle
-        wallLeft = self.rectangle[0]
-        wallRight = self.rectangle[0] + self.rectangle[2]
+    playerSize: int
+        The radius of the circle that represents the player
         
-        conditionsMet = 0
-        # if the player is to the left of the left side of the wall
-        if(playerPos[0] < wallLeft):
-            # if the player's right side is colliding with the wall
-            if playerRight > wallLeft:
-                conditionsMet += 1
-                # snap the player to the left edge of the wall
-                snappedPlayerPos[0] = wallLeft - playerSize - 1
+    Returns
+    -------
+    bool
+        True if the player is colliding with the rectangle otherwise False
         
-        # if the player is to the right of the right side of the wall
-        elif(playerPos[0] > wallRight):
-            # if the player's left side is colliding with the wall
-            if playerLeft < wallRight:
-                conditionsMet += 1
-                # snap the player to the right edge of the wall
-                snappedPlayerPos[0] = wallRight + playerSize + 1
-                
-        # if the player is between the left and right edges
-        else:
+    List<int>
+        The new position of the player.
+        If the player is colliding with the rectangle, the position will be adjusted
+            otherwise it will remain the same.
+    '''
+    snappedPlayerPos = playerPos.copy()
+    # The highest and lowest y values of the player's circle
+    playerTop    = playerPos[1] - playerSize
+    playerBottom = playerPos[1] + playerSize
+    
+    # The highest and lowest y values of the wall's rectangle
+    wallTop = rectangle[1]
+    wallBottom = rectangle[1] + rectangle[3]
+    
+    # The highest and lowest x values of the player's circle
+    playerLeft   = playerPos[0] - playerSize
+    playerRight  = playerPos[0] + playerSize
+    
+    # The highest and lowest x values of the wall's rectangle
+    wallLeft = rectangle[0]
+    wallRight = rectangle[0] + rectangle[2]
+    
+    conditionsMet = 0
+    # if the player is to the left of the left side of the wall
+    if(playerPos[0] < wallLeft):
+        # if the player's right side is colliding with the wall
+        if playerRight > wallLeft:
             conditionsMet += 1
-        
-        # if the player is above the top side of the wall
-        if(playerPos[1] < wallTop):
-            # if the player's bottom side is colliding with the wall
-            if playerBottom > wallTop:
-                conditionsMet += 1
-                # snap the player to the top edge of the wall
-                snappedPlayerPos[1] = wallTop - playerSize - 1
+            # snap the player to the left edge of the wall
+            snappedPlayerPos[0] = wallLeft - playerSize - 1
     
-        # if the player is below the bottom side of the wall
-        elif(playerPos[1] > wallBottom):
-            # if the player's top side is colliding with the wall
-            if playerTop < wallBottom:
-                conditionsMet += 1
-                # snap the player to the bottom edge of the wall
-                snappedPlayerPos[1] = wallBottom + playerSize + 1
-                
-        # if the player is between the top and bottom edges     
-        else:
+    # if the player is to the right of the right side of the wall
+    elif(playerPos[0] > wallRight):
+        # if the player's left side is colliding with the wall
+        if playerLeft < wallRight:
             conditionsMet += 1
-        
-        # if the player is colliding with the wall
-        if(conditionsMet == 2): 
-            return (True, snappedPlayerPos)
-        else:
-            return (False, playerPos)
\ No newline at end of file
+            # snap the player to the right edge of the wall
+            snappedPlayerPos[0] = wallRight + playerSize + 1
+            
+    # if the player is between the left and right edges
+    else:
+        conditionsMet += 1
+    
+    # if the player is above the top side of the wall
+    if(playerPos[1] < wallTop):
+        # if the player's bottom side is colliding with the wall
+        if playerBottom > wallTop:
+            conditionsMet += 1
+            # snap the player to the top edge of the wall
+            snappedPlayerPos[1] = wallTop - playerSize - 1
+
+    # if the player is below the bottom side of the wall
+    elif(playerPos[1] > wallBottom):
+        # if the player's top side is colliding with the wall
+        if playerTop < wallBottom:
+            conditionsMet += 1
+            # snap the player to the bottom edge of the wall
+            snappedPlayerPos[1] = wallBottom + playerSize + 1
+            
+    # if the player is between the top and bottom edges     
+    else:
+        conditionsMet += 1
+    
+    # if the player is colliding with the wall
+    if(conditionsMet == 2): 
+        return (True, snappedPlayerPos)
+    else:
+        return (False, playerPos)
\ No newline at end of file
@@ -0,0 +1,158 @@
+class WallIndex():
+    '''
+    WallIndex
+
+    A uniform grid of the maze's cells that lists the walls touching each cell.
+    Collision checks only test the walls in the cells the player overlaps
+    instead of every wall in the maze.
+
+    FUNCTIONS
+        __init__(self, wallsIn, startingPosIn, cellSizeIn, mazeSizeIn)
+            Sorts every wall into the cells it touches
+
+        __len__(self)
+            Returns the number of walls in the index
+
+        findCell(self, pos)
+            Returns the cell that contains a position
+
+        nearbyWalls(self, playerPos, playerSize)
+            Returns the walls in the cells the player overlaps
+
+        collide(self, playerPos, playerSize)
+            Checks the player against the nearby walls
+    '''
+    def __init__(self, wallsIn, startingPosIn, cellSizeIn, mazeSizeIn):
+        '''
+        Initializes a WallIndex Object
+
+        Object contains the walls of the maze and a list for every cell
+        of the indexes of the walls that touch it.
+
+        Parameters
+        ----------
+        wallsIn: List<Wall()>
+            The walls of the maze
+
+        startingPosIn: List<int>
+            The top left corner of the maze
+            [x, y]
+
+        cellSizeIn: int
+            the pixel size of a cell
+
+        mazeSizeIn: List<int>
+            The number of cells in the maze
+            [x, y]
+
+        Returns
+        -------
+        None
+        '''
+        self.walls = wallsIn
+        self.startingPos = startingPosIn
+        self.cellSize = cellSizeIn
+        self.mazeSize = (int(mazeSizeIn[0]), int(mazeSizeIn[1]))
+
+        # the indexes of the walls touching each cell, row by row
+        self.cells = [[] for i in range(self.mazeSize[0] * self.mazeSize[1])]
+
+        for i, wall in enumerate(self.walls):
+            rectangle = wall.rectangle
+            # the range of cells the wall's rectangle covers
+            left, top = self.findCell([rectangle[0], rectangle[1]])
+            right, bottom = self.findCell([rectangle[0] + rectangle[2] - 1, rectangle[1] + rectangle[3] - 1])
+
+            for y in range(top, bottom + 1):
+                for x in range(left, right + 1):
+                    self.cells[y * self.mazeSize[0] + x].append(i)
+
+    def __len__(self):
+        return len(self.walls)
+
+    def findCell(self, pos):
+        '''
+        Finds the cell that contains a position
+
+        Positions outside the maze give the closest cell on its edge.
+
+        Parameters
+        ----------
+        pos: List<int>
+            A position on the surface
+            [x, y]
+
+        Returns
+        -------
+        List<int>
+            The x and y position of the cell
+            [x, y]
+        '''
+        x = int((pos[0] - self.startingPos[0]) // self.cellSize)
+        y = int((pos[1] - self.startingPos[1]) // self.cellSize)
+        return [min(max(x, 0), self.mazeSize[0] - 1), min(max(y, 0), self.mazeSize[1] - 1)]
+
+    def nearbyWalls(self, playerPos, playerSize):
+        '''
+        Finds the walls near the player
+
+        Parameters
+        ----------
+        playerPos: List<int>
+            The position of the player on the surface
+
+        playerSize: int
+            The radius of the circle that represents the player
+
+        Returns
+        -------
+        List<Wall()>
+            The walls in every cell the player overlaps, in the same order as the wall list
+        '''
+        left, top = self.findCell([playerPos[0] - playerSize - 1, playerPos[1] - playerSize - 1])
+        right, bottom = self.findCell([playerPos[0] + playerSize + 1, playerPos[1] + playerSize + 1])
+
+        indexes = set()
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                indexes.update(self.cells[y * self.mazeSize[0] + x])
+
+        return [self.walls[i] for i in sorted(indexes)]
+
+    def collide(self, playerPos, playerSize):
+        '''
+        Determine if the player is colliding with any walls
+
+        Works like Ball.validateMove but only tests the walls near the player.
+
+        Parameters
+        ----------
+        playerPos: List<int>
+            The position of the player on the surface
+
+        playerSize: int
+            The radius of the circle that represents the player
+
+        Returns
+        -------
+        bool
+            True if the player is colliding with a wall otherwise False
+
+        List<int>
+            The new position of the player.
+            If the player is colliding with a wall, the position will be adjusted
+            otherwise it will remain the same.
+
+        Raises
+        -------
+        ValueError
+            If there are no walls in the index
+        '''
+        if(len(self.walls) == 0): raise ValueError('No walls are initialized')
+
+        # check the nearby walls in order and stop at the first collision
+        for wall in self.nearbyWalls(playerPos, playerSize):
+            result = wall.isColliding(playerPos, playerSize)
+            if(result[0]): return result
+
+        return (False, playerPos)
@@ -0,0 +1,176 @@
+import numpy
+import pygame
+from wall import Wall
+from maze_grid import TOPWALL, BOTTOMWALL, RIGHTWALL, LEFTWALL
+
+def findRuns(lineStates):
+    '''
+    Finds runs of equal values along each line
+
+    Parameters
+    ----------
+    lineStates: numpy.ndarray
+        An array with the shape (lines, length). 0 means there is nothing at that position.
+
+    Returns
+    -------
+    numpy.ndarray
+        The line of every run
+
+    numpy.ndarray
+        The first position of every run
+
+    numpy.ndarray
+        The position after the last position of every run
+
+    numpy.ndarray
+        The value of every run
+    '''
+    lineCount, length = lineStates.shape
+
+    # put a 0 before and after every line so runs end at the end of a line
+    padded = numpy.zeros((lineCount, length + 2), dtype=lineStates.dtype)
+    padded[:, 1:-1] = lineStates
+
+    # True where the value changes between position k - 1 and k
+    changes = padded[:, 1:] != padded[:, :-1]
+
+    # a run starts where a change leads into a value and ends where a change leaves one
+    startLines, starts = numpy.nonzero(changes & (padded[:, 1:] != 0))
+    endLines, ends = numpy.nonzero(changes & (padded[:, :-1] != 0))
+
+    return startLines, starts, ends, lineStates[startLines, starts]
+
+def stripSpans(line, startingPos, cellSize, state):
+    '''
+    Finds the pixels covered by the wall strips beside a line between two cells
+
+    The strips are rounded the same way pygame.Rect rounds the walls made by makeWalls in main,
+    so when a tenth of the cell size is not a whole number the strips still cover the same pixels.
+    Two strips that touch become one span.
+
+    Parameters
+    ----------
+    line: int
+        The number of the line, the cell after it starts line * cellSize from startingPos
+
+    startingPos: float
+        The start of the maze along the same axis
+
+    cellSize: int
+        the pixel size of a cell
+
+    state: int
+        1 for the strip after the line, 2 for the strip before it, 3 for both
+
+    Returns
+    -------
+    List<List<int>>
+        The first pixel and the pixel after the last pixel of every span
+        [[start, end], ...]
+    '''
+    thickness = int(cellSize * 0.1)
+
+    spans = []
+    # the strip before the line is the far wall of the cell before it
+    if(state & 2):
+        start = int((line - 1) * cellSize + startingPos + cellSize * 0.9)
+        spans.append([start, start + thickness])
+
+    # the strip after the line is the near wall of the cell after it
+    if(state & 1):
+        start = int(line * cellSize + startingPos)
+        if(len(spans) > 0 and spans[0][1] >= start): spans[0][1] = max(spans[0][1], start + thickness)
+        else: spans.append([start, start + thickness])
+
+    return spans
+
+def runSpan(start, end, startingPos, cellSize):
+    '''
+    Finds the pixels covered along a run of cells
+
+    Parameters
+    ----------
+    start: int
+        The first cell of the run
+
+    end: int
+        The cell after the last cell of the run
+
+    startingPos: float
+        The start of the maze along the same axis
+
+    cellSize: int
+        the pixel size of a cell
+
+    Returns
+    -------
+    List<int>
+        The first pixel and the pixel after the last pixel of the run
+        [start, end]
+    '''
+    return [int(start * cellSize + startingPos), int((end - 1) * cellSize + startingPos) + int(cellSize)]
+
+def makeMergedWalls(startingPos, walls, cellSize, wallColor):
+    '''
+    Creates the walls of the maze with as few Wall Objects as possible
+
+    The walls cover exactly the same pixels as makeWalls in main but the wall of a cell
+    and the matching wall of its neighbour become one rectangle, and walls in a line
+    along a row or column are merged into one long rectangle. When a tenth of the cell
+    size is not a whole number the two walls beside a line can be a pixel apart and stay
+    two rectangles.
+
+    Parameters
+    ----------
+    startingPos: List<int>
+        The top left corner of the maze
+
+    walls: numpy.ndarray
+        The uint8 wall masks of the maze with the shape (y, x)
+
+    cellSize: int
+        the pixel size of a cell
+
+    wallColor: pygame.Color() or (r, g, b)
+        the color of the walls
+
+    Returns
+    -------
+    List<Wall()>
+        The walls that make up the maze
+    '''
+    walls = numpy.asarray(walls, dtype=numpy.uint8)
+    height, width = walls.shape
+
+    mazeWalls = []
+
+    # VERTICAL WALLS
+    # one line for the left edge of every column and the right edge of the maze
+    # state 1: only the strip right of the line (the left wall of the cell after it)
+    # state 2: only the strip left of the line (the right wall of the cell before it)
+    # state 3: both strips
+    states = numpy.zeros((width + 1, height), dtype=numpy.uint8)
+    states[:-1] |= ((walls & LEFTWALL) != 0).T.astype(numpy.uint8)
+    states[1:] |= ((walls & RIGHTWALL) != 0).T.astype(numpy.uint8) << 1
+
+    for line, start, end, state in zip(*[values.tolist() for values in findRuns(states)]):
+        top, bottom = runSpan(start, end, startingPos[1], cellSize)
+        for left, right in stripSpans(line, startingPos[0], cellSize, state):
+            mazeWalls.append(Wall(pygame.Rect(left, top, right - left, bottom - top), wallColor))
+
+    # HORIZONTAL WALLS
+    # one line for the top edge of every row and the bottom edge of the maze
+    # state 1: only the strip below the line (the top wall of the cell after it)
+    # state 2: only the strip above the line (the bottom wall of the cell before it)
+    # state 3: both strips
+    states = numpy.zeros((height + 1, width), dtype=numpy.uint8)
+    states[:-1] |= ((walls & TOPWALL) != 0).astype(numpy.uint8)
+    states[1:] |= ((walls & BOTTOMWALL) != 0).astype(numpy.uint8) << 1
+
+    for line, start, end, state in zip(*[values.tolist() for values in findRuns(states)]):
+        left, right = runSpan(start, end, startingPos[0], cellSize)
+        for top, bottom in stripSpans(line, startingPos[1], cellSize, state):
+            mazeWalls.append(Wall(pygame.Rect(left, top, right - left, bottom - top), wallColor))
+
+    return mazeWalls